@@ -130,7 +130,7 @@ async def fill_schengen_form_with_ai(
         
         # Step 1: AI prepares and fills the form data
         logger.info("Step 1: AI analyzing and preparing form data...")
-        result = ai_form_service.fill_schengen_form(
+        result = await ai_form_service.fill_schengen_form_async(
             user_data=user_data,
             application_data=application_data
         )
@@ -149,7 +149,7 @@ async def fill_schengen_form_with_ai(
         document_path = None
         try:
             logger.info("Step 2: Generating Word document from AI-prepared data...")
-            document_path = ai_form_service.generate_word_document(
+            document_path = await ai_form_service.generate_word_document_async(
                 filled_fields=result["filled_fields"],
                 output_filename=request.document_filename
             )
@@ -332,7 +332,7 @@ async def generate_word_document(
     try:
         logger.info(f"Word document generation requested by user: {current_user.uid}")
         
-        document_path = ai_form_service.generate_word_document(
+        document_path = await ai_form_service.generate_word_document_async(
             filled_fields=request.filled_fields
         )
         
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from firebase_admin import auth
 from app.core.firebase import db
+from app.services.security import invalidate_user
 from app.models.schemas import UserLogin, UserResponse
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
@@ -71,6 +72,7 @@ async def register_user(user_data: UserRegister):
         
         # Save to Firestore
         db.collection('users').document(firebase_user.uid).set(user_doc_data)
+        invalidate_user(firebase_user.uid)
         
         return UserResponse(
             uid=firebase_user.uid,
@@ -141,6 +143,7 @@ async def login_user(login_data: UserLogin):
             'last_login_at': now,
             'updated_at': now
         })
+        invalidate_user(firebase_user.uid)
         
         # Step 5: Get updated user data
         updated_user_doc = db.collection('users').document(firebase_user.uid).get()
@@ -8,7 +8,7 @@ from app.core.firebase import db
 from app.models.schemas import (
     TeamCreate, TeamUpdate, TeamResponse, TeamJoinRequest, TeamInDB
 )
-from app.services.security import get_current_user, UserInDB
+from app.services.security import get_current_user, invalidate_user, UserInDB
 from datetime import datetime
 from typing import List, Optional
 import uuid
@@ -56,6 +56,7 @@ async def create_team(
                     "current_teams": current_teams,
                     "updated_at": now
                 })
+                invalidate_user(current_user.uid)
         
         return TeamResponse(**team_doc)
         
@@ -257,6 +258,7 @@ async def join_team(
                     "current_teams": current_teams,
                     "updated_at": datetime.utcnow()
                 })
+                invalidate_user(current_user.uid)
         
         # Get updated team data
         updated_team_doc = team_ref.get()
@@ -329,6 +331,7 @@ async def leave_team(
                     "current_teams": current_teams,
                     "updated_at": datetime.utcnow()
                 })
+                invalidate_user(current_user.uid)
         
         return {"message": "Successfully left the team"}
         
@@ -384,6 +387,7 @@ async def delete_team(
                         "current_teams": current_teams,
                         "updated_at": datetime.utcnow()
                     })
+                    invalidate_user(member_id)
         
         # Delete team document
         team_ref.delete()
@@ -10,7 +10,7 @@ from app.models.schemas import (
     UserDocumentUpload, UserDocumentUpdate, UserDocumentResponse, 
     DocumentType, DocumentStatus
 )
-from app.services.security import get_current_user, UserInDB
+from app.services.security import get_current_user, invalidate_user, UserInDB
 from app.services.groq_ocr_service import GroqOCRService
 from datetime import datetime
 from typing import List, Optional
@@ -179,6 +179,7 @@ async def _update_user_profile_from_ocr(user_id: str, document_type: str, extrac
         if user_updates:
             user_updates["updated_at"] = datetime.utcnow()
             user_ref.update(user_updates)
+            invalidate_user(user_id)
             logger.info(f"Updated user {user_id} profile with {len(user_updates)} fields from {document_type}")
         else:
             logger.info(f"No relevant user profile updates from {document_type}")
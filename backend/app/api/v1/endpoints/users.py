@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from app.core.firebase import db
 from app.models.schemas import UserUpdate, UserResponse, UserInDB
-from app.services.security import get_current_user
+from app.services.security import get_current_user, invalidate_user
 from datetime import datetime
 
 router = APIRouter()
@@ -85,6 +85,7 @@ async def update_user_profile(
         
         # Update in Firestore
         db.collection('users').document(current_user.uid).update(update_data)
+        invalidate_user(current_user.uid)
         
         # Fetch updated user data
         updated_doc = db.collection('users').document(current_user.uid).get()
@@ -125,6 +126,7 @@ async def delete_user_profile(current_user: UserInDB = Depends(get_current_user)
     try:
         # Delete from Firestore
         db.collection('users').document(current_user.uid).delete()
+        invalidate_user(current_user.uid)
         
         # Optionally delete from Firebase Auth (requires admin privilege)
         # from firebase_admin import auth
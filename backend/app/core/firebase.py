@@ -1,5 +1,5 @@
 import firebase_admin
-from firebase_admin import credentials, firestore, storage
+from firebase_admin import credentials, firestore, firestore_async, storage
 from app.core.config import settings
 import os
 
@@ -37,6 +37,11 @@ def get_firestore_client():
     return firestore.client()
 
 
+def get_firestore_async_client():
+    """Get async Firestore database client for use from coroutines"""
+    return firestore_async.client()
+
+
 def get_storage_client():
     """Get Firebase Storage client"""
     return storage.bucket()
@@ -45,4 +50,5 @@ def get_storage_client():
 # Initialize Firebase when this module is imported
 init_firebase()
 db = get_firestore_client()
+async_db = get_firestore_async_client()
 bucket = get_storage_client()
@@ -4,16 +4,723 @@ Handles different document types with specific validation rules
 """
 
 import re
+import os
 import json
-from typing import Dict, List, Any, Optional, Tuple
+import multiprocessing
+from typing import Callable, Dict, List, Any, Mapping, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
 import logging
 from .ocr_document_processor import OCRDocumentProcessor
 
+# google-re2 is optional; its linear-time engine is used for the plain extraction patterns when installed
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+# Number of distinct OCR texts whose extracted fields are kept per service instance
+_EXTRACTION_CACHE_SIZE = 256
+
+# Read-only stand-in for missing file metadata, shared instead of allocating a dict per document
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+# Branch sources of every fused alternation, kept for building RE2 prefilter sets
+_FUSED_BRANCHES: Dict["re.Pattern[str]", Tuple[str, ...]] = {}
+# Leading keywords of fused alternations whose branches are plain keyword lists
+_KEYWORD_GATES: Dict["re.Pattern[str]", Tuple[str, ...]] = {}
+# Case-sensitive twins of fused alternations, run over _fold_case text
+_FOLDED_ALTERNATIONS: Dict["re.Pattern[str]", "re.Pattern[str]"] = {}
+_REGEX_METACHARACTERS = frozenset('\\()[]{}|*+?.^$')
+
+
+def _leading_keywords(pattern: str) -> Optional[Tuple[str, ...]]:
+    """Return the folded keywords every match of a keyword-list pattern starts with, or None"""
+    if not (pattern.startswith('(') and pattern.endswith(')')):
+        return None
+    keywords = []
+    for alternative in pattern[1:-1].split('|'):
+        # Matches of "booking\s*confirmed" all start with "booking"
+        keyword = alternative.replace("\\'", "'").split(r'\s', 1)[0]
+        if not keyword or not _REGEX_METACHARACTERS.isdisjoint(keyword):
+            return None
+        keywords.append(keyword.translate(_CASE_FOLD_TABLE).lower())
+    return tuple(keywords)
+
+
+# Group openers whose syntax holds no letters that lowercasing could change
+_CASELESS_GROUP_OPENERS = ('(?:', '(?=', '(?!', '(?<=', '(?<!')
+
+
+def _fold_pattern(pattern: str) -> Optional[str]:
+    """Lowercase a pattern's literal letters for case-sensitive scans of _fold_case text, or None"""
+    # Escapes such as \d, \D or \s mean the same on folded text and are kept verbatim, but a
+    # class with letters ([A-Z]) or another group syntax would not survive lowercasing
+    parts = []
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':
+            parts.append(pattern[index:index + 2])
+            index += 2
+            continue
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif in_class and char.lower() != char.upper():
+            return None
+        elif char == '(' and pattern.startswith('(?', index) and not pattern.startswith(_CASELESS_GROUP_OPENERS, index):
+            return None
+        parts.append(char.translate(_CASE_FOLD_TABLE).lower())
+        index += 1
+    return ''.join(parts)
+
+
+def _fuse_patterns(*patterns: str) -> "re.Pattern[str]":
+    """Fuse single-group patterns, listed by priority, into one overlapping alternation"""
+    # The lookahead lets every position report its first matching pattern without
+    # consuming text, so group i matches exactly where the i-th pattern would
+    fused = re.compile("(?=" + "|".join(patterns) + ")", re.IGNORECASE)
+    _FUSED_BRANCHES[fused] = patterns
+    keywords = [_leading_keywords(pattern) for pattern in patterns]
+    if all(keywords):
+        unique_keywords = {keyword for branch_keywords in keywords for keyword in branch_keywords}
+        # A keyword starting with a shorter one never occurs before it, so str.find
+        # only needs the shortest of each prefix family
+        _KEYWORD_GATES[fused] = tuple(sorted(
+            keyword for keyword in unique_keywords
+            if not any(keyword != other and keyword.startswith(other) for other in unique_keywords)
+        ))
+    folded_patterns = [_fold_pattern(pattern) for pattern in patterns]
+    if all(folded is not None for folded in folded_patterns):
+        # Literal letters match case-insensitively exactly where their folded form
+        # matches the folded text, so the scan can skip re.IGNORECASE's per-character folding
+        _FOLDED_ALTERNATIONS[fused] = re.compile("(?=" + "|".join(folded_patterns) + ")")
+    return fused
+
+
+def _fused_scanner(fused: "re.Pattern[str]", text: str) -> Tuple["re.Pattern[str]", str]:
+    """Pick the pattern and text a fused alternation is scanned with"""
+    folded = _FOLDED_ALTERNATIONS.get(fused)
+    if folded is None:
+        return fused, text
+    # _fold_case preserves offsets, so spans found in the folded text index the original
+    return folded, _fold_case(text)
+
+
+def _scan_start(fused: "re.Pattern[str]", text: str, anchors: Tuple[str, ...] = ()) -> int:
+    """Cheaply find where a fused alternation can first match text, or -1 if it cannot"""
+    # Anchors are lowercase literals every branch requires; str.find rules out texts
+    # containing none of them far faster than the lookahead scan can
+    if anchors:
+        folded_text = _fold_case(text)
+        if not any(anchor in folded_text for anchor in anchors):
+            return -1
+    if fused in _PREFILTERED_ALTERNATIONS:
+        matchable = _matchable_alternations(text)
+        if matchable is not None and fused not in matchable:
+            return -1
+    keywords = _KEYWORD_GATES.get(fused)
+    if keywords is not None:
+        # _fold_case preserves offsets, and no branch match starts before a keyword.
+        # str.find's fast substring search beats a regex pass for these short lists
+        folded_text = _fold_case(text)
+        first = -1
+        for keyword in keywords:
+            # Once a keyword is found, only occurrences starting before it matter
+            end = len(folded_text) if first < 0 else first + len(keyword) - 1
+            position = folded_text.find(keyword, 0, end)
+            if position >= 0:
+                first = position
+        return first
+    return 0
+
+
+def _search_fused(fused: "re.Pattern[str]", text: str, anchors: Tuple[str, ...] = ()) -> Optional[str]:
+    """Return the leftmost capture of the highest-priority pattern matching anywhere in text"""
+    start = _scan_start(fused, text, anchors)
+    if start < 0:
+        return None
+    scanner, scanned_text = _fused_scanner(fused, text)
+    best = None
+    for match in scanner.finditer(scanned_text, start):
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+            if best.lastindex == 1:
+                break
+    return text[best.start(best.lastindex):best.end(best.lastindex)] if best else None
+
+
+def _search_fused_fields(fused: "re.Pattern[str]", text: str, fields: Tuple[str, ...], anchors: Tuple[str, ...] = ()) -> Dict[str, str]:
+    """Run _search_fused for several fields in one scan, given each branch's field name"""
+    # Only valid when branches of different fields can never match at the same position,
+    # since the lookahead reports just the first matching branch there
+    start = _scan_start(fused, text, anchors)
+    if start < 0:
+        return {}
+    scanner, scanned_text = _fused_scanner(fused, text)
+    best = {}
+    for match in scanner.finditer(scanned_text, start):
+        field = fields[match.lastindex - 1]
+        current = best.get(field)
+        if current is None or match.lastindex < current.lastindex:
+            best[field] = match
+    return {field: text[match.start(match.lastindex):match.end(match.lastindex)] for field, match in best.items()}
+
+
+def _fuse_fields(alternations: Mapping[str, "re.Pattern[str]"]) -> Tuple["re.Pattern[str]", Tuple[str, ...]]:
+    """Fuse whole alternations, keyed by field name, into one scan for _search_fused_fields"""
+    fields = tuple(field for field, fused in alternations.items() for _ in _FUSED_BRANCHES[fused])
+    branches = tuple(pattern for fused in alternations.values() for pattern in _FUSED_BRANCHES[fused])
+    return _fuse_patterns(*branches), fields
+
+
+@lru_cache(maxsize=32)
+def _scan_document_fields(fused: "re.Pattern[str]", fields: Tuple[str, ...], text: str) -> Mapping[str, str]:
+    """Scan text once for every keyword field of a document type, shared by its extractors"""
+    return MappingProxyType(_search_fused_fields(fused, text, fields))
+
+
+def _trie_alternation(words) -> str:
+    """Build an alternation of literal words that shares common prefixes, like a precomputed trie"""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return emit(trie)
+
+
+# Python's str \s and \d are Unicode-wide while RE2's are ASCII, so RE2 patterns spell
+# out the same sets. For prefilters over _fold_case text, RE2's ASCII-only \b is dropped,
+# which only widens the match, and Turkish I variants are folded as in the scanned text
+_RE2_CLASS_ESCAPES = {
+    r'\s': r'\t\n\v\f\r\x{1c}-\x{1f}\x{85}\p{Z}',
+    r'\d': r'\p{Nd}',
+}
+# re.IGNORECASE matches any of these for any other, RE2 only pairs i and I
+_TURKISH_I_VARIANTS = 'iIıİ'
+
+
+def _to_re2_syntax(pattern: str, folded: bool = True) -> str:
+    """Translate a re pattern to RE2 syntax with the same classes, for _fold_case text when folded"""
+    parts = []
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':
+            escape = pattern[index:index + 2]
+            members = _RE2_CLASS_ESCAPES.get(escape)
+            if members is not None:
+                parts.append(members if in_class else '[' + members + ']')
+            elif escape != r'\b' or in_class or not folded:
+                parts.append(escape)
+            index += 2
+            continue
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '+' and not in_class and parts and parts[-1] in ('+', '*', '?', '}'):
+            # Possessive quantifiers only cut re's backtracking; RE2 never backtracks
+            index += 1
+            continue
+        elif char in _TURKISH_I_VARIANTS and not folded:
+            parts.append(_TURKISH_I_VARIANTS if in_class else '[' + _TURKISH_I_VARIANTS + ']')
+            index += 1
+            continue
+        parts.append(char)
+        index += 1
+    re2_pattern = ''.join(parts)
+    return re2_pattern.translate(_CASE_FOLD_TABLE) if folded else re2_pattern
+
+
+def _compile_linear(pattern: str):
+    """Compile a case-insensitive pattern with RE2 when available, falling back to re"""
+    if re2 is not None:
+        try:
+            options = re2.Options()
+            options.case_sensitive = False
+            # Patterns RE2 rejects fall back to re below, so the rejection is not logged
+            options.log_errors = False
+            return re2.compile(_to_re2_syntax(pattern, folded=False), options)
+        except re2.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Offset-preserving lowercase that folds the Turkish I variants and the long s together
+# like re.IGNORECASE
+_CASE_FOLD_TABLE = str.maketrans({'I': 'i', 'İ': 'i', 'ı': 'i', 'ſ': 's'})
+
+
+@lru_cache(maxsize=32)
+def _fold_case(text: str) -> str:
+    """Lowercase text once for scans with patterns compiled without re.IGNORECASE"""
+    return text.translate(_CASE_FOLD_TABLE).lower()
+
+
+# Bank statement extraction patterns, compiled once at import
+_ACCOUNT_RE = _fuse_patterns(
+    r'hesap\s*no[:\s]*(\d+)',
+    r'account\s*no[:\s]*(\d+)',
+    r'hesap\s*numarası[:\s]*(\d+)',
+    r'(?<!\d)(\d{10,})',  # Generic 10+ digit number, tried once per digit run
+)
+_BANK_NAME_RE = _fuse_patterns(
+    r'(ziraat|garanti|iş\s*bankası|akbank|yapı\s*kredi|halkbank|vakıfbank)',
+    r'(türkiye\s*iş\s*bankası|türkiye\s*garanti\s*bankası)',
+)
+_BALANCE_PATTERNS = tuple(_compile_linear(pattern) for pattern in (
+    r'bakiye[:\s]*([\d.,]+)\s*(tl|try|₺|bb|ab)',
+    r'balance[:\s]*([\d.,]+)\s*(tl|try|₺|bb|ab)',
+    r'mevcut\s*bakiye[:\s]*([\d.,]+)\s*(tl|try|₺|bb|ab)',
+    r'son\s*bakiye[:\s]*([\d.,]+)\s*(tl|try|₺|bb|ab)',
+    r'([\d.,]+)\s*(tl|try|₺|bb|ab)',  # Generic amount with currency
+    r'(\d{1,3}(?:\.\d{3})*,\d{2})\s*(bb|ab)',  # Turkish format: 53.989,75 BB
+))
+# Amount normalisation: Turkish "53.989,75" and English "53,989.75" to "53989.75"
+_TURKISH_AMOUNT_TRANS = str.maketrans({'.': '', ',': '.'})
+_ENGLISH_AMOUNT_TRANS = str.maketrans({',': ''})
+
+
+@lru_cache(maxsize=1024)
+def _parse_amount(amount_str: str) -> float:
+    """Parse a Turkish or English formatted amount; overlapping balance patterns repeat the same strings"""
+    # Handle Turkish number format (e.g., "53.989,75")
+    if '.' in amount_str and ',' in amount_str:
+        # Turkish format: thousands separator is dot, decimal is comma
+        return float(amount_str.translate(_TURKISH_AMOUNT_TRANS))
+    # English format: thousands separator is comma, decimal is dot
+    return float(amount_str.translate(_ENGLISH_AMOUNT_TRANS))
+
+
+_STATEMENT_DATE_PATTERNS = tuple(_compile_linear(pattern) for pattern in (
+    r'(\d{1,2})[./](\d{1,2})[./](\d{4})',  # DD/MM/YYYY or DD.MM.YYYY
+    r'(\d{4})[./](\d{1,2})[./](\d{1,2})',  # YYYY/MM/DD or YYYY.MM.DD
+    r'(\d{1,2})\s+(ocak|şubat|mart|nisan|mayıs|haziran|temmuz|ağustos|eylül|ekim|kasım|aralık)\s+(\d{4})',
+))
+_TURKISH_MONTHS = {
+    'ocak': 1, 'şubat': 2, 'mart': 3, 'nisan': 4,
+    'mayıs': 5, 'haziran': 6, 'temmuz': 7, 'ağustos': 8,
+    'eylül': 9, 'ekim': 10, 'kasım': 11, 'aralık': 12
+}
+_BANK_STAMP_RE = _fuse_patterns(
+    r'(mühür|mühürlü|kaşeli)',
+    r'(stamp|sealed)',
+    r'(resmi\s*mühür|official\s*stamp)',
+    r'(bank\s*stamp|banka\s*mühürü)',
+)
+
+# Passport and birth certificate extraction patterns, compiled once at import
+_PASSPORT_NUMBER_RE = _fuse_patterns(
+    r'pasaport\s*no[:\s]*([A-Z0-9]+)',
+    r'passport\s*no[:\s]*([A-Z0-9]+)',
+    r'pasaport\s*numarası[:\s]*([A-Z0-9]+)',
+    r'\b([A-Z]\d{7,11})\b',  # Generic passport number pattern, bounded to valid lengths
+)
+# Country code and passport type labels never start at the same position, so one
+# lookahead scan serves both fields
+_PASSPORT_LABEL_RE = _fuse_patterns(
+    r'ülke\s*kodu[:\s]*([A-Z]{3})',
+    r'country\s*code[:\s]*([A-Z]{3})',
+    r'türü[:\s]*([A-Z])',
+    r'type[:\s]*([A-Z])',
+)
+_PASSPORT_LABEL_FIELDS = ("country_code", "country_code", "passport_type", "passport_type")
+_PASSPORT_LABEL_ANCHORS = ('kodu', 'code', 'türü', 'type')
+# ISO 3166-1 alpha-3 codes accepted by the unlabeled country code fallback
+_ISO_ALPHA3_CODES = frozenset({
+    'ABW', 'AFG', 'AGO', 'AIA', 'ALA', 'ALB', 'AND', 'ARE', 'ARG', 'ARM', 'ASM', 'ATA',
+    'ATF', 'ATG', 'AUS', 'AUT', 'AZE', 'BDI', 'BEL', 'BEN', 'BES', 'BFA', 'BGD', 'BGR',
+    'BHR', 'BHS', 'BIH', 'BLM', 'BLR', 'BLZ', 'BMU', 'BOL', 'BRA', 'BRB', 'BRN', 'BTN',
+    'BVT', 'BWA', 'CAF', 'CAN', 'CCK', 'CHE', 'CHL', 'CHN', 'CIV', 'CMR', 'COD', 'COG',
+    'COK', 'COL', 'COM', 'CPV', 'CRI', 'CUB', 'CUW', 'CXR', 'CYM', 'CYP', 'CZE', 'DEU',
+    'DJI', 'DMA', 'DNK', 'DOM', 'DZA', 'ECU', 'EGY', 'ERI', 'ESH', 'ESP', 'EST', 'ETH',
+    'FIN', 'FJI', 'FLK', 'FRA', 'FRO', 'FSM', 'GAB', 'GBR', 'GEO', 'GGY', 'GHA', 'GIB',
+    'GIN', 'GLP', 'GMB', 'GNB', 'GNQ', 'GRC', 'GRD', 'GRL', 'GTM', 'GUF', 'GUM', 'GUY',
+    'HKG', 'HMD', 'HND', 'HRV', 'HTI', 'HUN', 'IDN', 'IMN', 'IND', 'IOT', 'IRL', 'IRN',
+    'IRQ', 'ISL', 'ISR', 'ITA', 'JAM', 'JEY', 'JOR', 'JPN', 'KAZ', 'KEN', 'KGZ', 'KHM',
+    'KIR', 'KNA', 'KOR', 'KWT', 'LAO', 'LBN', 'LBR', 'LBY', 'LCA', 'LIE', 'LKA', 'LSO',
+    'LTU', 'LUX', 'LVA', 'MAC', 'MAF', 'MAR', 'MCO', 'MDA', 'MDG', 'MDV', 'MEX', 'MHL',
+    'MKD', 'MLI', 'MLT', 'MMR', 'MNE', 'MNG', 'MNP', 'MOZ', 'MRT', 'MSR', 'MTQ', 'MUS',
+    'MWI', 'MYS', 'MYT', 'NAM', 'NCL', 'NER', 'NFK', 'NGA', 'NIC', 'NIU', 'NLD', 'NOR',
+    'NPL', 'NRU', 'NZL', 'OMN', 'PAK', 'PAN', 'PCN', 'PER', 'PHL', 'PLW', 'PNG', 'POL',
+    'PRI', 'PRK', 'PRT', 'PRY', 'PSE', 'PYF', 'QAT', 'REU', 'ROU', 'RUS', 'RWA', 'SAU',
+    'SDN', 'SEN', 'SGP', 'SGS', 'SHN', 'SJM', 'SLB', 'SLE', 'SLV', 'SMR', 'SOM', 'SPM',
+    'SRB', 'SSD', 'STP', 'SUR', 'SVK', 'SVN', 'SWE', 'SWZ', 'SXM', 'SYC', 'SYR', 'TCA',
+    'TCD', 'TGO', 'THA', 'TJK', 'TKL', 'TKM', 'TLS', 'TON', 'TTO', 'TUN', 'TUR', 'TUV',
+    'TWN', 'TZA', 'UGA', 'UKR', 'UMI', 'URY', 'USA', 'UZB', 'VAT', 'VCT', 'VEN', 'VGB',
+    'VIR', 'VNM', 'VUT', 'WLF', 'WSM', 'YEM', 'ZAF', 'ZMB', 'ZWE',
+})
+_COUNTRY_TOKEN_RE = re.compile(r'\b[A-Z]{3}\b')
+# Passport dates and pages are scanned over _fold_case text, so these patterns are lowercase
+_PASSPORT_DATE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(\d{1,2})[./](\d{1,2})[./](\d{4})',  # DD/MM/YYYY
+    r'(\d{4})[./](\d{1,2})[./](\d{1,2})',  # YYYY/MM/DD
+    r'(\d{1,2})\s+(ocak|şubat|mart|nisan|mayis|haziran|temmuz|ağustos|eylül|ekim|kasim|aralik)\s+(\d{4})',
+    r'(\d{1,2})\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d{4})',
+    r'(\d{1,2})\s+(oca|şub|mar|nis|may|haz|tem|ağu|eyl|eki|kas|ara)\s+(\d{4})',  # Turkish abbreviated months
+    r'(\d{1,2})\s+(haz|jun)\s+(\d{4})',  # Special case for HAZ/JUN
+    r'(\d{1,2})\s+(oca|jan)\s+(\d{4})',  # Special case for OCA/JAN
+    r'(\d{1,2})\s+(haz|jun)\s+/\s+(jun)\s+(\d{4})',  # HAZ / JUN format
+    r'(\d{1,2})\s+(oca|jan)\s+/\s+(jan)\s+(\d{4})',  # OCA / JAN format
+))
+_PASSPORT_MONTH_NAMES: Mapping[str, int] = MappingProxyType({
+    'ocak': 1, 'şubat': 2, 'mart': 3, 'nisan': 4,
+    'mayis': 5, 'haziran': 6, 'temmuz': 7, 'ağustos': 8,
+    'eylül': 9, 'ekim': 10, 'kasim': 11, 'aralik': 12,
+    'oca': 1, 'şub': 2, 'mar': 3, 'nis': 4,
+    'may': 5, 'haz': 6, 'tem': 7, 'ağu': 8,
+    'eyl': 9, 'eki': 10, 'kas': 11, 'ara': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
+    'may': 5, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+})
+# Every month-name date pattern starts with a day and a month word, so one trie scan
+# over the month table tells whether those patterns can match at all
+_PASSPORT_NUMERIC_DATE_PATTERNS = _PASSPORT_DATE_PATTERNS[:2]
+_PASSPORT_MONTH_DATE_GATE_RE = re.compile(r'\d\s+' + _trie_alternation(_PASSPORT_MONTH_NAMES))
+_DIGIT_RE = re.compile(r'\d')
+_PASSPORT_PAGE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'sayfa[:\s]*(\d+)',
+    r'page[:\s]*(\d+)',
+    r'(\d+)\s*sayfa',
+    r'(\d+)\s*page',
+))
+# Each birth date pattern is wrapped in a group so the fused match reports its full text
+_BIRTH_DATE_RE = _fuse_patterns(*(f"({pattern})" for pattern in (
+    r'doğum\s*tarihi[:\s]*(\d{1,2})[./](\d{1,2})[./](\d{4})',
+    r'doğum\s*tarihi[:\s]*(\d{1,2})\s+(ocak|şubat|mart|nisan|mayıs|haziran|temmuz|ağustos|eylül|ekim|kasım|aralık)\s+(\d{4})',
+    r'birth\s*date[:\s]*(\d{1,2})[./](\d{1,2})[./](\d{4})',
+    r'yıl[:\s]*(\d{4})',
+    r'ay[:\s]*(ocak|şubat|mart|nisan|mayıs|haziran|temmuz|ağustos|eylül|ekim|kasım|aralık)',
+    r'gün[:\s]*(\d{1,2})',
+)))
+# Letter class shared by the Turkish name and place captures
+_TURKISH_LETTER = r'[A-ZÇĞİÖŞÜ]'
+# Place names are at most six words on one line; keeping whitespace out of the
+# word class stops the repetition from backtracking across separators
+_BIRTH_PLACE_RE = _fuse_patterns(
+    rf'doğum\s*yeri[:\s]*({_TURKISH_LETTER}+(?:[ \t]+{_TURKISH_LETTER}+){{0,5}})',
+    r'place\s*of\s*birth[:\s]*([A-Z]+(?:[ \t]+[A-Z]+){0,5})',
+)
+_BIRTH_PLACE_ANCHORS = ('yeri', 'place')
+_BIRTH_CERTIFICATE_STAMP_RE = _fuse_patterns(
+    r'(mühür|mühürlü|kaşeli)',
+    r'(stamp|sealed|official\s*stamp)',
+    r'(yeminli\s*tercüme|certified\s*translation)',
+    r'(resmi\s*mühür|official\s*seal)',
+)
+_FATHER_RE = _fuse_patterns(
+    rf'baba[:\s]*soyadı[:\s]*({_TURKISH_LETTER}+)',
+    r'father[:\s]*surname[:\s]*([A-Z]+)',
+    rf'baba[:\s]*({_TURKISH_LETTER}+)',
+)
+_FATHER_ANCHORS = ('baba', 'father')
+_MOTHER_RE = _fuse_patterns(
+    rf'anne[:\s]*soyadı[:\s]*({_TURKISH_LETTER}+)',
+    r'mother[:\s]*surname[:\s]*([A-Z]+)',
+    rf'anne[:\s]*({_TURKISH_LETTER}+)',
+)
+_MOTHER_ANCHORS = ('anne', 'mother')
+
+
+# Hotel, invitation, visa, property, SGK and student certificate extraction patterns, compiled once at import
+_CONFIRMATION_RE = _fuse_patterns(
+    r'(onay|confirmation|confirmed|rezervasyon\s*onayı)',
+    r'(booking\s*confirmed|reservation\s*confirmed)',
+    r'(rezervasyon\s*numarası|booking\s*number)',
+    r'(confirmation\s*number)',
+)
+_RESERVATION_DATE_PATTERNS = tuple(_compile_linear(pattern) for pattern in (
+    r'(\d{1,2})[./](\d{1,2})[./](\d{4})',  # DD/MM/YYYY
+    r'(\d{4})[./](\d{1,2})[./](\d{1,2})',  # YYYY/MM/DD
+    r'(check-in|check-out|giriş|çıkış)',
+    r'(arrival|departure|varış|ayrılış)',
+))
+_HOTEL_RE = _fuse_patterns(
+    r'(otel|hotel|konaklama|accommodation)',
+    r'(resort|motel|hostel|pansiyon)',
+)
+_PAYMENT_RE = _fuse_patterns(
+    r'(ödeme|payment|paid|ücret|fee)',
+    r'(credit\s*card|debit\s*card|kredi\s*kartı)',
+    r'(total|toplam|amount|miktar)',
+)
+_HOST_CONTACT_RE = _fuse_patterns(
+    r'(phone|telefon|tel|mobile|cep)',
+    r'(email|e-mail|mail)',
+    r'(address|adres|adress)',
+    r'(contact|iletişim)',
+)
+_HOST_RE = _fuse_patterns(
+    r'(host|ev sahibi|davet eden)',
+    r'(student|öğrenci|student at)',
+    r'(university|üniversite|college|kolej)',
+    r'(inviting|davet ediyorum)',
+)
+_INVITATION_DATE_PATTERNS = tuple(_compile_linear(pattern) for pattern in (
+    r'(\d{1,2})[./](\d{1,2})[./](\d{4})',  # DD/MM/YYYY
+    r'(\d{4})[./](\d{1,2})[./](\d{1,2})',  # YYYY/MM/DD
+    r'(from|from|başlangıç|start)',
+    r'(to|until|bitiş|end)',
+))
+_SIGNATURE_RE = _fuse_patterns(
+    r'(signature|imza|signed|imzalı)',
+    r'(sincerely|saygılarımla|respectfully)',
+    r'(yours truly|samimi saygılarımla)',
+)
+_VISA_RE = _fuse_patterns(
+    r'(visa|vize|vizum)',
+    r'(schengen|schengen states)',
+    r'(valid|geçerli|validity)',
+    r'(expired|süresi dolmuş)',
+)
+# Codes of the countries whose visas are looked for in previous visas text
+_EU_CODES = frozenset((
+    'SVN', 'DEU', 'FRA', 'ITA', 'ESP', 'NLD', 'BEL', 'AUT', 'PRT', 'GRC', 'FIN', 'SWE',
+    'DNK', 'POL', 'CZE', 'HUN', 'SVK', 'LTU', 'LVA', 'EST', 'MLT', 'CYP', 'LUX', 'IRL',
+))
+# Standalone 3-letter tokens are checked against _EU_CODES; a token never overlaps
+# a country name, so one scan finds both
+_VISA_COUNTRY_RE = re.compile(
+    r'\b([A-Z]{3})\b'  # 3-letter country codes
+    r'|(slovenia|germany|france|italy|spain|netherlands|belgium|austria|portugal|greece|finland|sweden|denmark|poland|czech|hungary|slovakia|lithuania|latvia|estonia|malta|cyprus|luxembourg|ireland)',
+    re.IGNORECASE,
+)
+_VISA_DATE_PATTERNS = tuple(_compile_linear(pattern) for pattern in (
+    r'(\d{1,2})[./-](\d{1,2})[./-](\d{2,4})',  # DD/MM/YYYY
+    r'(\d{4})[./-](\d{1,2})[./-](\d{1,2})',  # YYYY/MM/DD
+    r'(from|until|valid from|valid until)',
+))
+_PROPERTY_DEED_STAMP_RE = _fuse_patterns(
+    r'(mühür|kaşe|stamp|seal)',
+    r'(siciline uygundur|conforms to the record)',
+    r'(verily|verified)',
+    r'(tapu|property deed)',
+)
+_PROPERTY_OWNER_RE = _fuse_patterns(
+    r'(malik|owner|sahip)',
+    r'(adı soyadı|name|surname)',
+    r'(baba adı|father\'s name)',
+    r'(hissesi|share)',
+)
+# Unit groups are non-capturing so each fused branch keeps a single capture. The digit
+# runs are possessive: the text after them can never be a digit or dot, so they match
+# the same amounts without re retrying every split of a long OCR digit run
+_PROPERTY_VALUE_RE = _fuse_patterns(
+    r'(işlem bedeli|transaction price|purchase price)',
+    r'(bedel|price|value)',
+    r'(\d++\.?+\d*+\s*(?:tl|try|₺|euro|eur|usd|\$))',
+    r'(\d++\.?+\d*+\s*(?:bin|million|milyon))',
+)
+_ACTIVE_STATUS_RE = _fuse_patterns(
+    r'(çalışmaktadır|is working|active|aktif)',
+    r'(faaliyet gösteren|operating)',
+    r'(tescili bulunduğu|registration exists)',
+    r'(işyerinde|at workplace)',
+)
+_REGISTRATION_DATE_PATTERNS = tuple(_compile_linear(pattern) for pattern in (
+    r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # DD/MM/YYYY
+    r'(\d{1,2}/\d{1,2}/\d{4})',  # Date format
+    r'(tarihinden itibaren|as of|from)',
+))
+# A labelled number is read right after its label, so the bare digit scan only runs on
+# unlabelled documents; every 601 SGK number is also a 10-12 digit run
+_SGK_NUMBER_RE = _fuse_patterns(
+    r'(?:sigorta sicil numarası|social security number|sgk number)\D{0,32}(\d{10,12})',
+    r'(sigorta sicil numarası|social security number|sgk number)',
+    r'(\d{10,12})',  # 10-12 digit numbers
+)
+_STUDENT_CERTIFICATE_DATE_PATTERNS = tuple(_compile_linear(pattern) for pattern in (
+    r'(\d{1,2})\.(\d{1,2})\.(\d{4})',  # DD.MM.YYYY
+    r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # DD/MM/YYYY
+))
+_SCHOOL_NAME_RE = _fuse_patterns(
+    r'(üniversite|university|universitesi)',
+    r'(yükseköğretim|higher education)',
+    r'(fakülte|faculty)',
+    r'(bölüm|department)',
+    r'(yök|yükseköğretim kurulu)',
+)
+_SCHOOL_STAMP_RE = _fuse_patterns(
+    r'(mühür|kaşe|stamp|seal)',
+    r'(yök|yükseköğretim kurulu)',
+    r'(üniversite|university|universitesi)',
+    r'(logo|emblem)',
+    r'(baskalik|presidency)',
+    r'(ankara)',
+)
+_STUDENT_CERTIFICATE_SIGNATURE_RE = _fuse_patterns(
+    r'(imza|signature)',
+    r'(signed|imzalı)',
+    r'(başkan|president|baskalik)',
+    r'(müdür|director)',
+    r'(ilgili makama|to whom it may concern)',
+    r'(bildirilmiştir|certified)',
+)
+
+
+# Tax return and travel insurance extraction patterns, compiled once at import
+# Only the number patterns yield amounts; the gelir/income and toplam/total keyword
+# patterns never matched digits, so they are no longer scanned. Possessive digit runs keep
+# long OCR digit strings without a comma from backtracking polynomially
+_INCOME_AMOUNT_PATTERNS = tuple(_compile_linear(pattern) for pattern in (
+    r'(\d++\.?+\d*+\.?+\d*+,\d{2})',  # Turkish number format
+    r'(\d++,\d{3}\.\d{2})',  # Alternative format
+))
+_TAX_OFFICE_STAMP_RE = _fuse_patterns(
+    r'(vergi dairesi|tax office)',
+    r'(müdürlük|directorate)',
+    r'(onay|approval|approved)',
+    r'(mühür|kaşe|stamp|seal)',
+    r'(gelir idaresi|revenue administration)',
+)
+# Year and amount patterns capture only their number, so findall returns flat strings
+_TAX_YEAR_PATTERNS = tuple(_compile_linear(pattern) for pattern in (
+    r'(?:yıl|year)\s*:?\s*(\d{4})',
+    r'(?:dönem|period)\s*:?\s*(\d{4})',
+    r'(\d{4})\s*(?:yıl|year)',
+))
+# The sum insured/coverage/teminat keyword pattern never matched digits and is no longer scanned
+_COVERAGE_AMOUNT_PATTERNS = tuple(_compile_linear(pattern) for pattern in (
+    r'\$\s*(\d{1,3}(?:,\d{3})*)',  # Dollar amounts
+    r'(\d{1,3}(?:,\d{3})*)\s*(?:usd|eur|tl|try)',  # Amount with currency
+    r'(?:up to|maximum|max)\s*\$?\s*(\d{1,3}(?:,\d{3})*)',  # Up to amounts
+))
+_COVERAGE_AREA_RE = _fuse_patterns(
+    r'(destination|hedef|varış)',
+    r'(country|ülke|country of residence)',
+    r'(schengen|europe|european union)',
+    r'(jordan|turkey|germany|france|italy|spain|egypt|poland|netherlands|belgium|austria|switzerland|greece|croatia|czech|portugal|finland|sweden|denmark|norway)',
+    r'(worldwide|world-wide|tüm dünya)',
+)
+_VALIDITY_DATE_PATTERNS = tuple(_compile_linear(pattern) for pattern in (
+    r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # DD/MM/YYYY
+    r'(from|to|başlangıç|bitiş)',
+))
+
+# Keyword fields of one document type never start at the same position, so each
+# document type's extractors share a single scan
+_HOTEL_RESERVATION_RE, _HOTEL_RESERVATION_FIELDS = _fuse_fields({
+    "confirmation_text": _CONFIRMATION_RE,
+    "hotel_text": _HOTEL_RE,
+    "payment_text": _PAYMENT_RE,
+})
+_INVITATION_LETTER_RE, _INVITATION_LETTER_FIELDS = _fuse_fields({
+    "contact_text": _HOST_CONTACT_RE,
+    "host_text": _HOST_RE,
+    "signature_text": _SIGNATURE_RE,
+})
+_PROPERTY_DEED_RE, _PROPERTY_DEED_FIELDS = _fuse_fields({
+    "stamp_text": _PROPERTY_DEED_STAMP_RE,
+    "owner_text": _PROPERTY_OWNER_RE,
+    "value_text": _PROPERTY_VALUE_RE,
+})
+_SOCIAL_SECURITY_RE, _SOCIAL_SECURITY_FIELDS = _fuse_fields({
+    "status_text": _ACTIVE_STATUS_RE,
+    "number_text": _SGK_NUMBER_RE,
+})
+
+
+def _compile_pattern_set(alternations: Tuple["re.Pattern[str]", ...]):
+    """Compile the branches of fused alternations into one RE2 set scanned in a single pass"""
+    if re2 is None:
+        return None
+    options = re2.Options()
+    options.case_sensitive = False
+    # Alternations RE2 rejects are skipped below, so the rejection is not logged
+    options.log_errors = False
+    pattern_set = re2.Set.SearchSet(options)
+    owners = []
+    for fused in alternations:
+        branches = tuple(_to_re2_syntax(pattern) for pattern in _FUSED_BRANCHES[fused])
+        try:
+            # Alternations RE2 cannot express, such as lookbehinds, stay unfiltered
+            for branch in branches:
+                re2.compile(branch, options)
+        except re2.error:
+            continue
+        for branch in branches:
+            pattern_set.Add(branch)
+            owners.append(fused)
+    if not owners:
+        return None
+    pattern_set.Compile()
+    return pattern_set, tuple(owners)
+
+
+# Every searched alternation shares one RE2 set, compiled once at import into a single
+# automaton: one scan per text reports which alternations can match at all, and the
+# rest are skipped without running their lookahead scans
+_ALTERNATION_SET = _compile_pattern_set((
+    _ACCOUNT_RE, _BANK_NAME_RE, _BANK_STAMP_RE,
+    _PASSPORT_NUMBER_RE, _PASSPORT_LABEL_RE,
+    _BIRTH_DATE_RE, _BIRTH_PLACE_RE, _BIRTH_CERTIFICATE_STAMP_RE, _FATHER_RE, _MOTHER_RE,
+    _HOTEL_RESERVATION_RE, _INVITATION_LETTER_RE, _VISA_RE,
+    _PROPERTY_DEED_RE, _SOCIAL_SECURITY_RE,
+    _SCHOOL_NAME_RE, _SCHOOL_STAMP_RE, _STUDENT_CERTIFICATE_SIGNATURE_RE,
+    _TAX_OFFICE_STAMP_RE, _COVERAGE_AREA_RE,
+))
+_PREFILTERED_ALTERNATIONS = frozenset(_ALTERNATION_SET[1]) if _ALTERNATION_SET else frozenset()
+
+
+@lru_cache(maxsize=32)
+def _matchable_alternations(text: str) -> Optional[frozenset]:
+    """Return the prefiltered alternations that can match text, or None without RE2"""
+    if _ALTERNATION_SET is None:
+        return None
+    pattern_set, owners = _ALTERNATION_SET
+    return frozenset(owners[index] for index in pattern_set.Match(_fold_case(text)) or ())
+
+
+def _collect_day_first_dates(patterns, text: str, century: str = "") -> List[datetime]:
+    """Collect the valid dates of every day, month, year match, in pattern order"""
+    dates = []
+    for pattern in patterns:
+        # Keyword branches of the date pattern lists never yield a date
+        if pattern.groups != 3:
+            continue
+        for match in pattern.finditer(text):
+            day, month, year = match.groups()
+            if len(year) == 2:
+                year = century + year
+            # strptime("%Y") only accepted four-digit years
+            if len(year) != 4:
+                continue
+            day, month = int(day), int(month)
+            # Reject impossible fields up front; only short months still raise
+            if not (1 <= month <= 12 and 1 <= day <= 31):
+                continue
+            try:
+                dates.append(datetime(int(year), month, day))
+            except ValueError:
+                continue
+    return dates
+
 
 class DocumentType(str, Enum):
     BANK_STATEMENT = "bank_statement"
@@ -34,14 +741,15 @@ class DocumentType(str, Enum):
     EMPLOYMENT_CERTIFICATE = "employment_certificate"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OCRValidationRule:
     """Base class for OCR validation rules"""
     enabled: bool
     description: str
+    stop_on_critical_failure: bool = False  # Skip remaining checks once a critical one fails
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BankStatementValidationRules(OCRValidationRule):
     """Bank statement specific validation rules"""
     check_account_balance: bool = True
@@ -51,7 +759,7 @@ class BankStatementValidationRules(OCRValidationRule):
     min_balance_threshold: float = 1000.0  # Minimum balance in currency
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PassportValidationRules(OCRValidationRule):
     """Passport specific validation rules"""
     check_expiry_date: bool = True
@@ -61,7 +769,7 @@ class PassportValidationRules(OCRValidationRule):
     validity_months: int = 3
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BiometricPhotoValidationRules(OCRValidationRule):
     """Biometric photo specific validation rules"""
     check_background_color: bool = True
@@ -74,7 +782,7 @@ class BiometricPhotoValidationRules(OCRValidationRule):
     max_photo_age_months: int = 6
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BirthCertificateValidationRules(OCRValidationRule):
     """Birth certificate specific validation rules"""
     check_birth_date: bool = True
@@ -82,7 +790,7 @@ class BirthCertificateValidationRules(OCRValidationRule):
     check_parents_names: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BusinessLetterValidationRules(OCRValidationRule):
     """Business letter specific validation rules"""
     check_business_purpose: bool = True
@@ -91,7 +799,7 @@ class BusinessLetterValidationRules(OCRValidationRule):
     check_signature: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HotelReservationValidationRules(OCRValidationRule):
     """Hotel reservation specific validation rules"""
     check_confirmation: bool = True
@@ -100,7 +808,7 @@ class HotelReservationValidationRules(OCRValidationRule):
     check_payment_proof: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InvitationLetterValidationRules(OCRValidationRule):
     """Invitation letter specific validation rules"""
     check_host_contact: bool = True
@@ -109,7 +817,7 @@ class InvitationLetterValidationRules(OCRValidationRule):
     check_signature: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PreviousVisasValidationRules(OCRValidationRule):
     """Previous visas specific validation rules"""
     check_validity: bool = True
@@ -117,7 +825,7 @@ class PreviousVisasValidationRules(OCRValidationRule):
     check_visa_dates: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PropertyDeedValidationRules(OCRValidationRule):
     """Property deed specific validation rules"""
     check_official_stamp: bool = True
@@ -125,7 +833,7 @@ class PropertyDeedValidationRules(OCRValidationRule):
     check_property_value: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SocialSecurityValidationRules(OCRValidationRule):
     """Social security specific validation rules"""
     check_active_status: bool = True
@@ -133,7 +841,7 @@ class SocialSecurityValidationRules(OCRValidationRule):
     check_sgk_number: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StudentCertificateValidationRules(OCRValidationRule):
     """Student certificate specific validation rules"""
     check_issue_date: bool = True
@@ -143,7 +851,7 @@ class StudentCertificateValidationRules(OCRValidationRule):
     max_age_in_days: int = 90
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaxReturnValidationRules(OCRValidationRule):
     """Tax return specific validation rules"""
     check_income_amount: bool = True
@@ -151,7 +859,7 @@ class TaxReturnValidationRules(OCRValidationRule):
     check_tax_year: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TravelInsuranceValidationRules(OCRValidationRule):
     """Travel insurance specific validation rules"""
     check_coverage_amount: bool = True
@@ -159,7 +867,23 @@ class TravelInsuranceValidationRules(OCRValidationRule):
     check_validity_period: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
+class ValidationCheck:
+    """Outcome of a single validation check"""
+    valid: bool
+    issues: Tuple[str, ...] = ()
+    recommendations: Tuple[str, ...] = ()
+    details: Any = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the check as the dict validators used to return, with list issues and recommendations"""
+        check = asdict(self)
+        check["issues"] = list(self.issues)
+        check["recommendations"] = list(self.recommendations)
+        return check
+
+
+@dataclass(slots=True)
 class OCRResult:
     """OCR processing result"""
     document_type: DocumentType
@@ -169,14 +893,343 @@ class OCRResult:
     issues: List[str]
     recommendations: List[str]
     metadata: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as plain dicts and lists for API responses, with each check in its dict form"""
+        result = asdict(self)
+        result["validation_results"] = {
+            key: check.to_dict() if isinstance(check, ValidationCheck) else check
+            for key, check in self.validation_results.items()
+        }
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class PhotoMetadata:
+    """File metadata fields read by the photo extractors, parsed once per document"""
+    provided: bool = False
+    file_name: Any = None
+    image_dimensions: Any = None
+    quality_score: Any = 0
+    background_color: Any = "white"
+    background_analysis: Any = None
+    face_detected: Any = True
+    face_analysis: Any = None
+    width_px: Any = 0
+    height_px: Any = 0
+
+
+_EMPTY_PHOTO_METADATA = PhotoMetadata()
+
+
+def _parse_photo_metadata(metadata: Mapping[str, Any]) -> PhotoMetadata:
+    """Read every photo field and its default from file metadata in one place"""
+    if not metadata:
+        return _EMPTY_PHOTO_METADATA
+    image_dimensions = metadata.get("image_dimensions", {})
+    return PhotoMetadata(
+        provided=True,
+        file_name=metadata.get("file_name"),
+        image_dimensions=image_dimensions,
+        quality_score=metadata.get("image_quality_score", 0),
+        # Default to white background if not specified
+        background_color=metadata.get("background_color", "white") or "white",
+        background_analysis=metadata.get("background_analysis", {}),
+        face_detected=metadata.get("face_detected", True),
+        face_analysis=metadata.get("face_analysis", {}),
+        width_px=image_dimensions.get("width", 0),
+        height_px=image_dimensions.get("height", 0),
+    )
+
+
+# Outcomes of validators that format messages from a few primitive fields. Batches of
+# similar documents repeat the same inputs, so each message tuple is built once; typed
+# caching keeps 413 and 413.0 apart since they render differently
+_Outcome = Tuple[bool, Tuple[str, ...], Tuple[str, ...]]
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _passport_number_outcome(passport_number: Optional[str]) -> _Outcome:
+    """Validate passport number format"""
+    if not passport_number:
+        return False, ("Passport number not found",), ("Ensure the document contains clear passport number",)
+    
+    # Basic validation - passport numbers are usually 8-10 characters
+    if len(passport_number) < 6 or len(passport_number) > 12:
+        return (
+            False,
+            (f"Passport number '{passport_number}' has invalid length",),
+            ("Ensure passport number is clearly visible and readable",),
+        )
+    return True, (), ("Passport number format appears valid",)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _passport_pages_outcome(total_pages: Any, min_pages: int) -> _Outcome:
+    """Validate passport has minimum required pages"""
+    if not total_pages:
+        return False, ("Passport page information not found",), ("Ensure the document shows passport page information",)
+    
+    if total_pages < min_pages:
+        return (
+            False,
+            (f"Passport has {total_pages} pages, less than required {min_pages} pages",),
+            (f"Ensure passport has at least {min_pages} blank pages",),
+        )
+    return True, (), (f"Passport has {total_pages} pages, meets requirements",)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _expression_outcome(expression: Any) -> _Outcome:
+    """Validate neutral facial expression"""
+    if expression == "neutral":
+        return True, (), ("Facial expression is neutral, meets requirements",)
+    return False, (f"Facial expression is {expression}, should be neutral",), ("Maintain a neutral expression with mouth closed",)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _resolution_outcome(width_px: Any, height_px: Any, min_width: int, min_height: int) -> _Outcome:
+    """Validate photo has sufficient resolution"""
+    if width_px >= min_width and height_px >= min_height:
+        return True, (), (f"Photo resolution ({width_px}x{height_px}) meets minimum requirements",)
+    return (
+        False,
+        (f"Photo resolution ({width_px}x{height_px}) below minimum ({min_width}x{min_height})",),
+        (f"Ensure photo resolution is at least {min_width}x{min_height} pixels",),
+    )
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _background_color_outcome(background_color: str) -> _Outcome:
+    """Validate background color is white"""
+    background_color = background_color.lower()
+    if background_color in ["white", "beyaz"]:
+        return True, (), ("Background color is white, meets requirements",)
+    return (
+        False,
+        (f"Background color is {background_color}, should be white",),
+        ("Ensure the background is white (plain white background)",),
+    )
+
+
+@lru_cache(maxsize=64, typed=True)
+def _recent_photo_outcome(max_age_months: int) -> _Outcome:
+    """Validate photo is recent; always passes until photo dates are available"""
+    return True, (), (f"Photo appears to be recent (within last {max_age_months} months)",)
+
+
+@lru_cache(maxsize=64)
+def _photo_size_targets(required_width_mm: int, required_height_mm: int) -> Tuple[int, int, float, float]:
+    """Pixel targets and 5% tolerances for a photo size, computed once per required size"""
+    # Convert mm to pixels (assuming 300 DPI for biometric photos)
+    # 1 inch = 25.4 mm, 300 DPI = 300 pixels per inch
+    # 35 mm = 35 / 25.4 * 300 = ~413 pixels
+    # 45 mm = 45 / 25.4 * 300 = ~531 pixels
+    required_width_px = int(required_width_mm / 25.4 * 300)
+    required_height_px = int(required_height_mm / 25.4 * 300)
+    
+    # Allow 5% tolerance
+    return required_width_px, required_height_px, required_width_px * 0.05, required_height_px * 0.05
+
+
+def _presence_validator(flag: str, found: str, missing: str, recommendation: str):
+    """Build a validator that passes when the extractor reported flag"""
+    found_recommendations = (found,)
+    missing_issues = (missing,)
+    missing_recommendations = (recommendation,)
+
+    def validate(self, info: Dict[str, Any]) -> ValidationCheck:
+        if info.get(flag):
+            return ValidationCheck(True, recommendations=found_recommendations, details=info)
+        return ValidationCheck(False, missing_issues, missing_recommendations, details=info)
+
+    validate.__doc__ = f"Validate that {flag} was extracted"
+    return validate
 
 
 class OCRService:
     """Main OCR service for document processing and validation"""
     
-    def __init__(self):
+    # Per document type: extractors as (metadata key, extractor, takes file metadata) and validations as
+    # (rule flag, result key, validator, metadata key, rule attributes passed on, critical for the document)
+    _PIPELINES: Dict[DocumentType, Tuple[Tuple[Tuple[str, str, bool], ...], Tuple[Tuple[str, str, str, str, Tuple[str, ...], bool], ...]]] = {
+        DocumentType.BANK_STATEMENT: (
+            (
+                ("account_info", "_extract_account_info", False),
+                ("balance_info", "_extract_balance_info", False),
+                ("period_info", "_extract_statement_period", False),
+                ("bank_stamp_info", "_extract_bank_stamp", False),
+            ),
+            (
+                ("check_account_balance", "account_balance", "_validate_account_balance", "balance_info", ("min_balance_threshold",), False),
+                ("check_bank_stamp", "bank_stamp", "_validate_bank_stamp", "bank_stamp_info", (), True),
+                ("check_statement_period", "statement_period", "_validate_statement_period", "period_info", ("min_months",), False),
+            ),
+        ),
+        DocumentType.PASSPORT: (
+            (
+                ("passport_info", "_extract_passport_info", False),
+                ("expiry_info", "_extract_passport_dates", False),
+                ("page_info", "_extract_passport_pages", False),
+            ),
+            (
+                ("check_expiry_date", "expiry_date", "_validate_passport_expiry", "expiry_info", ("validity_months",), True),
+                ("check_issuance_date", "issuance_date", "_validate_passport_issuance", "expiry_info", (), False),
+                ("check_passport_number", "passport_number", "_validate_passport_number", "passport_info", (), False),
+                ("min_pages", "pages", "_validate_passport_pages", "page_info", ("min_pages",), False),
+            ),
+        ),
+        DocumentType.BIOMETRIC_PHOTO: (
+            (
+                ("photo_info", "_extract_photo_info", True),
+                ("background_info", "_extract_background_info", True),
+                ("face_info", "_extract_face_info", True),
+                ("size_info", "_extract_photo_size_info", True),
+            ),
+            (
+                ("check_background_color", "background_color", "_validate_background_color", "background_info", (), False),
+                ("check_face_visible", "face_visible", "_validate_face_visibility", "face_info", (), True),
+                ("check_photo_size", "photo_size", "_validate_photo_size", "size_info", ("required_width_mm", "required_height_mm"), False),
+                ("check_recent_photo", "recent_photo", "_validate_recent_photo", "photo_info", ("max_photo_age_months",), False),
+                ("check_face_centered", "face_centered", "_validate_face_centering", "face_info", (), False),
+                ("check_neutral_expression", "neutral_expression", "_validate_neutral_expression", "face_info", (), False),
+                ("check_eyes_open", "eyes_open", "_validate_eyes_open", "face_info", (), False),
+                ("check_no_glasses", "no_glasses", "_validate_no_glasses", "face_info", (), False),
+                ("check_no_headwear", "no_headwear", "_validate_no_headwear", "face_info", (), False),
+                ("check_proper_lighting", "proper_lighting", "_validate_proper_lighting", "photo_info", (), False),
+                ("check_high_resolution", "high_resolution", "_validate_high_resolution", "size_info", ("min_resolution_width", "min_resolution_height"), False),
+            ),
+        ),
+        DocumentType.BIRTH_CERTIFICATE: (
+            (
+                ("birth_info", "_extract_birth_info", False),
+                ("stamp_info", "_extract_birth_certificate_stamp", False),
+                ("parents_info", "_extract_parents_info", False),
+            ),
+            (
+                ("check_birth_date", "birth_date", "_validate_birth_date", "birth_info", (), False),
+                ("check_official_stamp", "official_stamp", "_validate_birth_certificate_stamp", "stamp_info", (), True),
+                ("check_parents_names", "parents_names", "_validate_parents_names", "parents_info", (), False),
+            ),
+        ),
+        DocumentType.HOTEL_RESERVATION: (
+            (
+                ("confirmation_info", "_extract_confirmation_info", False),
+                ("dates_info", "_extract_reservation_dates", False),
+                ("hotel_info", "_extract_hotel_info", False),
+                ("payment_info", "_extract_payment_info", False),
+            ),
+            (
+                ("check_confirmation", "confirmation", "_validate_confirmation", "confirmation_info", (), False),
+                ("check_dates", "dates", "_validate_reservation_dates", "dates_info", (), False),
+                ("check_hotel_reservation", "hotel_reservation", "_validate_hotel_reservation", "hotel_info", (), False),
+                ("check_payment_proof", "payment_proof", "_validate_payment_proof", "payment_info", (), False),
+            ),
+        ),
+        DocumentType.INVITATION_LETTER: (
+            (
+                ("host_contact_info", "_extract_host_contact_info", False),
+                ("host_info", "_extract_host_info", False),
+                ("invitation_dates_info", "_extract_invitation_dates", False),
+                ("signature_info", "_extract_signature_info", False),
+            ),
+            (
+                ("check_host_contact", "host_contact", "_validate_host_contact", "host_contact_info", (), False),
+                ("check_host_info", "host_info", "_validate_host_info", "host_info", (), False),
+                ("check_invitation_dates", "invitation_dates", "_validate_invitation_dates", "invitation_dates_info", (), False),
+                ("check_signature", "signature", "_validate_signature", "signature_info", (), False),
+            ),
+        ),
+        DocumentType.PREVIOUS_VISAS: (
+            (
+                ("visa_info", "_extract_visa_info", False),
+                ("visa_country_info", "_extract_visa_country_info", False),
+                ("visa_dates_info", "_extract_visa_dates", False),
+            ),
+            (
+                ("check_validity", "validity", "_validate_visa_validity", "visa_info", (), False),
+                ("check_visa_country", "visa_country", "_validate_visa_country", "visa_country_info", (), False),
+                ("check_visa_dates", "visa_dates", "_validate_visa_dates", "visa_dates_info", (), False),
+            ),
+        ),
+        DocumentType.PROPERTY_DEED: (
+            (
+                ("stamp_info", "_extract_property_deed_stamp", False),
+                ("owner_info", "_extract_property_owner_info", False),
+                ("value_info", "_extract_property_value_info", False),
+            ),
+            (
+                ("check_official_stamp", "official_stamp", "_validate_property_deed_stamp", "stamp_info", (), True),
+                ("check_property_owner", "property_owner", "_validate_property_owner", "owner_info", (), False),
+                ("check_property_value", "property_value", "_validate_property_value", "value_info", (), False),
+            ),
+        ),
+        DocumentType.SOCIAL_SECURITY: (
+            (
+                ("active_status_info", "_extract_active_status_info", False),
+                ("registration_date_info", "_extract_registration_date_info", False),
+                ("sgk_number_info", "_extract_sgk_number_info", False),
+            ),
+            (
+                ("check_active_status", "active_status", "_validate_active_status", "active_status_info", (), False),
+                ("check_registration_date", "registration_date", "_validate_registration_date", "registration_date_info", (), False),
+                ("check_sgk_number", "sgk_number", "_validate_sgk_number", "sgk_number_info", (), False),
+            ),
+        ),
+        DocumentType.STUDENT_CERTIFICATE: (
+            (
+                ("issue_date_info", "_extract_student_certificate_issue_date", False),
+                ("school_name_info", "_extract_school_name_info", False),
+                ("school_stamp_info", "_extract_school_stamp_info", False),
+                ("signature_info", "_extract_student_certificate_signature", False),
+            ),
+            (
+                ("check_issue_date", "issue_date", "_validate_student_certificate_issue_date", "issue_date_info", ("max_age_in_days",), False),
+                ("check_school_name", "school_name", "_validate_school_name", "school_name_info", (), False),
+                ("check_school_stamp", "school_stamp", "_validate_school_stamp", "school_stamp_info", (), True),
+                ("check_signature", "signature", "_validate_student_certificate_signature", "signature_info", (), False),
+            ),
+        ),
+        DocumentType.TAX_RETURN: (
+            (
+                ("income_amount_info", "_extract_income_amount_info", False),
+                ("tax_office_stamp_info", "_extract_tax_office_stamp_info", False),
+                ("tax_year_info", "_extract_tax_year_info", False),
+            ),
+            (
+                ("check_income_amount", "income_amount", "_validate_income_amount", "income_amount_info", (), False),
+                ("check_tax_office_stamp", "tax_office_stamp", "_validate_tax_office_stamp", "tax_office_stamp_info", (), True),
+                ("check_tax_year", "tax_year", "_validate_tax_year", "tax_year_info", (), False),
+            ),
+        ),
+        DocumentType.TRAVEL_INSURANCE: (
+            (
+                ("coverage_amount_info", "_extract_coverage_amount_info", False),
+                ("coverage_area_info", "_extract_coverage_area_info", False),
+                ("validity_period_info", "_extract_validity_period_info", False),
+            ),
+            (
+                ("check_coverage_amount", "coverage_amount", "_validate_coverage_amount", "coverage_amount_info", (), False),
+                ("check_coverage_area", "coverage_area", "_validate_coverage_area", "coverage_area_info", (), False),
+                ("check_validity_period", "validity_period", "_validate_validity_period", "validity_period_info", (), False),
+            ),
+        ),
+    }
+    
+    # Validators that compare against the current time; a pipeline run passes them one shared now
+    _CLOCK_VALIDATORS = frozenset({
+        "_validate_passport_expiry", "_validate_passport_issuance", "_validate_student_certificate_issue_date",
+    })
+    
+    def __init__(
+        self,
+        extraction_workers: int = 0,
+        batch_workers: Optional[int] = None,
+        document_type_configs: Optional[Mapping[DocumentType, Dict[str, Any]]] = None
+    ) -> None:
         self.document_processor = OCRDocumentProcessor()
-        self.document_type_configs = {
+        # Batch workers are built from their parent's configs; everyone else gets the defaults
+        self.document_type_configs = dict(document_type_configs) if document_type_configs is not None else {
             DocumentType.BANK_STATEMENT: {
                 "checkId": "bank_statement",
                 "docDescription": "Son 3 aya ait banka hesap dökümleri",
@@ -189,7 +1242,7 @@ class OCRService:
                     check_statement_period=True,
                     min_months=3
                 ),
-                "requiredFor": ["ALL"]
+                "requiredFor": frozenset({"ALL"})
             },
             DocumentType.PASSPORT: {
                 "checkId": "passport_general",
@@ -204,7 +1257,7 @@ class OCRService:
                     min_pages=2,
                     validity_months=3
                 ),
-                "requiredFor": ["ALL"]
+                "requiredFor": frozenset({"ALL"})
             },
             DocumentType.BIOMETRIC_PHOTO: {
                 "checkId": "biometric_photo",
@@ -222,7 +1275,7 @@ class OCRService:
                     required_height_mm=45,
                     max_photo_age_months=6
                 ),
-                "requiredFor": ["ALL"]
+                "requiredFor": frozenset({"ALL"})
             },
             DocumentType.BIRTH_CERTIFICATE: {
                 "checkId": "birth_certificate",
@@ -235,7 +1288,7 @@ class OCRService:
                     check_official_stamp=True,
                     check_parents_names=True
                 ),
-                "requiredFor": ["ALL"]
+                "requiredFor": frozenset({"ALL"})
             },
             DocumentType.BUSINESS_LETTER: {
                 "checkId": "business_letter",
@@ -249,7 +1302,7 @@ class OCRService:
                     check_contact_details=True,
                     check_signature=True
                 ),
-                "requiredFor": ["EMPLOYEE"]
+                "requiredFor": frozenset({"EMPLOYEE"})
             },
             DocumentType.HOTEL_RESERVATION: {
                 "checkId": "hotel_reservation",
@@ -263,7 +1316,7 @@ class OCRService:
                     check_hotel_reservation=True,
                     check_payment_proof=True
                 ),
-                "requiredFor": ["TOURIST"]
+                "requiredFor": frozenset({"TOURIST"})
             },
             DocumentType.INVITATION_LETTER: {
                 "checkId": "invitation_letter",
@@ -277,7 +1330,7 @@ class OCRService:
                     check_invitation_dates=True,
                     check_signature=True
                 ),
-                "requiredFor": ["VISITOR"]
+                "requiredFor": frozenset({"VISITOR"})
             },
             DocumentType.PREVIOUS_VISAS: {
                 "checkId": "previous_visas",
@@ -290,7 +1343,7 @@ class OCRService:
                     check_visa_country=True,
                     check_visa_dates=True
                 ),
-                "requiredFor": ["ALL"]
+                "requiredFor": frozenset({"ALL"})
             },
             DocumentType.PROPERTY_DEED: {
                 "checkId": "property_deed",
@@ -303,7 +1356,7 @@ class OCRService:
                     check_property_owner=True,
                     check_property_value=True
                 ),
-                "requiredFor": ["ALL"]
+                "requiredFor": frozenset({"ALL"})
             },
             DocumentType.SOCIAL_SECURITY: {
                 "checkId": "social_security",
@@ -316,7 +1369,7 @@ class OCRService:
                     check_registration_date=True,
                     check_sgk_number=True
                 ),
-                "requiredFor": ["EMPLOYEE"]
+                "requiredFor": frozenset({"EMPLOYEE"})
             },
             DocumentType.STUDENT_CERTIFICATE: {
                 "checkId": "student_certificate",
@@ -331,7 +1384,7 @@ class OCRService:
                     check_signature=True,
                     max_age_in_days=90
                 ),
-                "requiredFor": ["STUDENT"]
+                "requiredFor": frozenset({"STUDENT"})
             },
             DocumentType.TAX_RETURN: {
                 "checkId": "tax_return",
@@ -344,7 +1397,7 @@ class OCRService:
                     check_tax_office_stamp=True,
                     check_tax_year=True
                 ),
-                "requiredFor": ["EMPLOYEE"]
+                "requiredFor": frozenset({"EMPLOYEE"})
             },
             DocumentType.TRAVEL_INSURANCE: {
                 "checkId": "travel_insurance",
@@ -357,11 +1410,72 @@ class OCRService:
                     check_coverage_area=True,
                     check_validity_period=True
                 ),
-                "requiredFor": ["ALL"]
+                "requiredFor": frozenset({"ALL"})
+            }
+        }
+        
+        # Configs by their enum value, so lookups by name skip the DocumentType conversion
+        self._configs_by_value = {doc_type.value: config for doc_type, config in self.document_type_configs.items()}
+        
+        # The supported types listing is built once from the frozen rules; callers get copies of it
+        self._supported_document_types = tuple(
+            {
+                "checkId": config["checkId"],
+                "docDescription": config["docDescription"],
+                "docName": config["docName"],
+                "ocrValidationRules": asdict(config["ocrValidationRules"]),
+                "requiredFor": sorted(config["requiredFor"])
+            }
+            for config in self.document_type_configs.values()
+        )
+        
+        # Resolve pipeline method names and rule flags once instead of per document
+        self._bound_pipelines = {
+            doc_type: (
+                tuple(
+                    (info_key, getattr(self, extractor_name), uses_metadata)
+                    for info_key, extractor_name, uses_metadata in extractors
+                ),
+                tuple(
+                    (
+                        attrgetter(rule_flag), result_key, getattr(self, validator_name), info_key, rule_args, critical,
+                        validator_name in self._CLOCK_VALIDATORS,
+                    )
+                    for rule_flag, result_key, validator_name, info_key, rule_args, critical in checks
+                ),
+            )
+            for doc_type, (extractors, checks) in self._PIPELINES.items()
+        }
+        
+        # OCR often returns blank pages; their text fields are extracted once per document type
+        # up front instead of going through the extraction pool and the LRU caches
+        self._empty_text_fields = {
+            doc_type: {
+                info_key: extractor("")
+                for info_key, extractor, uses_metadata in extractors
+                if not uses_metadata
             }
+            for doc_type, (extractors, _) in self._bound_pipelines.items()
         }
+        
+        # Optional pool running a document's extractors concurrently. Python's re holds the GIL
+        # while matching, so this only pays off when the patterns run on RE2
+        self._extraction_workers = extraction_workers
+        self._extraction_pool = (
+            ThreadPoolExecutor(max_workers=extraction_workers, thread_name_prefix="ocr-extract")
+            if extraction_workers > 0 else None
+        )
+        
+        # Worker processes for process_batch, started on first use and reused afterwards
+        self._batch_workers = batch_workers
+        self._batch_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Text-only extraction is pure, so re-uploads of the same document reuse its fields
+        self._extract_text_fields = lru_cache(maxsize=_EXTRACTION_CACHE_SIZE)(self._extract_text_fields)
+        # The lazy path of stop_on_critical_failure memoises extractors one at a time
+        self._extract_text_field = lru_cache(maxsize=_EXTRACTION_CACHE_SIZE * 4)(self._extract_text_field)
     
-    def process_document_from_file(self, document_type: str, file_data: bytes, file_name: str = None) -> OCRResult:
+    def process_document_from_file(self, document_type: str, file_data: bytes, file_name: Optional[str] = None) -> OCRResult:
         """
         Process document from file data with OCR extraction
         
@@ -402,7 +1516,7 @@ class OCRService:
             return self.process_document(document_type, enhanced_text, metadata)
             
         except Exception as e:
-            logger.error(f"Error processing document from file: {str(e)}")
+            logger.exception("Error processing document from file: %s", e)
             return OCRResult(
                 document_type=DocumentType(document_type),
                 confidence_score=0.0,
@@ -413,7 +1527,7 @@ class OCRService:
                 metadata={"error": str(e), "file_name": file_name}
             )
     
-    def process_document(self, document_type: str, extracted_text: str, file_metadata: Dict[str, Any] = None) -> OCRResult:
+    def process_document(self, document_type: str, extracted_text: str, file_metadata: Optional[Mapping[str, Any]] = None) -> OCRResult:
         """
         Process document based on type and return validation results
         
@@ -432,38 +1546,19 @@ class OCRService:
             if not config:
                 raise ValueError(f"Unsupported document type: {document_type}")
             
+            metadata = file_metadata if file_metadata is not None else _EMPTY_METADATA
+            
             # Process based on document type
-            if doc_type == DocumentType.BANK_STATEMENT:
-                return self._process_bank_statement(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.PASSPORT:
-                return self._process_passport(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.BIOMETRIC_PHOTO:
-                return self._process_biometric_photo(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.BIRTH_CERTIFICATE:
-                return self._process_birth_certificate(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.BUSINESS_LETTER:
-                return self._process_business_letter(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.HOTEL_RESERVATION:
-                return self._process_hotel_reservation(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.INVITATION_LETTER:
-                return self._process_invitation_letter(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.PREVIOUS_VISAS:
-                return self._process_previous_visas(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.PROPERTY_DEED:
-                return self._process_property_deed(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.SOCIAL_SECURITY:
-                return self._process_social_security(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.STUDENT_CERTIFICATE:
-                return self._process_student_certificate(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.TAX_RETURN:
-                return self._process_tax_return(extracted_text, config, file_metadata)
-            elif doc_type == DocumentType.TRAVEL_INSURANCE:
-                return self._process_travel_insurance(extracted_text, config, file_metadata)
-            else:
-                return self._process_generic_document(extracted_text, config, file_metadata)
+            if doc_type in self._PIPELINES:
+                return self._run_pipeline(doc_type, extracted_text, config, metadata)
+            if doc_type == DocumentType.BUSINESS_LETTER:
+                # Business letters have rules but no extractors or validators yet; they are reported
+                # as a processing error rather than passing unchecked
+                raise NotImplementedError(f"Document type {document_type} cannot be validated yet")
+            return self._process_generic_document(extracted_text, config, metadata)
                 
         except Exception as e:
-            logger.error(f"Error processing document: {str(e)}")
+            logger.exception("Error processing document: %s", e)
             return OCRResult(
                 document_type=DocumentType(document_type),
                 confidence_score=0.0,
@@ -474,940 +1569,250 @@ class OCRService:
                 metadata={"error": str(e)}
             )
     
-    def _process_bank_statement(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process bank statement with specific validation rules"""
-        validation_rules = config["ocrValidationRules"]
-        issues = []
-        recommendations = []
-        validation_results = {}
+    def process_batch(self, documents: List[Tuple[str, str, Optional[Mapping[str, Any]]]]) -> List[OCRResult]:
+        """
+        Process several documents of an application in parallel worker processes
         
-        # Extract key information
-        account_info = self._extract_account_info(text)
-        balance_info = self._extract_balance_info(text)
-        period_info = self._extract_statement_period(text)
-        bank_stamp_info = self._extract_bank_stamp(text)
-        
-        # Validate account balance
-        if validation_rules.check_account_balance:
-            balance_result = self._validate_account_balance(balance_info, validation_rules.min_balance_threshold)
-            validation_results["account_balance"] = balance_result
-            if not balance_result["valid"]:
-                issues.extend(balance_result["issues"])
-                recommendations.extend(balance_result["recommendations"])
-        
-        # Validate bank stamp
-        if validation_rules.check_bank_stamp:
-            stamp_result = self._validate_bank_stamp(bank_stamp_info)
-            validation_results["bank_stamp"] = stamp_result
-            if not stamp_result["valid"]:
-                issues.extend(stamp_result["issues"])
-                recommendations.extend(stamp_result["recommendations"])
-        
-        # Validate statement period
-        if validation_rules.check_statement_period:
-            period_result = self._validate_statement_period(period_info, validation_rules.min_months)
-            validation_results["statement_period"] = period_result
-            if not period_result["valid"]:
-                issues.extend(period_result["issues"])
-                recommendations.extend(period_result["recommendations"])
+        Args:
+            documents: (document_type, extracted_text, file_metadata) tuples
+            
+        Returns:
+            OCRResults in the same order as documents
+        """
+        if len(documents) < 2:
+            return [self.process_document(*document) for document in documents]
+        
+        if self._batch_pool is None:
+            self._batch_workers = self._batch_workers or os.cpu_count() or 1
+            # Workers process documents with this service's configs and settings as they are when
+            # the pool starts
+            self._batch_pool = ProcessPoolExecutor(
+                max_workers=self._batch_workers,
+                mp_context=_batch_mp_context(),
+                initializer=_start_worker,
+                initargs=(self.document_type_configs, self._extraction_workers)
+            )
         
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
+        # A few chunks per worker keep large batches from paying one round trip per document
+        chunksize = max(1, len(documents) // (self._batch_workers * 4))
+        document_types, texts, file_metadata = zip(*documents)
+        return list(self._batch_pool.map(_process_in_worker, document_types, texts, file_metadata, chunksize=chunksize))
+    
+    def close(self) -> None:
+        """Shut down the batch worker processes and extraction threads"""
+        if self._batch_pool is not None:
+            self._batch_pool.shutdown()
+            self._batch_pool = None
+        if self._extraction_pool is not None:
+            self._extraction_pool.shutdown()
+            self._extraction_pool = None
+    
+    def _extract_text_fields(self, doc_type: DocumentType, text: str) -> Dict[str, Any]:
+        """Run the pipeline extractors that only read the OCR text"""
+        # Results are cached and shared between documents; _run_pipeline hands out deep copies
+        text_extractors = [
+            (info_key, extractor)
+            for info_key, extractor, uses_metadata in self._bound_pipelines[doc_type][0]
+            if not uses_metadata
+        ]
+        if self._extraction_pool is None:
+            return {info_key: extractor(text) for info_key, extractor in text_extractors}
         
-        return OCRResult(
-            document_type=DocumentType.BANK_STATEMENT,
-            confidence_score=confidence_score,
-            extracted_text=text,
-            validation_results=validation_results,
-            issues=issues,
-            recommendations=recommendations,
-            metadata={
-                "account_info": account_info,
-                "balance_info": balance_info,
-                "period_info": period_info,
-                "bank_stamp_info": bank_stamp_info,
-                "config": config
-            }
-        )
+        futures = [(info_key, self._extraction_pool.submit(extractor, text)) for info_key, extractor in text_extractors]
+        return {info_key: future.result() for info_key, future in futures}
+    
+    def _extract_text_field(self, extractor: Callable[[str], Dict[str, Any]], text: str) -> Dict[str, Any]:
+        """Run a single text-only extractor"""
+        return extractor(text)
     
-    def _process_passport(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process passport with specific validation rules"""
+    def _run_pipeline(self, doc_type: DocumentType, text: str, config: Dict[str, Any], metadata: Mapping[str, Any] = _EMPTY_METADATA) -> OCRResult:
+        """Process a document with the extractors and validators from its pipeline"""
+        extractors, checks = self._bound_pipelines[doc_type]
         validation_rules = config["ocrValidationRules"]
+        photo_metadata = None
+        if any(uses_metadata for _, _, uses_metadata in extractors):
+            photo_metadata = _parse_photo_metadata(metadata)
         issues = []
         recommendations = []
         validation_results = {}
+        passed_validations = 0
+        short_circuited = False
+        now = None
+        # Every text pattern needs a keyword or digit, so whitespace-only pages extract like empty ones;
+        # isspace stops at the first other character
+        blank = not text or text.isspace()
         
         # Extract key information
-        passport_info = self._extract_passport_info(text)
-        expiry_info = self._extract_passport_dates(text)
-        page_info = self._extract_passport_pages(text)
-        
-        # Validate expiry date
-        if validation_rules.check_expiry_date:
-            expiry_result = self._validate_passport_expiry(expiry_info, validation_rules.validity_months)
-            validation_results["expiry_date"] = expiry_result
-            if not expiry_result["valid"]:
-                issues.extend(expiry_result["issues"])
-                recommendations.extend(expiry_result["recommendations"])
-        
-        # Validate issuance date
-        if validation_rules.check_issuance_date:
-            issuance_result = self._validate_passport_issuance(expiry_info)
-            validation_results["issuance_date"] = issuance_result
-            if not issuance_result["valid"]:
-                issues.extend(issuance_result["issues"])
-                recommendations.extend(issuance_result["recommendations"])
-        
-        # Validate passport number
-        if validation_rules.check_passport_number:
-            number_result = self._validate_passport_number(passport_info)
-            validation_results["passport_number"] = number_result
-            if not number_result["valid"]:
-                issues.extend(number_result["issues"])
-                recommendations.extend(number_result["recommendations"])
-        
-        # Validate pages
-        if validation_rules.min_pages > 0:
-            pages_result = self._validate_passport_pages(page_info, validation_rules.min_pages)
-            validation_results["pages"] = pages_result
-            if not pages_result["valid"]:
-                issues.extend(pages_result["issues"])
-                recommendations.extend(pages_result["recommendations"])
+        if validation_rules.stop_on_critical_failure:
+            # Extract lazily so a critical failure also skips the remaining extractors
+            pending_extractors = {info_key: (extractor, uses_metadata) for info_key, extractor, uses_metadata in extractors}
+            extracted_info = {}
+        else:
+            pending_extractors = None
+            # Cached fields end up in the result and its checks, so callers get copies they may change
+            extracted_info = deepcopy(self._empty_text_fields[doc_type] if blank else self._extract_text_fields(doc_type, text))
+            for info_key, extractor, uses_metadata in extractors:
+                if uses_metadata:
+                    extracted_info[info_key] = extractor(text, photo_metadata)
+        
+        # Run the validations enabled by the document's rules
+        for rule_enabled, result_key, validator, info_key, rule_args, critical, takes_now in checks:
+            if not rule_enabled(validation_rules):
+                continue
+            if info_key not in extracted_info:
+                extractor, uses_metadata = pending_extractors[info_key]
+                if uses_metadata:
+                    extracted_info[info_key] = extractor(text, photo_metadata)
+                elif blank:
+                    extracted_info[info_key] = deepcopy(self._empty_text_fields[doc_type][info_key])
+                else:
+                    extracted_info[info_key] = deepcopy(self._extract_text_field(extractor, text))
+            rule_values = [getattr(validation_rules, rule_arg) for rule_arg in rule_args]
+            if takes_now:
+                # Read the clock once per document so its date checks agree with each other
+                now = now or datetime.now()
+                check_result = validator(extracted_info[info_key], *rule_values, now=now)
+            else:
+                check_result = validator(extracted_info[info_key], *rule_values)
+            validation_results[result_key] = check_result
+            if check_result.valid:
+                passed_validations += 1
+            else:
+                issues.extend(check_result.issues)
+                recommendations.extend(check_result.recommendations)
+                if critical and pending_extractors is not None:
+                    short_circuited = True
+                    break
         
         # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
+        confidence_score = self._calculate_confidence_score(passed_validations, len(validation_results))
+        if short_circuited:
+            extracted_info["short_circuited"] = True
+        extracted_info["config"] = config
         
         return OCRResult(
-            document_type=DocumentType.PASSPORT,
+            document_type=doc_type,
             confidence_score=confidence_score,
             extracted_text=text,
             validation_results=validation_results,
             issues=issues,
             recommendations=recommendations,
-            metadata={
-                "passport_info": passport_info,
-                "expiry_info": expiry_info,
-                "page_info": page_info,
-                "config": config
-            }
+            metadata=extracted_info
         )
     
-    def _process_biometric_photo(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process biometric photo with specific validation rules"""
-        validation_rules = config["ocrValidationRules"]
-        issues = []
-        recommendations = []
-        validation_results = {}
+    def _extract_account_info(self, text: str) -> Dict[str, Any]:
+        """Extract account information from bank statement text"""
+        account_info = {}
         
-        # Extract key information
-        photo_info = self._extract_photo_info(text, metadata)
-        background_info = self._extract_background_info(text, metadata)
-        face_info = self._extract_face_info(text, metadata)
-        size_info = self._extract_photo_size_info(text, metadata)
-        
-        # Validate background color
-        if validation_rules.check_background_color:
-            background_result = self._validate_background_color(background_info)
-            validation_results["background_color"] = background_result
-            if not background_result["valid"]:
-                issues.extend(background_result["issues"])
-                recommendations.extend(background_result["recommendations"])
-        
-        # Validate face visibility
-        if validation_rules.check_face_visible:
-            face_result = self._validate_face_visibility(face_info)
-            validation_results["face_visible"] = face_result
-            if not face_result["valid"]:
-                issues.extend(face_result["issues"])
-                recommendations.extend(face_result["recommendations"])
-        
-        # Validate photo size
-        if validation_rules.check_photo_size:
-            size_result = self._validate_photo_size(size_info, validation_rules.required_width_mm, validation_rules.required_height_mm)
-            validation_results["photo_size"] = size_result
-            if not size_result["valid"]:
-                issues.extend(size_result["issues"])
-                recommendations.extend(size_result["recommendations"])
-        
-        # Validate recent photo
-        if validation_rules.check_recent_photo:
-            recent_result = self._validate_recent_photo(photo_info, validation_rules.max_photo_age_months)
-            validation_results["recent_photo"] = recent_result
-            if not recent_result["valid"]:
-                issues.extend(recent_result["issues"])
-                recommendations.extend(recent_result["recommendations"])
-        
-        # Validate face centering
-        if validation_rules.check_face_centered:
-            centered_result = self._validate_face_centering(face_info)
-            validation_results["face_centered"] = centered_result
-            if not centered_result["valid"]:
-                issues.extend(centered_result["issues"])
-                recommendations.extend(centered_result["recommendations"])
-        
-        # Validate neutral expression
-        if validation_rules.check_neutral_expression:
-            expression_result = self._validate_neutral_expression(face_info)
-            validation_results["neutral_expression"] = expression_result
-            if not expression_result["valid"]:
-                issues.extend(expression_result["issues"])
-                recommendations.extend(expression_result["recommendations"])
-        
-        # Validate eyes open
-        if validation_rules.check_eyes_open:
-            eyes_result = self._validate_eyes_open(face_info)
-            validation_results["eyes_open"] = eyes_result
-            if not eyes_result["valid"]:
-                issues.extend(eyes_result["issues"])
-                recommendations.extend(eyes_result["recommendations"])
-        
-        # Validate no glasses
-        if validation_rules.check_no_glasses:
-            glasses_result = self._validate_no_glasses(face_info)
-            validation_results["no_glasses"] = glasses_result
-            if not glasses_result["valid"]:
-                issues.extend(glasses_result["issues"])
-                recommendations.extend(glasses_result["recommendations"])
-        
-        # Validate no headwear
-        if validation_rules.check_no_headwear:
-            headwear_result = self._validate_no_headwear(face_info)
-            validation_results["no_headwear"] = headwear_result
-            if not headwear_result["valid"]:
-                issues.extend(headwear_result["issues"])
-                recommendations.extend(headwear_result["recommendations"])
-        
-        # Validate proper lighting
-        if validation_rules.check_proper_lighting:
-            lighting_result = self._validate_proper_lighting(photo_info)
-            validation_results["proper_lighting"] = lighting_result
-            if not lighting_result["valid"]:
-                issues.extend(lighting_result["issues"])
-                recommendations.extend(lighting_result["recommendations"])
-        
-        # Validate high resolution
-        if validation_rules.check_high_resolution:
-            resolution_result = self._validate_high_resolution(size_info, validation_rules.min_resolution_width, validation_rules.min_resolution_height)
-            validation_results["high_resolution"] = resolution_result
-            if not resolution_result["valid"]:
-                issues.extend(resolution_result["issues"])
-                recommendations.extend(resolution_result["recommendations"])
+        # Account number patterns
+        account_number = _search_fused(_ACCOUNT_RE, text)
+        if account_number:
+            account_info["account_number"] = account_number
         
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
+        # Bank name patterns
+        bank_name = _search_fused(_BANK_NAME_RE, text)
+        if bank_name:
+            account_info["bank_name"] = bank_name.title()
         
-        return OCRResult(
-            document_type=DocumentType.BIOMETRIC_PHOTO,
-            confidence_score=confidence_score,
-            extracted_text=text,
-            validation_results=validation_results,
-            issues=issues,
-            recommendations=recommendations,
-            metadata={
-                "photo_info": photo_info,
-                "background_info": background_info,
-                "face_info": face_info,
-                "size_info": size_info,
-                "config": config
-            }
-        )
+        return account_info
     
-    def _process_birth_certificate(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process birth certificate with specific validation rules"""
-        validation_rules = config["ocrValidationRules"]
-        issues = []
-        recommendations = []
-        validation_results = {}
+    def _extract_balance_info(self, text: str) -> Dict[str, Any]:
+        """Extract balance information from bank statement text"""
+        balance_info = {}
         
-        # Extract key information
-        birth_info = self._extract_birth_info(text)
-        stamp_info = self._extract_birth_certificate_stamp(text)
-        parents_info = self._extract_parents_info(text)
-        
-        # Validate birth date
-        if validation_rules.check_birth_date:
-            birth_date_result = self._validate_birth_date(birth_info)
-            validation_results["birth_date"] = birth_date_result
-            if not birth_date_result["valid"]:
-                issues.extend(birth_date_result["issues"])
-                recommendations.extend(birth_date_result["recommendations"])
-        
-        # Validate official stamp
-        if validation_rules.check_official_stamp:
-            stamp_result = self._validate_birth_certificate_stamp(stamp_info)
-            validation_results["official_stamp"] = stamp_result
-            if not stamp_result["valid"]:
-                issues.extend(stamp_result["issues"])
-                recommendations.extend(stamp_result["recommendations"])
-        
-        # Validate parents names
-        if validation_rules.check_parents_names:
-            parents_result = self._validate_parents_names(parents_info)
-            validation_results["parents_names"] = parents_result
-            if not parents_result["valid"]:
-                issues.extend(parents_result["issues"])
-                recommendations.extend(parents_result["recommendations"])
+        # Balance patterns (Turkish and English)
+        balances = []
+        current_balance = None
+        for pattern in _BALANCE_PATTERNS:
+            for match in pattern.finditer(text):
+                try:
+                    amount = _parse_amount(match.group(1))
+                    currency = match.group(2).upper()
+                except ValueError:
+                    continue
+                balance = {"amount": amount, "currency": currency}
+                balances.append(balance)
+                # Track the highest balance (likely current balance)
+                if current_balance is None or amount > current_balance["amount"]:
+                    current_balance = balance
         
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
+        if balances:
+            balance_info["balances"] = balances
+            balance_info["current_balance"] = current_balance
         
-        return OCRResult(
-            document_type=DocumentType.BIRTH_CERTIFICATE,
-            confidence_score=confidence_score,
-            extracted_text=text,
-            validation_results=validation_results,
-            issues=issues,
-            recommendations=recommendations,
-            metadata={
-                "birth_info": birth_info,
-                "stamp_info": stamp_info,
-                "parents_info": parents_info,
-                "config": config
-            }
-        )
+        return balance_info
     
-    def _process_hotel_reservation(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process hotel reservation with specific validation rules"""
-        validation_rules = config["ocrValidationRules"]
-        issues = []
-        recommendations = []
-        validation_results = {}
+    def _extract_statement_period(self, text: str) -> Dict[str, Any]:
+        """Extract statement period from bank statement text"""
+        period_info = {}
         
-        # Extract key information
-        confirmation_info = self._extract_confirmation_info(text)
-        dates_info = self._extract_reservation_dates(text)
-        hotel_info = self._extract_hotel_info(text)
-        payment_info = self._extract_payment_info(text)
-        
-        # Validate confirmation
-        if validation_rules.check_confirmation:
-            confirmation_result = self._validate_confirmation(confirmation_info)
-            validation_results["confirmation"] = confirmation_result
-            if not confirmation_result["valid"]:
-                issues.extend(confirmation_result["issues"])
-                recommendations.extend(confirmation_result["recommendations"])
-        
-        # Validate dates
-        if validation_rules.check_dates:
-            dates_result = self._validate_reservation_dates(dates_info)
-            validation_results["dates"] = dates_result
-            if not dates_result["valid"]:
-                issues.extend(dates_result["issues"])
-                recommendations.extend(dates_result["recommendations"])
-        
-        # Validate hotel reservation
-        if validation_rules.check_hotel_reservation:
-            hotel_result = self._validate_hotel_reservation(hotel_info)
-            validation_results["hotel_reservation"] = hotel_result
-            if not hotel_result["valid"]:
-                issues.extend(hotel_result["issues"])
-                recommendations.extend(hotel_result["recommendations"])
-        
-        # Validate payment proof
-        if validation_rules.check_payment_proof:
-            payment_result = self._validate_payment_proof(payment_info)
-            validation_results["payment_proof"] = payment_result
-            if not payment_result["valid"]:
-                issues.extend(payment_result["issues"])
-                recommendations.extend(payment_result["recommendations"])
+        # Date patterns
+        dates = []
+        start_date = end_date = None
+        for pattern in _STATEMENT_DATE_PATTERNS:
+            for match in pattern.finditer(text):
+                day, month, year = match.group(1, 2, 3)
+                # strptime("%Y") only accepted four-digit years
+                if len(year) != 4:
+                    continue
+                try:
+                    if month.isdigit():  # DD/MM/YYYY format
+                        month = int(month)
+                    else:  # Month name format
+                        month = _TURKISH_MONTHS.get(month.lower(), 1)
+                    date = datetime(int(year), month, int(day))
+                except ValueError:
+                    continue
+                
+                dates.append(date)
+                # Track the period bounds while parsing
+                if start_date is None or date < start_date:
+                    start_date = date
+                if end_date is None or date > end_date:
+                    end_date = date
         
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
+        if dates:
+            period_info["dates"] = dates
+            period_info["start_date"] = start_date
+            period_info["end_date"] = end_date
+            period_info["duration_days"] = (end_date - start_date).days
         
-        return OCRResult(
-            document_type=DocumentType.HOTEL_RESERVATION,
-            confidence_score=confidence_score,
-            extracted_text=text,
-            validation_results=validation_results,
-            issues=issues,
-            recommendations=recommendations,
-            metadata={
-                "confirmation_info": confirmation_info,
-                "dates_info": dates_info,
-                "hotel_info": hotel_info,
-                "payment_info": payment_info,
-                "config": config
-            }
-        )
+        return period_info
     
-    def _process_invitation_letter(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process invitation letter with specific validation rules"""
-        validation_rules = config["ocrValidationRules"]
-        issues = []
-        recommendations = []
-        validation_results = {}
-        
-        # Extract key information
-        host_contact_info = self._extract_host_contact_info(text)
-        host_info = self._extract_host_info(text)
-        invitation_dates_info = self._extract_invitation_dates(text)
-        signature_info = self._extract_signature_info(text)
-        
-        # Validate host contact
-        if validation_rules.check_host_contact:
-            host_contact_result = self._validate_host_contact(host_contact_info)
-            validation_results["host_contact"] = host_contact_result
-            if not host_contact_result["valid"]:
-                issues.extend(host_contact_result["issues"])
-                recommendations.extend(host_contact_result["recommendations"])
-        
-        # Validate host info
-        if validation_rules.check_host_info:
-            host_info_result = self._validate_host_info(host_info)
-            validation_results["host_info"] = host_info_result
-            if not host_info_result["valid"]:
-                issues.extend(host_info_result["issues"])
-                recommendations.extend(host_info_result["recommendations"])
-        
-        # Validate invitation dates
-        if validation_rules.check_invitation_dates:
-            invitation_dates_result = self._validate_invitation_dates(invitation_dates_info)
-            validation_results["invitation_dates"] = invitation_dates_result
-            if not invitation_dates_result["valid"]:
-                issues.extend(invitation_dates_result["issues"])
-                recommendations.extend(invitation_dates_result["recommendations"])
-        
-        # Validate signature
-        if validation_rules.check_signature:
-            signature_result = self._validate_signature(signature_info)
-            validation_results["signature"] = signature_result
-            if not signature_result["valid"]:
-                issues.extend(signature_result["issues"])
-                recommendations.extend(signature_result["recommendations"])
+    def _extract_bank_stamp(self, text: str) -> Dict[str, Any]:
+        """Extract bank stamp/seal information"""
+        # Stamp patterns
+        stamp_text = _search_fused(_BANK_STAMP_RE, text)
+        if stamp_text:
+            return {"has_stamp": True, "stamp_text": stamp_text}
+        return {"has_stamp": False}
+    
+    def _extract_passport_info(self, text: str) -> Dict[str, Any]:
+        """Extract passport information from text"""
+        passport_info = {}
         
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
+        # Passport number patterns
+        passport_number = _search_fused(_PASSPORT_NUMBER_RE, text)
+        if passport_number:
+            passport_info["passport_number"] = passport_number
         
-        return OCRResult(
-            document_type=DocumentType.INVITATION_LETTER,
-            confidence_score=confidence_score,
-            extracted_text=text,
-            validation_results=validation_results,
-            issues=issues,
-            recommendations=recommendations,
-            metadata={
-                "host_contact_info": host_contact_info,
-                "host_info": host_info,
-                "invitation_dates_info": invitation_dates_info,
-                "signature_info": signature_info,
-                "config": config
-            }
-        )
-    
-    def _process_previous_visas(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process previous visas with specific validation rules"""
-        validation_rules = config["ocrValidationRules"]
-        issues = []
-        recommendations = []
-        validation_results = {}
+        labeled = _search_fused_fields(_PASSPORT_LABEL_RE, text, _PASSPORT_LABEL_FIELDS, _PASSPORT_LABEL_ANCHORS)
         
-        # Extract key information
-        visa_info = self._extract_visa_info(text)
-        visa_country_info = self._extract_visa_country_info(text)
-        visa_dates_info = self._extract_visa_dates(text)
-        
-        # Validate visa validity
-        if validation_rules.check_validity:
-            validity_result = self._validate_visa_validity(visa_info)
-            validation_results["validity"] = validity_result
-            if not validity_result["valid"]:
-                issues.extend(validity_result["issues"])
-                recommendations.extend(validity_result["recommendations"])
-        
-        # Validate visa country
-        if validation_rules.check_visa_country:
-            country_result = self._validate_visa_country(visa_country_info)
-            validation_results["visa_country"] = country_result
-            if not country_result["valid"]:
-                issues.extend(country_result["issues"])
-                recommendations.extend(country_result["recommendations"])
-        
-        # Validate visa dates
-        if validation_rules.check_visa_dates:
-            dates_result = self._validate_visa_dates(visa_dates_info)
-            validation_results["visa_dates"] = dates_result
-            if not dates_result["valid"]:
-                issues.extend(dates_result["issues"])
-                recommendations.extend(dates_result["recommendations"])
+        # Country code patterns
+        country_code = labeled.get("country_code")
+        if not country_code:
+            # Unlabeled fallback: first standalone uppercase token that is a real country code
+            for match in _COUNTRY_TOKEN_RE.finditer(text):
+                if match.group() in _ISO_ALPHA3_CODES:
+                    country_code = match.group()
+                    break
+        if country_code:
+            passport_info["country_code"] = country_code
         
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
-        
-        return OCRResult(
-            document_type=DocumentType.PREVIOUS_VISAS,
-            confidence_score=confidence_score,
-            extracted_text=text,
-            validation_results=validation_results,
-            issues=issues,
-            recommendations=recommendations,
-            metadata={
-                "visa_info": visa_info,
-                "visa_country_info": visa_country_info,
-                "visa_dates_info": visa_dates_info,
-                "config": config
-            }
-        )
-    
-    def _process_property_deed(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process property deed with specific validation rules"""
-        validation_rules = config["ocrValidationRules"]
-        issues = []
-        recommendations = []
-        validation_results = {}
-        
-        # Extract key information
-        stamp_info = self._extract_property_deed_stamp(text)
-        owner_info = self._extract_property_owner_info(text)
-        value_info = self._extract_property_value_info(text)
-        
-        # Validate official stamp
-        if validation_rules.check_official_stamp:
-            stamp_result = self._validate_property_deed_stamp(stamp_info)
-            validation_results["official_stamp"] = stamp_result
-            if not stamp_result["valid"]:
-                issues.extend(stamp_result["issues"])
-                recommendations.extend(stamp_result["recommendations"])
-        
-        # Validate property owner
-        if validation_rules.check_property_owner:
-            owner_result = self._validate_property_owner(owner_info)
-            validation_results["property_owner"] = owner_result
-            if not owner_result["valid"]:
-                issues.extend(owner_result["issues"])
-                recommendations.extend(owner_result["recommendations"])
-        
-        # Validate property value
-        if validation_rules.check_property_value:
-            value_result = self._validate_property_value(value_info)
-            validation_results["property_value"] = value_result
-            if not value_result["valid"]:
-                issues.extend(value_result["issues"])
-                recommendations.extend(value_result["recommendations"])
-        
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
-        
-        return OCRResult(
-            document_type=DocumentType.PROPERTY_DEED,
-            confidence_score=confidence_score,
-            extracted_text=text,
-            validation_results=validation_results,
-            issues=issues,
-            recommendations=recommendations,
-            metadata={
-                "stamp_info": stamp_info,
-                "owner_info": owner_info,
-                "value_info": value_info,
-                "config": config
-            }
-        )
-    
-    def _process_social_security(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process social security document with specific validation rules"""
-        validation_rules = config["ocrValidationRules"]
-        issues = []
-        recommendations = []
-        validation_results = {}
-        
-        # Extract key information
-        active_status_info = self._extract_active_status_info(text)
-        registration_date_info = self._extract_registration_date_info(text)
-        sgk_number_info = self._extract_sgk_number_info(text)
-        
-        # Validate active status
-        if validation_rules.check_active_status:
-            active_status_result = self._validate_active_status(active_status_info)
-            validation_results["active_status"] = active_status_result
-            if not active_status_result["valid"]:
-                issues.extend(active_status_result["issues"])
-                recommendations.extend(active_status_result["recommendations"])
-        
-        # Validate registration date
-        if validation_rules.check_registration_date:
-            registration_date_result = self._validate_registration_date(registration_date_info)
-            validation_results["registration_date"] = registration_date_result
-            if not registration_date_result["valid"]:
-                issues.extend(registration_date_result["issues"])
-                recommendations.extend(registration_date_result["recommendations"])
-        
-        # Validate SGK number
-        if validation_rules.check_sgk_number:
-            sgk_number_result = self._validate_sgk_number(sgk_number_info)
-            validation_results["sgk_number"] = sgk_number_result
-            if not sgk_number_result["valid"]:
-                issues.extend(sgk_number_result["issues"])
-                recommendations.extend(sgk_number_result["recommendations"])
-        
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
-        
-        return OCRResult(
-            document_type=DocumentType.SOCIAL_SECURITY,
-            confidence_score=confidence_score,
-            extracted_text=text,
-            validation_results=validation_results,
-            issues=issues,
-            recommendations=recommendations,
-            metadata={
-                "active_status_info": active_status_info,
-                "registration_date_info": registration_date_info,
-                "sgk_number_info": sgk_number_info,
-                "config": config
-            }
-        )
-    
-    def _process_student_certificate(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process student certificate with specific validation rules"""
-        validation_rules = config["ocrValidationRules"]
-        issues = []
-        recommendations = []
-        validation_results = {}
-        
-        # Extract key information
-        issue_date_info = self._extract_student_certificate_issue_date(text)
-        school_name_info = self._extract_school_name_info(text)
-        school_stamp_info = self._extract_school_stamp_info(text)
-        signature_info = self._extract_student_certificate_signature(text)
-        
-        # Validate issue date
-        if validation_rules.check_issue_date:
-            issue_date_result = self._validate_student_certificate_issue_date(issue_date_info, validation_rules.max_age_in_days)
-            validation_results["issue_date"] = issue_date_result
-            if not issue_date_result["valid"]:
-                issues.extend(issue_date_result["issues"])
-                recommendations.extend(issue_date_result["recommendations"])
-        
-        # Validate school name
-        if validation_rules.check_school_name:
-            school_name_result = self._validate_school_name(school_name_info)
-            validation_results["school_name"] = school_name_result
-            if not school_name_result["valid"]:
-                issues.extend(school_name_result["issues"])
-                recommendations.extend(school_name_result["recommendations"])
-        
-        # Validate school stamp
-        if validation_rules.check_school_stamp:
-            school_stamp_result = self._validate_school_stamp(school_stamp_info)
-            validation_results["school_stamp"] = school_stamp_result
-            if not school_stamp_result["valid"]:
-                issues.extend(school_stamp_result["issues"])
-                recommendations.extend(school_stamp_result["recommendations"])
-        
-        # Validate signature
-        if validation_rules.check_signature:
-            signature_result = self._validate_student_certificate_signature(signature_info)
-            validation_results["signature"] = signature_result
-            if not signature_result["valid"]:
-                issues.extend(signature_result["issues"])
-                recommendations.extend(signature_result["recommendations"])
-        
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
-        
-        return OCRResult(
-            document_type=DocumentType.STUDENT_CERTIFICATE,
-            confidence_score=confidence_score,
-            extracted_text=text,
-            validation_results=validation_results,
-            issues=issues,
-            recommendations=recommendations,
-            metadata={
-                "issue_date_info": issue_date_info,
-                "school_name_info": school_name_info,
-                "school_stamp_info": school_stamp_info,
-                "signature_info": signature_info,
-                "config": config
-            }
-        )
-    
-    def _process_tax_return(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process tax return with specific validation rules"""
-        validation_rules = config["ocrValidationRules"]
-        issues = []
-        recommendations = []
-        validation_results = {}
-        
-        # Extract key information
-        income_amount_info = self._extract_income_amount_info(text)
-        tax_office_stamp_info = self._extract_tax_office_stamp_info(text)
-        tax_year_info = self._extract_tax_year_info(text)
-        
-        # Validate income amount
-        if validation_rules.check_income_amount:
-            income_amount_result = self._validate_income_amount(income_amount_info)
-            validation_results["income_amount"] = income_amount_result
-            if not income_amount_result["valid"]:
-                issues.extend(income_amount_result["issues"])
-                recommendations.extend(income_amount_result["recommendations"])
-        
-        # Validate tax office stamp
-        if validation_rules.check_tax_office_stamp:
-            tax_office_stamp_result = self._validate_tax_office_stamp(tax_office_stamp_info)
-            validation_results["tax_office_stamp"] = tax_office_stamp_result
-            if not tax_office_stamp_result["valid"]:
-                issues.extend(tax_office_stamp_result["issues"])
-                recommendations.extend(tax_office_stamp_result["recommendations"])
-        
-        # Validate tax year
-        if validation_rules.check_tax_year:
-            tax_year_result = self._validate_tax_year(tax_year_info)
-            validation_results["tax_year"] = tax_year_result
-            if not tax_year_result["valid"]:
-                issues.extend(tax_year_result["issues"])
-                recommendations.extend(tax_year_result["recommendations"])
-        
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
-        
-        return OCRResult(
-            document_type=DocumentType.TAX_RETURN,
-            confidence_score=confidence_score,
-            extracted_text=text,
-            validation_results=validation_results,
-            issues=issues,
-            recommendations=recommendations,
-            metadata={
-                "income_amount_info": income_amount_info,
-                "tax_office_stamp_info": tax_office_stamp_info,
-                "tax_year_info": tax_year_info,
-                "config": config
-            }
-        )
-    
-    def _process_travel_insurance(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
-        """Process travel insurance with specific validation rules"""
-        validation_rules = config["ocrValidationRules"]
-        issues = []
-        recommendations = []
-        validation_results = {}
-        
-        # Extract key information
-        coverage_amount_info = self._extract_coverage_amount_info(text)
-        coverage_area_info = self._extract_coverage_area_info(text)
-        validity_period_info = self._extract_validity_period_info(text)
-        
-        # Validate coverage amount
-        if validation_rules.check_coverage_amount:
-            coverage_amount_result = self._validate_coverage_amount(coverage_amount_info)
-            validation_results["coverage_amount"] = coverage_amount_result
-            if not coverage_amount_result["valid"]:
-                issues.extend(coverage_amount_result["issues"])
-                recommendations.extend(coverage_amount_result["recommendations"])
-        
-        # Validate coverage area
-        if validation_rules.check_coverage_area:
-            coverage_area_result = self._validate_coverage_area(coverage_area_info)
-            validation_results["coverage_area"] = coverage_area_result
-            if not coverage_area_result["valid"]:
-                issues.extend(coverage_area_result["issues"])
-                recommendations.extend(coverage_area_result["recommendations"])
-        
-        # Validate validity period
-        if validation_rules.check_validity_period:
-            validity_period_result = self._validate_validity_period(validity_period_info)
-            validation_results["validity_period"] = validity_period_result
-            if not validity_period_result["valid"]:
-                issues.extend(validity_period_result["issues"])
-                recommendations.extend(validity_period_result["recommendations"])
-        
-        # Calculate confidence score
-        confidence_score = self._calculate_confidence_score(validation_results)
-        
-        return OCRResult(
-            document_type=DocumentType.TRAVEL_INSURANCE,
-            confidence_score=confidence_score,
-            extracted_text=text,
-            validation_results=validation_results,
-            issues=issues,
-            recommendations=recommendations,
-            metadata={
-                "coverage_amount_info": coverage_amount_info,
-                "coverage_area_info": coverage_area_info,
-                "validity_period_info": validity_period_info,
-                "config": config
-            }
-        )
-    
-    def _extract_account_info(self, text: str) -> Dict[str, Any]:
-        """Extract account information from bank statement text"""
-        account_info = {}
-        
-        # Account number patterns
-        account_patterns = [
-            r'hesap\s*no[:\s]*(\d+)',
-            r'account\s*no[:\s]*(\d+)',
-            r'hesap\s*numarası[:\s]*(\d+)',
-            r'(\d{10,})',  # Generic 10+ digit number
-        ]
-        
-        for pattern in account_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                account_info["account_number"] = match.group(1)
-                break
-        
-        # Bank name patterns
-        bank_patterns = [
-            r'(ziraat|garanti|iş\s*bankası|akbank|yapı\s*kredi|halkbank|vakıfbank)',
-            r'(türkiye\s*iş\s*bankası|türkiye\s*garanti\s*bankası)',
-        ]
-        
-        for pattern in bank_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                account_info["bank_name"] = match.group(1).title()
-                break
-        
-        return account_info
-    
-    def _extract_balance_info(self, text: str) -> Dict[str, Any]:
-        """Extract balance information from bank statement text"""
-        balance_info = {}
-        
-        # Balance patterns (Turkish and English)
-        balance_patterns = [
-            r'bakiye[:\s]*([\d.,]+)\s*(tl|try|₺|bb|ab)',
-            r'balance[:\s]*([\d.,]+)\s*(tl|try|₺|bb|ab)',
-            r'mevcut\s*bakiye[:\s]*([\d.,]+)\s*(tl|try|₺|bb|ab)',
-            r'son\s*bakiye[:\s]*([\d.,]+)\s*(tl|try|₺|bb|ab)',
-            r'([\d.,]+)\s*(tl|try|₺|bb|ab)',  # Generic amount with currency
-            r'(\d{1,3}(?:\.\d{3})*,\d{2})\s*(bb|ab)',  # Turkish format: 53.989,75 BB
-        ]
-        
-        balances = []
-        for pattern in balance_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    amount_str = match[0]
-                    # Handle Turkish number format (e.g., "53.989,75")
-                    if '.' in amount_str and ',' in amount_str:
-                        # Turkish format: thousands separator is dot, decimal is comma
-                        amount_str = amount_str.replace('.', '').replace(',', '.')
-                    else:
-                        # English format: thousands separator is comma, decimal is dot
-                        amount_str = amount_str.replace(',', '')
-                    
-                    amount = float(amount_str)
-                    currency = match[1].upper()
-                    balances.append({"amount": amount, "currency": currency})
-                except ValueError:
-                    continue
-        
-        if balances:
-            # Get the highest balance (likely current balance)
-            balance_info["balances"] = balances
-            balance_info["current_balance"] = max(balances, key=lambda x: x["amount"])
-        
-        return balance_info
-    
-    def _extract_statement_period(self, text: str) -> Dict[str, Any]:
-        """Extract statement period from bank statement text"""
-        period_info = {}
-        
-        # Date patterns
-        date_patterns = [
-            r'(\d{1,2})[./](\d{1,2})[./](\d{4})',  # DD/MM/YYYY or DD.MM.YYYY
-            r'(\d{4})[./](\d{1,2})[./](\d{1,2})',  # YYYY/MM/DD or YYYY.MM.DD
-            r'(\d{1,2})\s+(ocak|şubat|mart|nisan|mayıs|haziran|temmuz|ağustos|eylül|ekim|kasım|aralık)\s+(\d{4})',
-        ]
-        
-        dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    if len(match) == 3:
-                        if match[1].isdigit():  # DD/MM/YYYY format
-                            day, month, year = match
-                        else:  # Month name format
-                            day, month_name, year = match
-                            month_names = {
-                                'ocak': '01', 'şubat': '02', 'mart': '03', 'nisan': '04',
-                                'mayıs': '05', 'haziran': '06', 'temmuz': '07', 'ağustos': '08',
-                                'eylül': '09', 'ekim': '10', 'kasım': '11', 'aralık': '12'
-                            }
-                            month = month_names.get(month_name.lower(), '01')
-                        
-                        date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        dates.append(datetime.strptime(date_str, "%Y-%m-%d"))
-                except ValueError:
-                    continue
-        
-        if dates:
-            period_info["dates"] = dates
-            period_info["start_date"] = min(dates)
-            period_info["end_date"] = max(dates)
-            period_info["duration_days"] = (max(dates) - min(dates)).days
-        
-        return period_info
-    
-    def _extract_bank_stamp(self, text: str) -> Dict[str, Any]:
-        """Extract bank stamp/seal information"""
-        stamp_info = {}
-        
-        # Stamp patterns
-        stamp_patterns = [
-            r'(mühür|mühürlü|kaşeli)',
-            r'(stamp|sealed)',
-            r'(resmi\s*mühür|official\s*stamp)',
-            r'(bank\s*stamp|banka\s*mühürü)',
-        ]
-        
-        for pattern in stamp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                stamp_info["has_stamp"] = True
-                stamp_info["stamp_text"] = match.group(1)
-                break
-        
-        if not stamp_info:
-            stamp_info["has_stamp"] = False
-        
-        return stamp_info
-    
-    def _extract_passport_info(self, text: str) -> Dict[str, Any]:
-        """Extract passport information from text"""
-        passport_info = {}
-        
-        # Passport number patterns
-        passport_patterns = [
-            r'pasaport\s*no[:\s]*([A-Z0-9]+)',
-            r'passport\s*no[:\s]*([A-Z0-9]+)',
-            r'pasaport\s*numarası[:\s]*([A-Z0-9]+)',
-            r'([A-Z]\d{8,})',  # Generic passport number pattern
-        ]
-        
-        for pattern in passport_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                passport_info["passport_number"] = match.group(1)
-                break
-        
-        # Country code patterns
-        country_patterns = [
-            r'ülke\s*kodu[:\s]*([A-Z]{3})',
-            r'country\s*code[:\s]*([A-Z]{3})',
-            r'([A-Z]{3})',  # Generic 3-letter country code
-        ]
-        
-        for pattern in country_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                passport_info["country_code"] = match.group(1)
-                break
-        
-        # Passport type
-        type_patterns = [
-            r'türü[:\s]*([A-Z])',
-            r'type[:\s]*([A-Z])',
-        ]
-        
-        for pattern in type_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                passport_info["passport_type"] = match.group(1)
-                break
+        # Passport type
+        passport_type = labeled.get("passport_type")
+        if passport_type:
+            passport_info["passport_type"] = passport_type
         
         return passport_info
     
@@ -1416,60 +1821,36 @@ class OCRService:
         date_info = {}
         
         # Date patterns for Turkish and English
-        date_patterns = [
-            r'(\d{1,2})[./](\d{1,2})[./](\d{4})',  # DD/MM/YYYY
-            r'(\d{4})[./](\d{1,2})[./](\d{1,2})',  # YYYY/MM/DD
-            r'(\d{1,2})\s+(ocak|şubat|mart|nisan|mayıs|haziran|temmuz|ağustos|eylül|ekim|kasım|aralık)\s+(\d{4})',
-            r'(\d{1,2})\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d{4})',
-            r'(\d{1,2})\s+(oca|şub|mar|nis|may|haz|tem|ağu|eyl|eki|kas|ara)\s+(\d{4})',  # Turkish abbreviated months
-            r'(\d{1,2})\s+(haz|jun)\s+(\d{4})',  # Special case for HAZ/JUN
-            r'(\d{1,2})\s+(oca|jan)\s+(\d{4})',  # Special case for OCA/JAN
-            r'(\d{1,2})\s+(haz|jun)\s+/\s+(jun)\s+(\d{4})',  # HAZ / JUN format
-            r'(\d{1,2})\s+(oca|jan)\s+/\s+(jan)\s+(\d{4})',  # OCA / JAN format
-        ]
-        
         dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        month_number = _PASSPORT_MONTH_NAMES.get
+        folded_text = _fold_case(text)
+        # Every date pattern starts with a digit, so scans begin at the first one
+        first_digit = _DIGIT_RE.search(folded_text)
+        if first_digit is None:
+            patterns = ()
+        elif _PASSPORT_MONTH_DATE_GATE_RE.search(folded_text, first_digit.start()):
+            patterns = _PASSPORT_DATE_PATTERNS
+        else:
+            patterns = _PASSPORT_NUMERIC_DATE_PATTERNS
+        for pattern in patterns:
+            matches = pattern.findall(folded_text, first_digit.start())
             for match in matches:
                 try:
                     if len(match) == 3:
                         if match[1].isdigit():  # DD/MM/YYYY format
                             day, month, year = match
+                            month = int(month)
                         else:  # Month name format
                             day, month_name, year = match
-                            month_names = {
-                                'ocak': '01', 'şubat': '02', 'mart': '03', 'nisan': '04',
-                                'mayıs': '05', 'haziran': '06', 'temmuz': '07', 'ağustos': '08',
-                                'eylül': '09', 'ekim': '10', 'kasım': '11', 'aralık': '12',
-                                'oca': '01', 'şub': '02', 'mar': '03', 'nis': '04',
-                                'may': '05', 'haz': '06', 'tem': '07', 'ağu': '08',
-                                'eyl': '09', 'eki': '10', 'kas': '11', 'ara': '12',
-                                'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-                                'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-                                'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-                            }
-                            month = month_names.get(month_name.lower(), '01')
+                            month = month_number(month_name, 1)
                         
-                        date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        dates.append(datetime.strptime(date_str, "%Y-%m-%d"))
+                        # YYYY/MM/DD matches unpack reversed here; strptime always rejected them
+                        if len(year) == 4:
+                            dates.append(datetime(int(year), month, int(day)))
                     elif len(match) == 4:  # HAZ / JUN format
                         day, month_name1, month_name2, year = match
-                        month_names = {
-                            'ocak': '01', 'şubat': '02', 'mart': '03', 'nisan': '04',
-                            'mayıs': '05', 'haziran': '06', 'temmuz': '07', 'ağustos': '08',
-                            'eylül': '09', 'ekim': '10', 'kasım': '11', 'aralık': '12',
-                            'oca': '01', 'şub': '02', 'mar': '03', 'nis': '04',
-                            'may': '05', 'haz': '06', 'tem': '07', 'ağu': '08',
-                            'eyl': '09', 'eki': '10', 'kas': '11', 'ara': '12',
-                            'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-                            'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-                            'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-                        }
                         # Use the first month name (Turkish)
-                        month = month_names.get(month_name1.lower(), '01')
-                        date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        dates.append(datetime.strptime(date_str, "%Y-%m-%d"))
+                        dates.append(datetime(int(year), month_number(month_name1, 1), int(day)))
                 except ValueError:
                     continue
         
@@ -1478,25 +1859,16 @@ class OCRService:
             
             # Try to identify issuance and expiry dates
             # Filter out birth dates (usually much older than issuance dates)
-            current_year = datetime.now().year
-            recent_dates = [d for d in dates if d.year >= current_year - 15]  # Last 15 years
+            # Last 15 years; comparing against Jan 1 of the cutoff year avoids reading d.year per date
+            cutoff = datetime(datetime.now().year - 15, 1, 1)
+            recent_dates = [d for d in dates if d >= cutoff]
             
-            if recent_dates:
-                sorted_dates = sorted(recent_dates)
-                if len(sorted_dates) >= 2:
-                    date_info["issuance_date"] = sorted_dates[0]
-                    date_info["expiry_date"] = sorted_dates[-1]
-                elif len(sorted_dates) == 1:
-                    # If only one recent date, assume it's expiry date
-                    date_info["expiry_date"] = sorted_dates[0]
-            else:
-                # Fallback to original logic if no recent dates found
-                sorted_dates = sorted(dates)
-                if len(sorted_dates) >= 2:
-                    date_info["issuance_date"] = sorted_dates[0]
-                    date_info["expiry_date"] = sorted_dates[-1]
-                elif len(sorted_dates) == 1:
-                    date_info["expiry_date"] = sorted_dates[0]
+            # Fall back to all dates if no recent dates found
+            candidates = recent_dates or dates
+            if len(candidates) >= 2:
+                date_info["issuance_date"] = min(candidates)
+            # If only one date, assume it's expiry date
+            date_info["expiry_date"] = max(candidates)
         
         return date_info
     
@@ -1505,23 +1877,14 @@ class OCRService:
         page_info = {}
         
         # Page patterns
-        page_patterns = [
-            r'sayfa[:\s]*(\d+)',
-            r'page[:\s]*(\d+)',
-            r'(\d+)\s*sayfa',
-            r'(\d+)\s*page',
-        ]
-        
         pages = []
-        for pattern in page_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    page_num = int(match)
-                    if 1 <= page_num <= 50:  # Reasonable page range
-                        pages.append(page_num)
-                except ValueError:
-                    continue
+        folded_text = _fold_case(text)
+        for pattern in _PASSPORT_PAGE_PATTERNS:
+            # \d+ captures always parse, so matches convert straight to int
+            for match in pattern.finditer(folded_text):
+                page_num = int(match.group(1))
+                if 1 <= page_num <= 50:  # Reasonable page range
+                    pages.append(page_num)
         
         if pages:
             page_info["pages"] = pages
@@ -1530,967 +1893,472 @@ class OCRService:
         
         return page_info
     
-    def _validate_passport_expiry(self, expiry_info: Dict[str, Any], validity_months: int) -> Dict[str, Any]:
+    def _validate_passport_expiry(self, expiry_info: Dict[str, Any], validity_months: int, now: Optional[datetime] = None) -> ValidationCheck:
         """Validate passport expiry date"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": expiry_info
-        }
-        
         if not expiry_info.get("expiry_date"):
-            result["issues"].append("Passport expiry date not found")
-            result["recommendations"].append("Ensure the document contains clear expiry date information")
-            return result
+            return ValidationCheck(
+                False,
+                ("Passport expiry date not found",),
+                ("Ensure the document contains clear expiry date information",),
+                details=expiry_info
+            )
         
         expiry_date = expiry_info["expiry_date"]
-        current_date = datetime.now()
+        current_date = now or datetime.now()
+        
+        if expiry_date < current_date:
+            return ValidationCheck(
+                False,
+                ("Passport has expired",),
+                ("Obtain a new passport before applying for visa",),
+                details=expiry_info
+            )
         
-        # Calculate months until expiry
+        # Calculate months until expiry; only the year and month fields take part
         months_until_expiry = (expiry_date.year - current_date.year) * 12 + (expiry_date.month - current_date.month)
         
-        if expiry_date < current_date:
-            result["issues"].append("Passport has expired")
-            result["recommendations"].append("Obtain a new passport before applying for visa")
-        elif months_until_expiry < validity_months:
-            result["issues"].append(f"Passport expires in {months_until_expiry} months, less than required {validity_months} months")
-            result["recommendations"].append(f"Ensure passport is valid for at least {validity_months} months from visa application date")
+        if months_until_expiry < validity_months:
+            return ValidationCheck(
+                False,
+                (f"Passport expires in {months_until_expiry} months, less than required {validity_months} months",),
+                (f"Ensure passport is valid for at least {validity_months} months from visa application date",),
+                details=expiry_info
+            )
         else:
-            result["valid"] = True
-            result["recommendations"].append(f"Passport is valid for {months_until_expiry} months, meets requirements")
-        
-        return result
+            return ValidationCheck(
+                True,
+                recommendations=(f"Passport is valid for {months_until_expiry} months, meets requirements",),
+                details=expiry_info
+            )
     
-    def _validate_passport_issuance(self, expiry_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_passport_issuance(self, expiry_info: Dict[str, Any], now: Optional[datetime] = None) -> ValidationCheck:
         """Validate passport issuance date"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": expiry_info
-        }
-        
         if not expiry_info.get("issuance_date"):
-            result["issues"].append("Passport issuance date not found")
-            result["recommendations"].append("Ensure the document contains clear issuance date information")
-            return result
+            return ValidationCheck(
+                False,
+                ("Passport issuance date not found",),
+                ("Ensure the document contains clear issuance date information",),
+                details=expiry_info
+            )
         
         issuance_date = expiry_info["issuance_date"]
-        current_date = datetime.now()
-        
-        # Check if passport was issued within last 10 years
-        years_since_issuance = (current_date.year - issuance_date.year)
+        current_date = now or datetime.now()
         
         if issuance_date > current_date:
-            result["issues"].append("Passport issuance date is in the future")
-            result["recommendations"].append("Check passport issuance date")
-        elif years_since_issuance > 10:
-            result["issues"].append(f"Passport was issued {years_since_issuance} years ago, exceeds 10-year limit")
-            result["recommendations"].append("Obtain a new passport issued within the last 10 years")
-        else:
-            result["valid"] = True
-            result["recommendations"].append(f"Passport was issued {years_since_issuance} years ago, meets requirements")
+            return ValidationCheck(
+                False,
+                ("Passport issuance date is in the future",),
+                ("Check passport issuance date",),
+                details=expiry_info
+            )
         
-        return result
+        # Check if passport was issued within last 10 years
+        years_since_issuance = current_date.year - issuance_date.year
+        
+        if years_since_issuance > 10:
+            return ValidationCheck(
+                False,
+                (f"Passport was issued {years_since_issuance} years ago, exceeds 10-year limit",),
+                ("Obtain a new passport issued within the last 10 years",),
+                details=expiry_info
+            )
+        else:
+            return ValidationCheck(
+                True,
+                recommendations=(f"Passport was issued {years_since_issuance} years ago, meets requirements",),
+                details=expiry_info
+            )
     
-    def _validate_passport_number(self, passport_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_passport_number(self, passport_info: Dict[str, Any]) -> ValidationCheck:
         """Validate passport number format"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": passport_info
-        }
-        
-        if not passport_info.get("passport_number"):
-            result["issues"].append("Passport number not found")
-            result["recommendations"].append("Ensure the document contains clear passport number")
-            return result
-        
-        passport_number = passport_info["passport_number"]
-        
-        # Basic validation - passport numbers are usually 8-10 characters
-        if len(passport_number) < 6 or len(passport_number) > 12:
-            result["issues"].append(f"Passport number '{passport_number}' has invalid length")
-            result["recommendations"].append("Ensure passport number is clearly visible and readable")
-        else:
-            result["valid"] = True
-            result["recommendations"].append("Passport number format appears valid")
-        
-        return result
+        valid, issues, recommendations = _passport_number_outcome(passport_info.get("passport_number"))
+        return ValidationCheck(valid, issues, recommendations, details=passport_info)
     
-    def _validate_passport_pages(self, page_info: Dict[str, Any], min_pages: int) -> Dict[str, Any]:
+    def _validate_passport_pages(self, page_info: Dict[str, Any], min_pages: int) -> ValidationCheck:
         """Validate passport has minimum required pages"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": page_info
-        }
-        
-        if not page_info.get("total_pages"):
-            result["issues"].append("Passport page information not found")
-            result["recommendations"].append("Ensure the document shows passport page information")
-            return result
-        
-        total_pages = page_info["total_pages"]
-        
-        if total_pages < min_pages:
-            result["issues"].append(f"Passport has {total_pages} pages, less than required {min_pages} pages")
-            result["recommendations"].append(f"Ensure passport has at least {min_pages} blank pages")
-        else:
-            result["valid"] = True
-            result["recommendations"].append(f"Passport has {total_pages} pages, meets requirements")
-        
-        return result
+        valid, issues, recommendations = _passport_pages_outcome(page_info.get("total_pages"), min_pages)
+        return ValidationCheck(valid, issues, recommendations, details=page_info)
     
-    def _validate_face_centering(self, face_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_face_centering(self, face_info: Dict[str, Any]) -> ValidationCheck:
         """Validate face is centered in the photo"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": face_info
-        }
-        
         face_position = face_info.get("face_position", {})
         face_centered = face_position.get("centered", True)  # Mock value
         
         if face_centered:
-            result["valid"] = True
-            result["recommendations"].append("Face is properly centered in the photo")
+            return ValidationCheck(True, recommendations=("Face is properly centered in the photo",), details=face_info)
         else:
-            result["issues"].append("Face is not centered in the photo")
-            result["recommendations"].append("Ensure face is centered horizontally and vertically")
-        
-        return result
+            return ValidationCheck(
+                False,
+                ("Face is not centered in the photo",),
+                ("Ensure face is centered horizontally and vertically",),
+                details=face_info
+            )
     
-    def _validate_neutral_expression(self, face_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_neutral_expression(self, face_info: Dict[str, Any]) -> ValidationCheck:
         """Validate neutral facial expression"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": face_info
-        }
-        
         expression = face_info.get("expression", "neutral")  # Mock value
-        
-        if expression == "neutral":
-            result["valid"] = True
-            result["recommendations"].append("Facial expression is neutral, meets requirements")
-        else:
-            result["issues"].append(f"Facial expression is {expression}, should be neutral")
-            result["recommendations"].append("Maintain a neutral expression with mouth closed")
-        
-        return result
+        valid, issues, recommendations = _expression_outcome(expression)
+        return ValidationCheck(valid, issues, recommendations, details=face_info)
     
-    def _validate_eyes_open(self, face_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_eyes_open(self, face_info: Dict[str, Any]) -> ValidationCheck:
         """Validate eyes are open and looking at camera"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": face_info
-        }
-        
         eyes_open = face_info.get("eyes_open", True)  # Mock value
         looking_at_camera = face_info.get("looking_at_camera", True)  # Mock value
         
         if eyes_open and looking_at_camera:
-            result["valid"] = True
-            result["recommendations"].append("Eyes are open and looking directly at camera")
-        else:
-            if not eyes_open:
-                result["issues"].append("Eyes appear to be closed")
-            if not looking_at_camera:
-                result["issues"].append("Not looking directly at camera")
-            result["recommendations"].append("Ensure eyes are open and looking directly at the camera")
-        
-        return result
+            return ValidationCheck(True, recommendations=("Eyes are open and looking directly at camera",), details=face_info)
+        
+        issues = ()
+        if not eyes_open:
+            issues += ("Eyes appear to be closed",)
+        if not looking_at_camera:
+            issues += ("Not looking directly at camera",)
+        return ValidationCheck(
+            False,
+            issues,
+            ("Ensure eyes are open and looking directly at the camera",),
+            details=face_info
+        )
     
-    def _validate_no_glasses(self, face_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_no_glasses(self, face_info: Dict[str, Any]) -> ValidationCheck:
         """Validate no glasses are worn"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": face_info
-        }
-        
         has_glasses = face_info.get("has_glasses", False)  # Mock value
         
         if not has_glasses:
-            result["valid"] = True
-            result["recommendations"].append("No glasses detected, meets requirements")
+            return ValidationCheck(True, recommendations=("No glasses detected, meets requirements",), details=face_info)
         else:
-            result["issues"].append("Glasses detected in photo")
-            result["recommendations"].append("Remove glasses for biometric photo")
-        
-        return result
+            return ValidationCheck(
+                False,
+                ("Glasses detected in photo",),
+                ("Remove glasses for biometric photo",),
+                details=face_info
+            )
     
-    def _validate_no_headwear(self, face_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_no_headwear(self, face_info: Dict[str, Any]) -> ValidationCheck:
         """Validate no headwear is worn"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": face_info
-        }
-        
         has_headwear = face_info.get("has_headwear", False)  # Mock value
         
         if not has_headwear:
-            result["valid"] = True
-            result["recommendations"].append("No headwear detected, meets requirements")
+            return ValidationCheck(True, recommendations=("No headwear detected, meets requirements",), details=face_info)
         else:
-            result["issues"].append("Headwear detected in photo")
-            result["recommendations"].append("Remove all headwear including hats, caps, and religious head coverings")
-        
-        return result
+            return ValidationCheck(
+                False,
+                ("Headwear detected in photo",),
+                ("Remove all headwear including hats, caps, and religious head coverings",),
+                details=face_info
+            )
     
-    def _validate_proper_lighting(self, photo_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_proper_lighting(self, photo_info: Dict[str, Any]) -> ValidationCheck:
         """Validate proper lighting conditions"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": photo_info
-        }
-        
         lighting_quality = photo_info.get("lighting_quality", "good")  # Mock value
         has_shadows = photo_info.get("has_shadows", False)  # Mock value
         
         if lighting_quality == "good" and not has_shadows:
-            result["valid"] = True
-            result["recommendations"].append("Lighting is adequate with no shadows on face")
-        else:
-            if lighting_quality != "good":
-                result["issues"].append("Poor lighting conditions detected")
-            if has_shadows:
-                result["issues"].append("Shadows detected on face")
-            result["recommendations"].append("Ensure even lighting with no shadows on face")
-        
-        return result
+            return ValidationCheck(True, recommendations=("Lighting is adequate with no shadows on face",), details=photo_info)
+        
+        issues = ()
+        if lighting_quality != "good":
+            issues += ("Poor lighting conditions detected",)
+        if has_shadows:
+            issues += ("Shadows detected on face",)
+        return ValidationCheck(
+            False,
+            issues,
+            ("Ensure even lighting with no shadows on face",),
+            details=photo_info
+        )
     
-    def _validate_high_resolution(self, size_info: Dict[str, Any], min_width: int, min_height: int) -> Dict[str, Any]:
+    def _validate_high_resolution(self, size_info: Dict[str, Any], min_width: int, min_height: int) -> ValidationCheck:
         """Validate photo has sufficient resolution"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": size_info
-        }
-        
         width_px = size_info.get("width_px", 0)
         height_px = size_info.get("height_px", 0)
-        
-        if width_px >= min_width and height_px >= min_height:
-            result["valid"] = True
-            result["recommendations"].append(f"Photo resolution ({width_px}x{height_px}) meets minimum requirements")
-        else:
-            result["issues"].append(f"Photo resolution ({width_px}x{height_px}) below minimum ({min_width}x{min_height})")
-            result["recommendations"].append(f"Ensure photo resolution is at least {min_width}x{min_height} pixels")
-        
-        return result
+        valid, issues, recommendations = _resolution_outcome(width_px, height_px, min_width, min_height)
+        return ValidationCheck(valid, issues, recommendations, details=size_info)
     
-    def _extract_photo_info(self, text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _extract_photo_info(self, text: str, metadata: PhotoMetadata = _EMPTY_PHOTO_METADATA) -> Dict[str, Any]:
         """Extract photo information"""
         photo_info = {}
         
         # Extract from metadata if available
-        if metadata:
-            photo_info["file_name"] = metadata.get("file_name")
-            photo_info["image_dimensions"] = metadata.get("image_dimensions", {})
-            photo_info["quality_score"] = metadata.get("image_quality_score", 0)
+        if metadata.provided:
+            photo_info["file_name"] = metadata.file_name
+            photo_info["image_dimensions"] = metadata.image_dimensions
+            photo_info["quality_score"] = metadata.quality_score
         
         return photo_info
     
-    def _extract_background_info(self, text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _extract_background_info(self, text: str, metadata: PhotoMetadata = _EMPTY_PHOTO_METADATA) -> Dict[str, Any]:
         """Extract background color information"""
-        background_info = {}
+        background_info = {"background_color": metadata.background_color}
         
         # Extract from metadata if available
-        if metadata:
-            background_info["background_color"] = metadata.get("background_color", "white")
-            background_info["background_analysis"] = metadata.get("background_analysis", {})
-        
-        # Default to white background if not specified
-        if not background_info.get("background_color"):
-            background_info["background_color"] = "white"
+        if metadata.provided:
+            background_info["background_analysis"] = metadata.background_analysis
         
         return background_info
     
-    def _extract_face_info(self, text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _extract_face_info(self, text: str, metadata: PhotoMetadata = _EMPTY_PHOTO_METADATA) -> Dict[str, Any]:
         """Extract face detection information"""
-        face_info = {}
+        face_info = {"face_detected": metadata.face_detected}
         
         # Extract from metadata if available
-        if metadata:
-            face_info["face_detected"] = metadata.get("face_detected", True)
-            face_info["face_analysis"] = metadata.get("face_analysis", {})
-        
-        # Default to face detected if not specified
-        if "face_detected" not in face_info:
-            face_info["face_detected"] = True
+        if metadata.provided:
+            face_info["face_analysis"] = metadata.face_analysis
         
         return face_info
     
-    def _extract_photo_size_info(self, text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _extract_photo_size_info(self, text: str, metadata: PhotoMetadata = _EMPTY_PHOTO_METADATA) -> Dict[str, Any]:
         """Extract photo size information"""
         size_info = {}
         
         # Extract from metadata if available
-        if metadata:
-            size_info["width_px"] = metadata.get("image_dimensions", {}).get("width", 0)
-            size_info["height_px"] = metadata.get("image_dimensions", {}).get("height", 0)
+        if metadata.provided:
+            size_info["width_px"] = metadata.width_px
+            size_info["height_px"] = metadata.height_px
         
         return size_info
     
-    def _validate_background_color(self, background_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_background_color(self, background_info: Dict[str, Any]) -> ValidationCheck:
         """Validate background color is white"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": background_info
-        }
-        
-        background_color = background_info.get("background_color", "").lower()
-        
-        if background_color in ["white", "beyaz"]:
-            result["valid"] = True
-            result["recommendations"].append("Background color is white, meets requirements")
-        else:
-            result["issues"].append(f"Background color is {background_color}, should be white")
-            result["recommendations"].append("Ensure the background is white (plain white background)")
-        
-        return result
+        valid, issues, recommendations = _background_color_outcome(background_info.get("background_color", ""))
+        return ValidationCheck(valid, issues, recommendations, details=background_info)
     
-    def _validate_face_visibility(self, face_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_face_visibility(self, face_info: Dict[str, Any]) -> ValidationCheck:
         """Validate face is visible and clear"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": face_info
-        }
-        
         face_detected = face_info.get("face_detected", False)
         
         if face_detected:
-            result["valid"] = True
-            result["recommendations"].append("Face is clearly visible and detected")
+            return ValidationCheck(True, recommendations=("Face is clearly visible and detected",), details=face_info)
         else:
-            result["issues"].append("Face not clearly visible or detected")
-            result["recommendations"].append("Ensure face is clearly visible, eyes are open, and there are no shadows")
-        
-        return result
+            return ValidationCheck(
+                False,
+                ("Face not clearly visible or detected",),
+                ("Ensure face is clearly visible, eyes are open, and there are no shadows",),
+                details=face_info
+            )
     
-    def _validate_photo_size(self, size_info: Dict[str, Any], required_width_mm: int, required_height_mm: int) -> Dict[str, Any]:
+    def _validate_photo_size(self, size_info: Dict[str, Any], required_width_mm: int, required_height_mm: int) -> ValidationCheck:
         """Validate photo size meets requirements"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": size_info
-        }
-        
         width_px = size_info.get("width_px", 0)
         height_px = size_info.get("height_px", 0)
         
         if width_px == 0 or height_px == 0:
-            result["issues"].append("Photo dimensions not available")
-            result["recommendations"].append("Ensure photo dimensions are clearly visible")
-            return result
-        
-        # Convert mm to pixels (assuming 300 DPI for biometric photos)
-        # 1 inch = 25.4 mm, 300 DPI = 300 pixels per inch
-        # 35 mm = 35 / 25.4 * 300 = ~413 pixels
-        # 45 mm = 45 / 25.4 * 300 = ~531 pixels
-        required_width_px = int(required_width_mm / 25.4 * 300)
-        required_height_px = int(required_height_mm / 25.4 * 300)
+            return ValidationCheck(
+                False,
+                ("Photo dimensions not available",),
+                ("Ensure photo dimensions are clearly visible",),
+                details=size_info
+            )
         
-        # Allow 5% tolerance
-        width_tolerance = required_width_px * 0.05
-        height_tolerance = required_height_px * 0.05
+        required_width_px, required_height_px, width_tolerance, height_tolerance = _photo_size_targets(
+            required_width_mm, required_height_mm
+        )
         
         width_valid = abs(width_px - required_width_px) <= width_tolerance
         height_valid = abs(height_px - required_height_px) <= height_tolerance
         
         if width_valid and height_valid:
-            result["valid"] = True
-            result["recommendations"].append(f"Photo size ({width_px}x{height_px}px) meets requirements ({required_width_mm}x{required_height_mm}mm)")
-        else:
-            if not width_valid:
-                result["issues"].append(f"Photo width ({width_px}px) does not meet requirement ({required_width_mm}mm)")
-            if not height_valid:
-                result["issues"].append(f"Photo height ({height_px}px) does not meet requirement ({required_height_mm}mm)")
-            result["recommendations"].append(f"Ensure photo size is {required_width_mm}x{required_height_mm}mm (35x45mm)")
+            return ValidationCheck(
+                True,
+                recommendations=(f"Photo size ({width_px}x{height_px}px) meets requirements ({required_width_mm}x{required_height_mm}mm)",),
+                details=size_info
+            )
         
-        return result
+        issues = ()
+        if not width_valid:
+            issues += (f"Photo width ({width_px}px) does not meet requirement ({required_width_mm}mm)",)
+        if not height_valid:
+            issues += (f"Photo height ({height_px}px) does not meet requirement ({required_height_mm}mm)",)
+        return ValidationCheck(
+            False,
+            issues,
+            (f"Ensure photo size is {required_width_mm}x{required_height_mm}mm (35x45mm)",),
+            details=size_info
+        )
     
-    def _validate_recent_photo(self, photo_info: Dict[str, Any], max_age_months: int) -> Dict[str, Any]:
+    def _validate_recent_photo(self, photo_info: Dict[str, Any], max_age_months: int) -> ValidationCheck:
         """Validate photo is recent (within last 6 months)"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": photo_info
-        }
-        
         # For now, assume photo is recent if no date information is available
         # In production, this would check EXIF data or other metadata
-        result["valid"] = True
-        result["recommendations"].append(f"Photo appears to be recent (within last {max_age_months} months)")
-        
-        return result
+        valid, issues, recommendations = _recent_photo_outcome(max_age_months)
+        return ValidationCheck(valid, issues, recommendations, details=photo_info)
     
     def _extract_birth_info(self, text: str) -> Dict[str, Any]:
         """Extract birth information from birth certificate text"""
         birth_info = {}
         
         # Birth date patterns
-        date_patterns = [
-            r'doğum\s*tarihi[:\s]*(\d{1,2})[./](\d{1,2})[./](\d{4})',
-            r'doğum\s*tarihi[:\s]*(\d{1,2})\s+(ocak|şubat|mart|nisan|mayıs|haziran|temmuz|ağustos|eylül|ekim|kasım|aralık)\s+(\d{4})',
-            r'birth\s*date[:\s]*(\d{1,2})[./](\d{1,2})[./](\d{4})',
-            r'yıl[:\s]*(\d{4})',
-            r'ay[:\s]*(ocak|şubat|mart|nisan|mayıs|haziran|temmuz|ağustos|eylül|ekim|kasım|aralık)',
-            r'gün[:\s]*(\d{1,2})',
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                birth_info["date_found"] = True
-                birth_info["date_text"] = match.group(0)
-                break
+        date_text = _search_fused(_BIRTH_DATE_RE, text)
+        if date_text:
+            birth_info["date_found"] = True
+            birth_info["date_text"] = date_text
         
         # Birth place patterns
-        place_patterns = [
-            r'doğum\s*yeri[:\s]*([A-ZÇĞİÖŞÜ\s]+)',
-            r'place\s*of\s*birth[:\s]*([A-Z\s]+)',
-        ]
-        
-        for pattern in place_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                birth_info["place"] = match.group(1).strip()
-                break
+        place = _search_fused(_BIRTH_PLACE_RE, text, _BIRTH_PLACE_ANCHORS)
+        if place:
+            birth_info["place"] = place.strip()
         
         return birth_info
     
     def _extract_birth_certificate_stamp(self, text: str) -> Dict[str, Any]:
         """Extract stamp information from birth certificate text"""
-        stamp_info = {}
-        
         # Stamp patterns
-        stamp_patterns = [
-            r'(mühür|mühürlü|kaşeli)',
-            r'(stamp|sealed|official\s*stamp)',
-            r'(yeminli\s*tercüme|certified\s*translation)',
-            r'(resmi\s*mühür|official\s*seal)',
-        ]
-        
-        for pattern in stamp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                stamp_info["has_stamp"] = True
-                stamp_info["stamp_text"] = match.group(1)
-                break
-        
-        if not stamp_info:
-            stamp_info["has_stamp"] = False
-        
-        return stamp_info
+        stamp_text = _search_fused(_BIRTH_CERTIFICATE_STAMP_RE, text)
+        if stamp_text:
+            return {"has_stamp": True, "stamp_text": stamp_text}
+        return {"has_stamp": False}
     
     def _extract_parents_info(self, text: str) -> Dict[str, Any]:
         """Extract parents information from birth certificate text"""
         parents_info = {}
         
         # Father patterns
-        father_patterns = [
-            r'baba[:\s]*soyadı[:\s]*([A-ZÇĞİÖŞÜ]+)',
-            r'father[:\s]*surname[:\s]*([A-Z]+)',
-            r'baba[:\s]*([A-ZÇĞİÖŞÜ]+)',
-        ]
-        
-        for pattern in father_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                parents_info["father_surname"] = match.group(1)
-                break
+        father_surname = _search_fused(_FATHER_RE, text, _FATHER_ANCHORS)
+        if father_surname:
+            parents_info["father_surname"] = father_surname
         
         # Mother patterns
-        mother_patterns = [
-            r'anne[:\s]*soyadı[:\s]*([A-ZÇĞİÖŞÜ]+)',
-            r'mother[:\s]*surname[:\s]*([A-Z]+)',
-            r'anne[:\s]*([A-ZÇĞİÖŞÜ]+)',
-        ]
-        
-        for pattern in mother_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                parents_info["mother_surname"] = match.group(1)
-                break
+        mother_surname = _search_fused(_MOTHER_RE, text, _MOTHER_ANCHORS)
+        if mother_surname:
+            parents_info["mother_surname"] = mother_surname
         
         return parents_info
     
-    def _validate_birth_date(self, birth_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate birth date is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": birth_info
-        }
-        
-        if birth_info.get("date_found"):
-            result["valid"] = True
-            result["recommendations"].append("Birth date found and validated")
-        else:
-            result["issues"].append("Birth date not found in document")
-            result["recommendations"].append("Ensure the document contains clear birth date information")
-        
-        return result
-    
-    def _validate_birth_certificate_stamp(self, stamp_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate official stamp presence"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": stamp_info
-        }
-        
-        if stamp_info.get("has_stamp"):
-            result["valid"] = True
-            result["recommendations"].append("Official stamp or seal detected")
-        else:
-            result["issues"].append("Official stamp or seal not detected")
-            result["recommendations"].append("Ensure the document has an official stamp or seal")
-        
-        return result
+    _validate_birth_date = _presence_validator("date_found", "Birth date found and validated", "Birth date not found in document", "Ensure the document contains clear birth date information")
+    _validate_birth_certificate_stamp = _presence_validator("has_stamp", "Official stamp or seal detected", "Official stamp or seal not detected", "Ensure the document has an official stamp or seal")
     
-    def _validate_parents_names(self, parents_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_parents_names(self, parents_info: Dict[str, Any]) -> ValidationCheck:
         """Validate parents names are present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": parents_info
-        }
-        
         has_father = bool(parents_info.get("father_surname"))
         has_mother = bool(parents_info.get("mother_surname"))
         
         if has_father and has_mother:
-            result["valid"] = True
-            result["recommendations"].append("Both parents' names found and validated")
+            return ValidationCheck(True, recommendations=("Both parents' names found and validated",), details=parents_info)
         elif has_father or has_mother:
-            result["issues"].append("Only one parent's name found")
-            result["recommendations"].append("Ensure both parents' names are clearly visible")
+            return ValidationCheck(
+                False,
+                ("Only one parent's name found",),
+                ("Ensure both parents' names are clearly visible",),
+                details=parents_info
+            )
         else:
-            result["issues"].append("Parents' names not found in document")
-            result["recommendations"].append("Ensure the document contains clear parents' names")
-        
-        return result
+            return ValidationCheck(
+                False,
+                ("Parents' names not found in document",),
+                ("Ensure the document contains clear parents' names",),
+                details=parents_info
+            )
     
     def _extract_confirmation_info(self, text: str) -> Dict[str, Any]:
         """Extract confirmation information from hotel reservation text"""
-        confirmation_info = {}
-        
         # Confirmation patterns
-        confirmation_patterns = [
-            r'(onay|confirmation|confirmed|rezervasyon\s*onayı)',
-            r'(booking\s*confirmed|reservation\s*confirmed)',
-            r'(rezervasyon\s*numarası|booking\s*number)',
-            r'(confirmation\s*number)',
-        ]
-        
-        for pattern in confirmation_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                confirmation_info["has_confirmation"] = True
-                confirmation_info["confirmation_text"] = match.group(1)
-                break
-        
-        if not confirmation_info:
-            confirmation_info["has_confirmation"] = False
-        
-        return confirmation_info
+        confirmation_text = _scan_document_fields(_HOTEL_RESERVATION_RE, _HOTEL_RESERVATION_FIELDS, text).get("confirmation_text")
+        if confirmation_text:
+            return {"has_confirmation": True, "confirmation_text": confirmation_text}
+        return {"has_confirmation": False}
     
     def _extract_reservation_dates(self, text: str) -> Dict[str, Any]:
         """Extract reservation dates from hotel reservation text"""
         dates_info = {}
         
         # Date patterns
-        date_patterns = [
-            r'(\d{1,2})[./](\d{1,2})[./](\d{4})',  # DD/MM/YYYY
-            r'(\d{4})[./](\d{1,2})[./](\d{1,2})',  # YYYY/MM/DD
-            r'(check-in|check-out|giriş|çıkış)',
-            r'(arrival|departure|varış|ayrılış)',
-        ]
-        
-        dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if len(match) == 3 and match[0].isdigit():
-                    try:
-                        day, month, year = match
-                        date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        dates.append(datetime.strptime(date_str, "%Y-%m-%d"))
-                    except ValueError:
-                        continue
+        dates = _collect_day_first_dates(_RESERVATION_DATE_PATTERNS, text)
         
         if dates:
             dates_info["dates"] = dates
-            dates_info["check_in"] = min(dates) if dates else None
-            dates_info["check_out"] = max(dates) if dates else None
+            dates_info["check_in"] = min(dates)
+            dates_info["check_out"] = max(dates)
         
         return dates_info
     
     def _extract_hotel_info(self, text: str) -> Dict[str, Any]:
         """Extract hotel information from hotel reservation text"""
-        hotel_info = {}
-        
         # Hotel name patterns
-        hotel_patterns = [
-            r'(otel|hotel|konaklama|accommodation)',
-            r'(resort|motel|hostel|pansiyon)',
-        ]
-        
-        for pattern in hotel_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                hotel_info["has_hotel"] = True
-                hotel_info["hotel_text"] = match.group(1)
-                break
-        
-        if not hotel_info:
-            hotel_info["has_hotel"] = False
-        
-        return hotel_info
+        hotel_text = _scan_document_fields(_HOTEL_RESERVATION_RE, _HOTEL_RESERVATION_FIELDS, text).get("hotel_text")
+        if hotel_text:
+            return {"has_hotel": True, "hotel_text": hotel_text}
+        return {"has_hotel": False}
     
     def _extract_payment_info(self, text: str) -> Dict[str, Any]:
         """Extract payment information from hotel reservation text"""
-        payment_info = {}
-        
         # Payment patterns
-        payment_patterns = [
-            r'(ödeme|payment|paid|ücret|fee)',
-            r'(credit\s*card|debit\s*card|kredi\s*kartı)',
-            r'(total|toplam|amount|miktar)',
-        ]
-        
-        for pattern in payment_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                payment_info["has_payment"] = True
-                payment_info["payment_text"] = match.group(1)
-                break
-        
-        if not payment_info:
-            payment_info["has_payment"] = False
-        
-        return payment_info
+        payment_text = _scan_document_fields(_HOTEL_RESERVATION_RE, _HOTEL_RESERVATION_FIELDS, text).get("payment_text")
+        if payment_text:
+            return {"has_payment": True, "payment_text": payment_text}
+        return {"has_payment": False}
     
-    def _validate_confirmation(self, confirmation_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate confirmation is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": confirmation_info
-        }
-        
-        if confirmation_info.get("has_confirmation"):
-            result["valid"] = True
-            result["recommendations"].append("Reservation confirmation found")
-        else:
-            result["issues"].append("Reservation confirmation not found")
-            result["recommendations"].append("Ensure the document contains confirmation details")
-        
-        return result
-    
-    def _validate_reservation_dates(self, dates_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate reservation dates are present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": dates_info
-        }
-        
-        if dates_info.get("dates"):
-            result["valid"] = True
-            result["recommendations"].append("Reservation dates found and validated")
-        else:
-            result["issues"].append("Reservation dates not found")
-            result["recommendations"].append("Ensure the document contains check-in and check-out dates")
-        
-        return result
-    
-    def _validate_hotel_reservation(self, hotel_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate hotel reservation details are present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": hotel_info
-        }
-        
-        if hotel_info.get("has_hotel"):
-            result["valid"] = True
-            result["recommendations"].append("Hotel reservation details found")
-        else:
-            result["issues"].append("Hotel reservation details not found")
-            result["recommendations"].append("Ensure the document contains hotel or accommodation details")
-        
-        return result
-    
-    def _validate_payment_proof(self, payment_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate payment proof is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": payment_info
-        }
-        
-        if payment_info.get("has_payment"):
-            result["valid"] = True
-            result["recommendations"].append("Payment proof found")
-        else:
-            result["issues"].append("Payment proof not found")
-            result["recommendations"].append("Ensure the document contains payment or fee information")
-        
-        return result
+    _validate_confirmation = _presence_validator("has_confirmation", "Reservation confirmation found", "Reservation confirmation not found", "Ensure the document contains confirmation details")
+    _validate_reservation_dates = _presence_validator("dates", "Reservation dates found and validated", "Reservation dates not found", "Ensure the document contains check-in and check-out dates")
+    _validate_hotel_reservation = _presence_validator("has_hotel", "Hotel reservation details found", "Hotel reservation details not found", "Ensure the document contains hotel or accommodation details")
+    _validate_payment_proof = _presence_validator("has_payment", "Payment proof found", "Payment proof not found", "Ensure the document contains payment or fee information")
     
     def _extract_host_contact_info(self, text: str) -> Dict[str, Any]:
         """Extract host contact information from invitation letter text"""
-        contact_info = {}
-        
         # Contact patterns
-        contact_patterns = [
-            r'(phone|telefon|tel|mobile|cep)',
-            r'(email|e-mail|mail)',
-            r'(address|adres|adress)',
-            r'(contact|iletişim)',
-        ]
-        
-        for pattern in contact_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                contact_info["has_contact"] = True
-                contact_info["contact_text"] = match.group(1)
-                break
-        
-        if not contact_info:
-            contact_info["has_contact"] = False
-        
-        return contact_info
+        contact_text = _scan_document_fields(_INVITATION_LETTER_RE, _INVITATION_LETTER_FIELDS, text).get("contact_text")
+        if contact_text:
+            return {"has_contact": True, "contact_text": contact_text}
+        return {"has_contact": False}
     
     def _extract_host_info(self, text: str) -> Dict[str, Any]:
         """Extract host information from invitation letter text"""
-        host_info = {}
-        
         # Host patterns
-        host_patterns = [
-            r'(host|ev sahibi|davet eden)',
-            r'(student|öğrenci|student at)',
-            r'(university|üniversite|college|kolej)',
-            r'(inviting|davet ediyorum)',
-        ]
-        
-        for pattern in host_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                host_info["has_host"] = True
-                host_info["host_text"] = match.group(1)
-                break
-        
-        if not host_info:
-            host_info["has_host"] = False
-        
-        return host_info
+        host_text = _scan_document_fields(_INVITATION_LETTER_RE, _INVITATION_LETTER_FIELDS, text).get("host_text")
+        if host_text:
+            return {"has_host": True, "host_text": host_text}
+        return {"has_host": False}
     
     def _extract_invitation_dates(self, text: str) -> Dict[str, Any]:
         """Extract invitation dates from invitation letter text"""
         dates_info = {}
         
         # Date patterns
-        date_patterns = [
-            r'(\d{1,2})[./](\d{1,2})[./](\d{4})',  # DD/MM/YYYY
-            r'(\d{4})[./](\d{1,2})[./](\d{1,2})',  # YYYY/MM/DD
-            r'(from|from|başlangıç|start)',
-            r'(to|until|bitiş|end)',
-        ]
-        
-        dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if len(match) == 3 and match[0].isdigit():
-                    try:
-                        day, month, year = match
-                        date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        dates.append(datetime.strptime(date_str, "%Y-%m-%d"))
-                    except ValueError:
-                        continue
+        dates = _collect_day_first_dates(_INVITATION_DATE_PATTERNS, text)
         
         if dates:
             dates_info["dates"] = dates
-            dates_info["start_date"] = min(dates) if dates else None
-            dates_info["end_date"] = max(dates) if dates else None
-        
-        return dates_info
-    
-    def _extract_signature_info(self, text: str) -> Dict[str, Any]:
-        """Extract signature information from invitation letter text"""
-        signature_info = {}
-        
-        # Signature patterns
-        signature_patterns = [
-            r'(signature|imza|signed|imzalı)',
-            r'(sincerely|saygılarımla|respectfully)',
-            r'(yours truly|samimi saygılarımla)',
-        ]
-        
-        for pattern in signature_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                signature_info["has_signature"] = True
-                signature_info["signature_text"] = match.group(1)
-                break
-        
-        if not signature_info:
-            signature_info["has_signature"] = False
-        
-        return signature_info
-    
-    def _validate_host_contact(self, contact_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate host contact information is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": contact_info
-        }
-        
-        if contact_info.get("has_contact"):
-            result["valid"] = True
-            result["recommendations"].append("Host contact information found")
-        else:
-            result["issues"].append("Host contact information not found")
-            result["recommendations"].append("Ensure the document contains host contact details (phone, email, address)")
-        
-        return result
-    
-    def _validate_host_info(self, host_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate host information is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": host_info
-        }
-        
-        if host_info.get("has_host"):
-            result["valid"] = True
-            result["recommendations"].append("Host information found")
-        else:
-            result["issues"].append("Host information not found")
-            result["recommendations"].append("Ensure the document contains host details (name, status, affiliation)")
-        
-        return result
-    
-    def _validate_invitation_dates(self, dates_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate invitation dates are present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": dates_info
-        }
-        
-        if dates_info.get("dates"):
-            result["valid"] = True
-            result["recommendations"].append("Invitation dates found and validated")
-        else:
-            result["issues"].append("Invitation dates not found")
-            result["recommendations"].append("Ensure the document contains visit start and end dates")
-        
-        return result
-    
-    def _validate_signature(self, signature_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate signature is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": signature_info
-        }
-        
-        if signature_info.get("has_signature"):
-            result["valid"] = True
-            result["recommendations"].append("Signature found")
-        else:
-            result["issues"].append("Signature not found")
-            result["recommendations"].append("Ensure the document contains a signature")
+            dates_info["start_date"] = min(dates)
+            dates_info["end_date"] = max(dates)
         
-        return result
+        return dates_info
+    
+    def _extract_signature_info(self, text: str) -> Dict[str, Any]:
+        """Extract signature information from invitation letter text"""
+        # Signature patterns
+        signature_text = _scan_document_fields(_INVITATION_LETTER_RE, _INVITATION_LETTER_FIELDS, text).get("signature_text")
+        if signature_text:
+            return {"has_signature": True, "signature_text": signature_text}
+        return {"has_signature": False}
+    
+    _validate_host_contact = _presence_validator("has_contact", "Host contact information found", "Host contact information not found", "Ensure the document contains host contact details (phone, email, address)")
+    _validate_host_info = _presence_validator("has_host", "Host information found", "Host information not found", "Ensure the document contains host details (name, status, affiliation)")
+    _validate_invitation_dates = _presence_validator("dates", "Invitation dates found and validated", "Invitation dates not found", "Ensure the document contains visit start and end dates")
+    _validate_signature = _presence_validator("has_signature", "Signature found", "Signature not found", "Ensure the document contains a signature")
     
     def _extract_visa_info(self, text: str) -> Dict[str, Any]:
         """Extract visa information from previous visas text"""
-        visa_info = {}
-        
         # Visa patterns
-        visa_patterns = [
-            r'(visa|vize|vizum)',
-            r'(schengen|schengen states)',
-            r'(valid|geçerli|validity)',
-            r'(expired|süresi dolmuş)',
-        ]
-        
-        for pattern in visa_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                visa_info["has_visa"] = True
-                visa_info["visa_text"] = match.group(1)
-                break
-        
-        if not visa_info:
-            visa_info["has_visa"] = False
-        
-        return visa_info
+        visa_text = _search_fused(_VISA_RE, text)
+        if visa_text:
+            return {"has_visa": True, "visa_text": visa_text}
+        return {"has_visa": False}
     
     def _extract_visa_country_info(self, text: str) -> Dict[str, Any]:
         """Extract visa country information from previous visas text"""
         country_info = {}
         
-        # Country code patterns
-        country_patterns = [
-            r'\b([A-Z]{3})\b',  # 3-letter country codes
-            r'(SVN|DEU|FRA|ITA|ESP|NLD|BEL|AUT|PRT|GRC|FIN|SWE|DNK|POL|CZE|HUN|SVK|SVN|LTU|LVA|EST|MLT|CYP|LUX|IRL)',
-            r'(slovenia|germany|france|italy|spain|netherlands|belgium|austria|portugal|greece|finland|sweden|denmark|poland|czech|hungary|slovakia|lithuania|latvia|estonia|malta|cyprus|luxembourg|ireland)',
-        ]
-        
-        countries = []
-        for pattern in country_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    countries.extend(match)
-                else:
-                    countries.append(match)
+        # Country code patterns, deduplicated as they are collected
+        countries = set()
+        for match in _VISA_COUNTRY_RE.finditer(text):
+            code, name = match.groups()
+            if name:
+                countries.add(name)
+            elif code.upper() in _EU_CODES:
+                countries.add(code)
         
         if countries:
             country_info["has_country"] = True
-            country_info["countries"] = list(set(countries))
+            country_info["countries"] = list(countries)
         else:
             country_info["has_country"] = False
         
@@ -2501,555 +2369,163 @@ class OCRService:
         dates_info = {}
         
         # Date patterns
-        date_patterns = [
-            r'(\d{1,2})[./-](\d{1,2})[./-](\d{2,4})',  # DD/MM/YYYY
-            r'(\d{4})[./-](\d{1,2})[./-](\d{1,2})',  # YYYY/MM/DD
-            r'(from|until|valid from|valid until)',
-        ]
-        
-        dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if len(match) == 3 and match[0].isdigit():
-                    try:
-                        if len(match[2]) == 2:
-                            year = "20" + match[2]
-                        else:
-                            year = match[2]
-                        
-                        day, month = match[0], match[1]
-                        date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        dates.append(datetime.strptime(date_str, "%Y-%m-%d"))
-                    except ValueError:
-                        continue
+        dates = _collect_day_first_dates(_VISA_DATE_PATTERNS, text, century="20")
         
         if dates:
             dates_info["dates"] = dates
-            dates_info["start_date"] = min(dates) if dates else None
-            dates_info["end_date"] = max(dates) if dates else None
+            dates_info["start_date"] = min(dates)
+            dates_info["end_date"] = max(dates)
         
         return dates_info
     
-    def _validate_visa_validity(self, visa_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate visa validity is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": visa_info
-        }
-        
-        if visa_info.get("has_visa"):
-            result["valid"] = True
-            result["recommendations"].append("Visa information found")
-        else:
-            result["issues"].append("Visa information not found")
-            result["recommendations"].append("Ensure the document contains visa information")
-        
-        return result
-    
-    def _validate_visa_country(self, country_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate visa country is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": country_info
-        }
-        
-        if country_info.get("has_country"):
-            result["valid"] = True
-            result["recommendations"].append("Visa country information found")
-        else:
-            result["issues"].append("Visa country information not found")
-            result["recommendations"].append("Ensure the document contains visa country information")
-        
-        return result
-    
-    def _validate_visa_dates(self, dates_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate visa dates are present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": dates_info
-        }
-        
-        if dates_info.get("dates"):
-            result["valid"] = True
-            result["recommendations"].append("Visa dates found and validated")
-        else:
-            result["issues"].append("Visa dates not found")
-            result["recommendations"].append("Ensure the document contains visa validity dates")
-        
-        return result
+    _validate_visa_validity = _presence_validator("has_visa", "Visa information found", "Visa information not found", "Ensure the document contains visa information")
+    _validate_visa_country = _presence_validator("has_country", "Visa country information found", "Visa country information not found", "Ensure the document contains visa country information")
+    _validate_visa_dates = _presence_validator("dates", "Visa dates found and validated", "Visa dates not found", "Ensure the document contains visa validity dates")
     
     def _extract_property_deed_stamp(self, text: str) -> Dict[str, Any]:
         """Extract official stamp information from property deed text"""
-        stamp_info = {}
-        
         # Stamp patterns
-        stamp_patterns = [
-            r'(mühür|kaşe|stamp|seal)',
-            r'(siciline uygundur|conforms to the record)',
-            r'(verily|verified)',
-            r'(tapu|property deed)',
-        ]
-        
-        for pattern in stamp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                stamp_info["has_stamp"] = True
-                stamp_info["stamp_text"] = match.group(1)
-                break
-        
-        if not stamp_info:
-            stamp_info["has_stamp"] = False
-        
-        return stamp_info
+        stamp_text = _scan_document_fields(_PROPERTY_DEED_RE, _PROPERTY_DEED_FIELDS, text).get("stamp_text")
+        if stamp_text:
+            return {"has_stamp": True, "stamp_text": stamp_text}
+        return {"has_stamp": False}
     
     def _extract_property_owner_info(self, text: str) -> Dict[str, Any]:
         """Extract property owner information from property deed text"""
-        owner_info = {}
-        
         # Owner patterns
-        owner_patterns = [
-            r'(malik|owner|sahip)',
-            r'(adı soyadı|name|surname)',
-            r'(baba adı|father\'s name)',
-            r'(hissesi|share)',
-        ]
-        
-        for pattern in owner_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                owner_info["has_owner"] = True
-                owner_info["owner_text"] = match.group(1)
-                break
-        
-        if not owner_info:
-            owner_info["has_owner"] = False
-        
-        return owner_info
+        owner_text = _scan_document_fields(_PROPERTY_DEED_RE, _PROPERTY_DEED_FIELDS, text).get("owner_text")
+        if owner_text:
+            return {"has_owner": True, "owner_text": owner_text}
+        return {"has_owner": False}
     
     def _extract_property_value_info(self, text: str) -> Dict[str, Any]:
         """Extract property value information from property deed text"""
-        value_info = {}
-        
         # Value patterns
-        value_patterns = [
-            r'(işlem bedeli|transaction price|purchase price)',
-            r'(bedel|price|value)',
-            r'(\d+\.?\d*\s*(tl|try|₺|euro|eur|usd|\$))',
-            r'(\d+\.?\d*\s*(bin|million|milyon))',
-        ]
-        
-        for pattern in value_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                value_info["has_value"] = True
-                value_info["value_text"] = match.group(1)
-                break
-        
-        if not value_info:
-            value_info["has_value"] = False
-        
-        return value_info
-    
-    def _validate_property_deed_stamp(self, stamp_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate official stamp is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": stamp_info
-        }
-        
-        if stamp_info.get("has_stamp"):
-            result["valid"] = True
-            result["recommendations"].append("Official stamp or seal detected")
-        else:
-            result["issues"].append("Official stamp or seal not detected")
-            result["recommendations"].append("Ensure the document contains an official stamp or seal")
-        
-        return result
+        value_text = _scan_document_fields(_PROPERTY_DEED_RE, _PROPERTY_DEED_FIELDS, text).get("value_text")
+        if value_text:
+            return {"has_value": True, "value_text": value_text}
+        return {"has_value": False}
     
-    def _validate_property_owner(self, owner_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate property owner information is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": owner_info
-        }
-        
-        if owner_info.get("has_owner"):
-            result["valid"] = True
-            result["recommendations"].append("Property owner information found")
-        else:
-            result["issues"].append("Property owner information not found")
-            result["recommendations"].append("Ensure the document contains property owner details")
-        
-        return result
-    
-    def _validate_property_value(self, value_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate property value information is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": value_info
-        }
-        
-        if value_info.get("has_value"):
-            result["valid"] = True
-            result["recommendations"].append("Property value information found")
-        else:
-            result["issues"].append("Property value information not found")
-            result["recommendations"].append("Ensure the document contains property value information")
-        
-        return result
+    _validate_property_deed_stamp = _presence_validator("has_stamp", "Official stamp or seal detected", "Official stamp or seal not detected", "Ensure the document contains an official stamp or seal")
+    _validate_property_owner = _presence_validator("has_owner", "Property owner information found", "Property owner information not found", "Ensure the document contains property owner details")
+    _validate_property_value = _presence_validator("has_value", "Property value information found", "Property value information not found", "Ensure the document contains property value information")
     
     def _extract_active_status_info(self, text: str) -> Dict[str, Any]:
         """Extract active status information from social security text"""
-        status_info = {}
-        
         # Active status patterns
-        status_patterns = [
-            r'(çalışmaktadır|is working|active|aktif)',
-            r'(faaliyet gösteren|operating)',
-            r'(tescili bulunduğu|registration exists)',
-            r'(işyerinde|at workplace)',
-        ]
-        
-        for pattern in status_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                status_info["is_active"] = True
-                status_info["status_text"] = match.group(1)
-                break
-        
-        if not status_info:
-            status_info["is_active"] = False
-        
-        return status_info
+        status_text = _scan_document_fields(_SOCIAL_SECURITY_RE, _SOCIAL_SECURITY_FIELDS, text).get("status_text")
+        if status_text:
+            return {"is_active": True, "status_text": status_text}
+        return {"is_active": False}
     
     def _extract_registration_date_info(self, text: str) -> Dict[str, Any]:
         """Extract registration date information from social security text"""
         date_info = {}
         
         # Date patterns
-        date_patterns = [
-            r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # DD/MM/YYYY
-            r'(\d{1,2}/\d{1,2}/\d{4})',  # Date format
-            r'(tarihinden itibaren|as of|from)',
-        ]
-        
-        dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple) and len(match) == 3:
-                    try:
-                        day, month, year = match
-                        date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        dates.append(datetime.strptime(date_str, "%Y-%m-%d"))
-                    except ValueError:
-                        continue
+        dates = _collect_day_first_dates(_REGISTRATION_DATE_PATTERNS, text)
         
         if dates:
             date_info["dates"] = dates
-            date_info["registration_date"] = min(dates) if dates else None
+            date_info["registration_date"] = min(dates)
         
         return date_info
     
     def _extract_sgk_number_info(self, text: str) -> Dict[str, Any]:
         """Extract SGK number information from social security text"""
-        number_info = {}
-        
-        # SGK number patterns
-        number_patterns = [
-            r'(sigorta sicil numarası|social security number|sgk number)',
-            r'(\d{10,12})',  # 10-12 digit numbers
-            r'(601\d{9})',  # SGK format
-        ]
-        
-        for pattern in number_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                number_info["has_number"] = True
-                if match.group(0).isdigit():
-                    number_info["sgk_number"] = match.group(0)
-                break
-        
-        if not number_info:
-            number_info["has_number"] = False
-        
-        return number_info
-    
-    def _validate_active_status(self, status_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate active status is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": status_info
-        }
-        
-        if status_info.get("is_active"):
-            result["valid"] = True
-            result["recommendations"].append("Active employment status found")
-        else:
-            result["issues"].append("Active employment status not found")
-            result["recommendations"].append("Ensure the document contains active employment status")
-        
-        return result
-    
-    def _validate_registration_date(self, date_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate registration date is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": date_info
-        }
-        
-        if date_info.get("dates"):
-            result["valid"] = True
-            result["recommendations"].append("Registration date found and validated")
-        else:
-            result["issues"].append("Registration date not found")
-            result["recommendations"].append("Ensure the document contains registration date")
-        
-        return result
-    
-    def _validate_sgk_number(self, number_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate SGK number is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": number_info
-        }
-        
-        if number_info.get("has_number"):
-            result["valid"] = True
-            result["recommendations"].append("SGK number found")
-        else:
-            result["issues"].append("SGK number not found")
-            result["recommendations"].append("Ensure the document contains SGK number")
-        
-        return result
+        # SGK number patterns; a bare label reports the number without its digits
+        number_text = _scan_document_fields(_SOCIAL_SECURITY_RE, _SOCIAL_SECURITY_FIELDS, text).get("number_text")
+        if not number_text:
+            return {"has_number": False}
+        if number_text.isdigit():
+            return {"has_number": True, "sgk_number": number_text}
+        return {"has_number": True}
+    
+    _validate_active_status = _presence_validator("is_active", "Active employment status found", "Active employment status not found", "Ensure the document contains active employment status")
+    _validate_registration_date = _presence_validator("dates", "Registration date found and validated", "Registration date not found", "Ensure the document contains registration date")
+    _validate_sgk_number = _presence_validator("has_number", "SGK number found", "SGK number not found", "Ensure the document contains SGK number")
     
     def _extract_student_certificate_issue_date(self, text: str) -> Dict[str, Any]:
         """Extract issue date from student certificate text"""
         date_info = {}
         
         # Date patterns
-        date_patterns = [
-            r'(\d{1,2})\.(\d{1,2})\.(\d{4})',  # DD.MM.YYYY
-            r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # DD/MM/YYYY
-        ]
-        
-        dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    day, month, year = match
-                    date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                    dates.append(datetime.strptime(date_str, "%Y-%m-%d"))
-                except ValueError:
-                    continue
+        dates = _collect_day_first_dates(_STUDENT_CERTIFICATE_DATE_PATTERNS, text)
         
         if dates:
             date_info["dates"] = dates
-            date_info["issue_date"] = min(dates) if dates else None
+            date_info["issue_date"] = min(dates)
         
         return date_info
     
     def _extract_school_name_info(self, text: str) -> Dict[str, Any]:
         """Extract school name information from student certificate text"""
-        school_info = {}
-        
         # School name patterns
-        school_patterns = [
-            r'(üniversite|university|universitesi)',
-            r'(yükseköğretim|higher education)',
-            r'(fakülte|faculty)',
-            r'(bölüm|department)',
-            r'(yök|yükseköğretim kurulu)',
-        ]
-        
-        for pattern in school_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                school_info["has_school"] = True
-                school_info["school_text"] = match.group(1)
-                break
-        
-        if not school_info:
-            school_info["has_school"] = False
-        
-        return school_info
+        school_text = _search_fused(_SCHOOL_NAME_RE, text)
+        if school_text:
+            return {"has_school": True, "school_text": school_text}
+        return {"has_school": False}
     
     def _extract_school_stamp_info(self, text: str) -> Dict[str, Any]:
         """Extract school stamp information from student certificate text"""
-        stamp_info = {}
-        
         # Stamp patterns
-        stamp_patterns = [
-            r'(mühür|kaşe|stamp|seal)',
-            r'(yök|yükseköğretim kurulu)',
-            r'(üniversite|university|universitesi)',
-            r'(logo|emblem)',
-            r'(baskalik|presidency)',
-            r'(ankara)',
-        ]
-        
-        for pattern in stamp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                stamp_info["has_stamp"] = True
-                stamp_info["stamp_text"] = match.group(1)
-                break
-        
-        if not stamp_info:
-            stamp_info["has_stamp"] = False
-        
-        return stamp_info
+        stamp_text = _search_fused(_SCHOOL_STAMP_RE, text)
+        if stamp_text:
+            return {"has_stamp": True, "stamp_text": stamp_text}
+        return {"has_stamp": False}
     
     def _extract_student_certificate_signature(self, text: str) -> Dict[str, Any]:
         """Extract signature information from student certificate text"""
-        signature_info = {}
-        
         # Signature patterns
-        signature_patterns = [
-            r'(imza|signature)',
-            r'(signed|imzalı)',
-            r'(başkan|president|baskalik)',
-            r'(müdür|director)',
-            r'(ilgili makama|to whom it may concern)',
-            r'(bildirilmiştir|certified)',
-        ]
-        
-        for pattern in signature_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                signature_info["has_signature"] = True
-                signature_info["signature_text"] = match.group(1)
-                break
-        
-        if not signature_info:
-            signature_info["has_signature"] = False
-        
-        return signature_info
+        signature_text = _search_fused(_STUDENT_CERTIFICATE_SIGNATURE_RE, text)
+        if signature_text:
+            return {"has_signature": True, "signature_text": signature_text}
+        return {"has_signature": False}
     
-    def _validate_student_certificate_issue_date(self, date_info: Dict[str, Any], max_age_in_days: int) -> Dict[str, Any]:
+    def _validate_student_certificate_issue_date(self, date_info: Dict[str, Any], max_age_in_days: int, now: Optional[datetime] = None) -> ValidationCheck:
         """Validate student certificate issue date is recent"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": date_info
-        }
-        
         if date_info.get("issue_date"):
             issue_date = date_info["issue_date"]
-            today = datetime.now()
+            today = now or datetime.now()
             age_in_days = (today - issue_date).days
             
             if age_in_days <= max_age_in_days:
-                result["valid"] = True
-                result["recommendations"].append(f"Certificate is recent (issued {age_in_days} days ago)")
+                return ValidationCheck(
+                    True,
+                    recommendations=(f"Certificate is recent (issued {age_in_days} days ago)",),
+                    details=date_info
+                )
             else:
-                result["issues"].append(f"Certificate is too old (issued {age_in_days} days ago, max {max_age_in_days} days)")
-                result["recommendations"].append(f"Ensure the certificate was issued within the last {max_age_in_days} days")
-        else:
-            result["issues"].append("Issue date not found")
-            result["recommendations"].append("Ensure the document contains an issue date")
-        
-        return result
-    
-    def _validate_school_name(self, school_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate school name is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": school_info
-        }
-        
-        if school_info.get("has_school"):
-            result["valid"] = True
-            result["recommendations"].append("School name found")
-        else:
-            result["issues"].append("School name not found")
-            result["recommendations"].append("Ensure the document contains school name")
-        
-        return result
-    
-    def _validate_school_stamp(self, stamp_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate school stamp is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": stamp_info
-        }
-        
-        if stamp_info.get("has_stamp"):
-            result["valid"] = True
-            result["recommendations"].append("School stamp or emblem detected")
+                return ValidationCheck(
+                    False,
+                    (f"Certificate is too old (issued {age_in_days} days ago, max {max_age_in_days} days)",),
+                    (f"Ensure the certificate was issued within the last {max_age_in_days} days",),
+                    details=date_info
+                )
         else:
-            result["issues"].append("School stamp or emblem not detected")
-            result["recommendations"].append("Ensure the document contains school stamp or emblem")
-        
-        return result
+            return ValidationCheck(
+                False,
+                ("Issue date not found",),
+                ("Ensure the document contains an issue date",),
+                details=date_info
+            )
     
-    def _validate_student_certificate_signature(self, signature_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate signature is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": signature_info
-        }
-        
-        if signature_info.get("has_signature"):
-            result["valid"] = True
-            result["recommendations"].append("Signature found")
-        else:
-            result["issues"].append("Signature not found")
-            result["recommendations"].append("Ensure the document contains a signature")
-        
-        return result
+    _validate_school_name = _presence_validator("has_school", "School name found", "School name not found", "Ensure the document contains school name")
+    _validate_school_stamp = _presence_validator("has_stamp", "School stamp or emblem detected", "School stamp or emblem not detected", "Ensure the document contains school stamp or emblem")
+    _validate_student_certificate_signature = _presence_validator("has_signature", "Signature found", "Signature not found", "Ensure the document contains a signature")
     
     def _extract_income_amount_info(self, text: str) -> Dict[str, Any]:
         """Extract income amount information from tax return text"""
         amount_info = {}
         
-        # Income amount patterns
-        amount_patterns = [
-            r'(gelir|income|kazanç)',
-            r'(toplam|total|sum)',
-            r'(\d+\.?\d*\.?\d*,\d{2})',  # Turkish number format
-            r'(\d+,\d{3}\.\d{2})',  # Alternative format
+        # Income amount matches hold digits with dots and exactly one comma, so the Turkish format
+        # translation always leaves a valid float
+        amounts = [
+            float(match.translate(_TURKISH_AMOUNT_TRANS))
+            for pattern in _INCOME_AMOUNT_PATTERNS
+            for match in pattern.findall(text)
         ]
         
-        amounts = []
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, str) and match.replace('.', '').replace(',', '').isdigit():
-                    # Clean and parse Turkish number format
-                    cleaned = match.replace('.', '').replace(',', '.')
-                    try:
-                        amounts.append(float(cleaned))
-                    except ValueError:
-                        continue
-        
         if amounts:
             amount_info["has_amount"] = True
             amount_info["amounts"] = amounts
@@ -3061,136 +2537,40 @@ class OCRService:
     
     def _extract_tax_office_stamp_info(self, text: str) -> Dict[str, Any]:
         """Extract tax office stamp information from tax return text"""
-        stamp_info = {}
-        
         # Tax office stamp patterns
-        stamp_patterns = [
-            r'(vergi dairesi|tax office)',
-            r'(müdürlük|directorate)',
-            r'(onay|approval|approved)',
-            r'(mühür|kaşe|stamp|seal)',
-            r'(gelir idaresi|revenue administration)',
-        ]
-        
-        for pattern in stamp_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                stamp_info["has_stamp"] = True
-                stamp_info["stamp_text"] = match.group(1)
-                break
-        
-        if not stamp_info:
-            stamp_info["has_stamp"] = False
-        
-        return stamp_info
+        stamp_text = _search_fused(_TAX_OFFICE_STAMP_RE, text)
+        if stamp_text:
+            return {"has_stamp": True, "stamp_text": stamp_text}
+        return {"has_stamp": False}
     
     def _extract_tax_year_info(self, text: str) -> Dict[str, Any]:
         """Extract tax year information from tax return text"""
         year_info = {}
         
         # Year patterns
-        year_patterns = [
-            r'(yıl|year)\s*:?\s*(\d{4})',
-            r'(dönem|period)\s*:?\s*(\d{4})',
-            r'(\d{4})\s*(yıl|year)',
-        ]
-        
-        years = []
-        for pattern in year_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    for item in match:
-                        if item.isdigit() and len(item) == 4:
-                            years.append(int(item))
-                elif match.isdigit() and len(match) == 4:
-                    years.append(int(match))
+        years = [int(year) for pattern in _TAX_YEAR_PATTERNS for year in pattern.findall(text)]
         
         if years:
+            # dict.fromkeys dedups in first-seen order, and max then runs over the unique years
+            unique_years = list(dict.fromkeys(years))
             year_info["has_year"] = True
-            year_info["years"] = list(set(years))
-            year_info["tax_year"] = max(years) if years else None
+            year_info["years"] = unique_years
+            year_info["tax_year"] = max(unique_years)
         else:
             year_info["has_year"] = False
         
         return year_info
     
-    def _validate_income_amount(self, amount_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate income amount is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": amount_info
-        }
-        
-        if amount_info.get("has_amount"):
-            result["valid"] = True
-            result["recommendations"].append("Income amount found")
-        else:
-            result["issues"].append("Income amount not found")
-            result["recommendations"].append("Ensure the document contains income amount")
-        
-        return result
-    
-    def _validate_tax_office_stamp(self, stamp_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate tax office stamp is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": stamp_info
-        }
-        
-        if stamp_info.get("has_stamp"):
-            result["valid"] = True
-            result["recommendations"].append("Tax office stamp or approval found")
-        else:
-            result["issues"].append("Tax office stamp or approval not found")
-            result["recommendations"].append("Ensure the document contains tax office stamp or approval")
-        
-        return result
-    
-    def _validate_tax_year(self, year_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate tax year is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": year_info
-        }
-        
-        if year_info.get("has_year"):
-            result["valid"] = True
-            result["recommendations"].append("Tax year found and validated")
-        else:
-            result["issues"].append("Tax year not found")
-            result["recommendations"].append("Ensure the document contains tax year")
-        
-        return result
+    _validate_income_amount = _presence_validator("has_amount", "Income amount found", "Income amount not found", "Ensure the document contains income amount")
+    _validate_tax_office_stamp = _presence_validator("has_stamp", "Tax office stamp or approval found", "Tax office stamp or approval not found", "Ensure the document contains tax office stamp or approval")
+    _validate_tax_year = _presence_validator("has_year", "Tax year found and validated", "Tax year not found", "Ensure the document contains tax year")
     
     def _extract_coverage_amount_info(self, text: str) -> Dict[str, Any]:
         """Extract coverage amount information from travel insurance text"""
         amount_info = {}
         
         # Coverage amount patterns
-        amount_patterns = [
-            r'(sum insured|coverage|teminat)',
-            r'\$\s*(\d{1,3}(?:,\d{3})*)',  # Dollar amounts
-            r'(\d{1,3}(?:,\d{3})*)\s*(usd|eur|tl|try)',  # Amount with currency
-            r'(up to|maximum|max)\s*\$?\s*(\d{1,3}(?:,\d{3})*)',  # Up to amounts
-        ]
-        
-        amounts = []
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    for item in match:
-                        if item and item.replace(',', '').isdigit():
-                            amounts.append(item)
-                elif isinstance(match, str) and match.replace(',', '').isdigit():
-                    amounts.append(match)
+        amounts = [amount for pattern in _COVERAGE_AMOUNT_PATTERNS for amount in pattern.findall(text)]
         
         if amounts:
             amount_info["has_amount"] = True
@@ -3202,192 +2582,86 @@ class OCRService:
     
     def _extract_coverage_area_info(self, text: str) -> Dict[str, Any]:
         """Extract coverage area information from travel insurance text"""
-        area_info = {}
-        
         # Coverage area patterns
-        area_patterns = [
-            r'(destination|hedef|varış)',
-            r'(country|ülke|country of residence)',
-            r'(schengen|europe|european union)',
-            r'(jordan|turkey|germany|france|italy|spain|egypt|poland|netherlands|belgium|austria|switzerland|greece|croatia|czech|portugal|finland|sweden|denmark|norway)',
-            r'(worldwide|world-wide|tüm dünya)',
-        ]
-        
-        for pattern in area_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                area_info["has_area"] = True
-                area_info["area_text"] = match.group(1)
-                break
-        
-        if not area_info:
-            area_info["has_area"] = False
-        
-        return area_info
+        area_text = _search_fused(_COVERAGE_AREA_RE, text)
+        if area_text:
+            return {"has_area": True, "area_text": area_text}
+        return {"has_area": False}
     
     def _extract_validity_period_info(self, text: str) -> Dict[str, Any]:
         """Extract validity period information from travel insurance text"""
         period_info = {}
         
         # Date patterns
-        date_patterns = [
-            r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # DD/MM/YYYY
-            r'(from|to|başlangıç|bitiş)',
-        ]
-        
-        dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if len(match) == 3 and match[0].isdigit():
-                    try:
-                        day, month, year = match
-                        date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-                        dates.append(datetime.strptime(date_str, "%Y-%m-%d"))
-                    except ValueError:
-                        continue
+        dates = _collect_day_first_dates(_VALIDITY_DATE_PATTERNS, text)
         
         if dates:
             period_info["dates"] = dates
-            period_info["start_date"] = min(dates) if dates else None
-            period_info["end_date"] = max(dates) if dates else None
+            period_info["start_date"] = min(dates)
+            period_info["end_date"] = max(dates)
         
         return period_info
     
-    def _validate_coverage_amount(self, amount_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate coverage amount is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": amount_info
-        }
-        
-        if amount_info.get("has_amount"):
-            result["valid"] = True
-            result["recommendations"].append("Coverage amount found")
-        else:
-            result["issues"].append("Coverage amount not found")
-            result["recommendations"].append("Ensure the document contains coverage amount")
-        
-        return result
-    
-    def _validate_coverage_area(self, area_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate coverage area is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": area_info
-        }
-        
-        if area_info.get("has_area"):
-            result["valid"] = True
-            result["recommendations"].append("Coverage area found")
-        else:
-            result["issues"].append("Coverage area not found")
-            result["recommendations"].append("Ensure the document contains coverage area")
-        
-        return result
-    
-    def _validate_validity_period(self, period_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate validity period is present"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": period_info
-        }
-        
-        if period_info.get("dates"):
-            result["valid"] = True
-            result["recommendations"].append("Validity period found and validated")
-        else:
-            result["issues"].append("Validity period not found")
-            result["recommendations"].append("Ensure the document contains validity period")
-        
-        return result
+    _validate_coverage_amount = _presence_validator("has_amount", "Coverage amount found", "Coverage amount not found", "Ensure the document contains coverage amount")
+    _validate_coverage_area = _presence_validator("has_area", "Coverage area found", "Coverage area not found", "Ensure the document contains coverage area")
+    _validate_validity_period = _presence_validator("dates", "Validity period found and validated", "Validity period not found", "Ensure the document contains validity period")
     
-    def _validate_account_balance(self, balance_info: Dict[str, Any], min_threshold: float) -> Dict[str, Any]:
+    def _validate_account_balance(self, balance_info: Dict[str, Any], min_threshold: float) -> ValidationCheck:
         """Validate account balance meets minimum requirements"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": balance_info
-        }
-        
         if not balance_info.get("current_balance"):
-            result["issues"].append("Account balance not found in document")
-            result["recommendations"].append("Ensure the document contains clear balance information")
-            return result
+            return ValidationCheck(
+                False,
+                ("Account balance not found in document",),
+                ("Ensure the document contains clear balance information",),
+                details=balance_info
+            )
         
         current_balance = balance_info["current_balance"]["amount"]
         
         if current_balance < min_threshold:
-            result["issues"].append(f"Account balance ({current_balance}) is below minimum threshold ({min_threshold})")
-            result["recommendations"].append(f"Ensure account balance is at least {min_threshold} {balance_info['current_balance']['currency']}")
+            return ValidationCheck(
+                False,
+                (f"Account balance ({current_balance}) is below minimum threshold ({min_threshold})",),
+                (f"Ensure account balance is at least {min_threshold} {balance_info['current_balance']['currency']}",),
+                details=balance_info
+            )
         else:
-            result["valid"] = True
-            result["recommendations"].append("Account balance meets requirements")
-        
-        return result
+            return ValidationCheck(True, recommendations=("Account balance meets requirements",), details=balance_info)
     
-    def _validate_bank_stamp(self, stamp_info: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate bank stamp presence"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": stamp_info
-        }
-        
-        if not stamp_info.get("has_stamp"):
-            result["issues"].append("Bank stamp or seal not detected")
-            result["recommendations"].append("Ensure the document has an official bank stamp or seal")
-        else:
-            result["valid"] = True
-            result["recommendations"].append("Bank stamp detected successfully")
-        
-        return result
+    _validate_bank_stamp = _presence_validator("has_stamp", "Bank stamp detected successfully", "Bank stamp or seal not detected", "Ensure the document has an official bank stamp or seal")
     
-    def _validate_statement_period(self, period_info: Dict[str, Any], min_months: int) -> Dict[str, Any]:
+    def _validate_statement_period(self, period_info: Dict[str, Any], min_months: int) -> ValidationCheck:
         """Validate statement period covers minimum required months"""
-        result = {
-            "valid": False,
-            "issues": [],
-            "recommendations": [],
-            "details": period_info
-        }
-        
         if not period_info.get("duration_days"):
-            result["issues"].append("Statement period not clearly identifiable")
-            result["recommendations"].append("Ensure the document contains clear date information")
-            return result
+            return ValidationCheck(
+                False,
+                ("Statement period not clearly identifiable",),
+                ("Ensure the document contains clear date information",),
+                details=period_info
+            )
         
         duration_days = period_info["duration_days"]
         duration_months = duration_days / 30  # Approximate months
         
         if duration_months < min_months:
-            result["issues"].append(f"Statement period ({duration_months:.1f} months) is less than required ({min_months} months)")
-            result["recommendations"].append(f"Provide bank statements covering at least {min_months} months")
+            return ValidationCheck(
+                False,
+                (f"Statement period ({duration_months:.1f} months) is less than required ({min_months} months)",),
+                (f"Provide bank statements covering at least {min_months} months",),
+                details=period_info
+            )
         else:
-            result["valid"] = True
-            result["recommendations"].append(f"Statement period ({duration_months:.1f} months) meets requirements")
-        
-        return result
+            return ValidationCheck(
+                True,
+                recommendations=(f"Statement period ({duration_months:.1f} months) meets requirements",),
+                details=period_info
+            )
     
-    def _calculate_confidence_score(self, validation_results: Dict[str, Any]) -> float:
+    def _calculate_confidence_score(self, passed_validations: int, total_validations: int) -> float:
         """Calculate overall confidence score based on validation results"""
-        if not validation_results:
-            return 0.0
-        
-        total_validations = len(validation_results)
-        passed_validations = sum(1 for result in validation_results.values() if result.get("valid", False))
-        
         return passed_validations / total_validations if total_validations > 0 else 0.0
     
-    def _process_generic_document(self, text: str, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> OCRResult:
+    def _process_generic_document(self, text: str, config: Dict[str, Any], metadata: Mapping[str, Any] = _EMPTY_METADATA) -> OCRResult:
         """Process generic document types"""
         return OCRResult(
             document_type=DocumentType(config["checkId"]),
@@ -3401,21 +2675,33 @@ class OCRService:
     
     def get_document_type_config(self, document_type: str) -> Optional[Dict[str, Any]]:
         """Get configuration for a specific document type"""
-        try:
-            doc_type = DocumentType(document_type)
-            return self.document_type_configs.get(doc_type)
-        except ValueError:
-            return None
+        return self._configs_by_value.get(document_type)
     
     def list_supported_document_types(self) -> List[Dict[str, Any]]:
         """List all supported document types and their configurations"""
-        return [
-            {
-                "checkId": config["checkId"],
-                "docDescription": config["docDescription"],
-                "docName": config["docName"],
-                "ocrValidationRules": config["ocrValidationRules"].__dict__,
-                "requiredFor": config["requiredFor"]
-            }
-            for config in self.document_type_configs.values()
-        ]
+        return [deepcopy(document_type) for document_type in self._supported_document_types]
+
+
+# Service used by process_batch worker processes, created once per process by _start_worker
+_worker_service: Optional[OCRService] = None
+
+
+def _batch_mp_context():
+    """Start batch workers from a forkserver, or spawn them where forkserver is unavailable"""
+    # The pool starts inside a running server with live threads and gRPC clients, which a
+    # forked child could deadlock on, so workers come from a clean process. Windows has no
+    # forkserver, so they are spawned there
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _start_worker(document_type_configs: Mapping[DocumentType, Dict[str, Any]], extraction_workers: int) -> None:
+    """Build the batch worker's service with the configs and settings of the service that started it"""
+    global _worker_service
+    _worker_service = OCRService(extraction_workers, document_type_configs=document_type_configs)
+
+
+def _process_in_worker(document_type: str, extracted_text: str, file_metadata: Optional[Mapping[str, Any]]) -> OCRResult:
+    """Process one document inside a batch worker process"""
+    return _worker_service.process_document(document_type, extracted_text, file_metadata)
@@ -4,16 +4,53 @@ Automatically fills Schengen visa form fields using AI and user/application data
 Uses Groq's Llama 4 Scout model and generates Word documents
 """
 
+import asyncio
+import calendar
 import os
 import logging
-from typing import Dict, Any, Optional
-from groq import Groq
-from datetime import datetime
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from groq import AsyncGroq
+from datetime import datetime, timezone
 import json
 from app.core.config import settings
 
+# orjson is optional; its C parser decodes the model's JSON answer when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_FORM_FILLING_MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
+
+# Filled fields of identical form filling requests are reused instead of calling Groq again
+_FILL_CACHE_SIZE = 1024
+_FILL_CACHE_TTL_SECONDS = 3600
+
+# The day, month and year forms datetime.strptime accepts for "%d-%m-%Y"
+_DATE_RE = re.compile(r"(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])-(1[0-2]|0[1-9]|[1-9])-(\d\d\d\d)")
+
+
+@lru_cache(maxsize=1)
+def _async_groq_client() -> AsyncGroq:
+    """Return the async Groq client shared by every service instance, keeping its connection pool warm"""
+    return AsyncGroq(api_key=settings.groq_api_key)
+
+
+@lru_cache(maxsize=1)
+def _word_document_service():
+    """Return the Word document service shared by every generated document, checking its template once"""
+    from app.services.word_document_service import WordDocumentService
+    return WordDocumentService()
+
 
 class SchengenFormFillingService:
     """Service for automatically filling Schengen visa application forms"""
@@ -84,36 +121,33 @@ class SchengenFormFillingService:
         "field61": "Guardian signature placeholder"
     }
     
-    def __init__(self):
-        """Initialize Groq client"""
-        try:
-            api_key = settings.groq_api_key
-            self.client = Groq(api_key=api_key)
-            logger.info("Schengen Form Filling service initialized successfully")
-        except Exception as e:
-            logger.error(f"Error initializing Groq client: {e}")
-            self.client = None
+    _FORM_FIELDS_VIEW = MappingProxyType(FORM_FIELDS)
     
-    def is_available(self) -> bool:
-        """Check if form filling service is available"""
-        return True
+    # Word template placeholder for each form field (field1 -> FIELD1)
+    _FIELD_TO_WORD = {key: "FIELD" + key[len("field"):] for key in FORM_FIELDS}
     
-    def _build_form_filling_prompt(
-        self,
-        user_data: Dict[str, Any],
-        application_data: Dict[str, Any]
-    ) -> str:
-        """
-        Build comprehensive prompt for form filling
-        
-        Args:
-            user_data: User profile data
-            application_data: Visa application data
-            
-        Returns:
-            Formatted prompt string
-        """
-        prompt = """You are an expert at filling Schengen visa application forms accurately.
+    # Required fields for Schengen visa
+    _REQUIRED_FIELDS = (
+        "field1",   # Surname
+        "field3",   # First name
+        "field4",   # Date of birth
+        "field7",   # Nationality
+        "field13",  # Passport number
+        "field15",  # Passport expiry
+        "field22",  # Address
+        "field23",  # Phone
+        "field31",  # Destination
+        "field33",  # Arrival date
+        "field34"   # Departure date
+    )
+    _DATE_FIELDS = ("field4", "field14", "field15", "field33", "field34")
+    
+    # Role, instructions, field mappings and output format shared by every request. They form
+    # the system message, a constant prefix that providers can serve from their prompt cache,
+    # and only the user's data follows in the user message
+    _FORM_FILLING_INSTRUCTIONS = """You are an expert assistant for filling official visa application forms. You provide accurate, structured data in JSON format based on user information. You never fabricate data and only fill fields where information is clearly available.
+
+You are an expert at filling Schengen visa application forms accurately.
 
 Your task is to fill a Harmonised Schengen Visa Application Form using the provided user and application data.
 
@@ -127,72 +161,8 @@ IMPORTANT INSTRUCTIONS:
 7. For address fields, format properly with commas and line breaks
 8. For phone numbers, include country code (e.g., "+90 555 123 4567")
 
-USER DATA:
-"""
-        # Add user data
-        if user_data.get("surname"):
-            prompt += f"Surname: {user_data['surname']}\n"
-        if user_data.get("name"):
-            prompt += f"First Name(s): {user_data['name']}\n"
-        if user_data.get("date_of_birth"):
-            prompt += f"Date of Birth: {user_data['date_of_birth']}\n"
-        if user_data.get("place_of_birth"):
-            prompt += f"Place of Birth: {user_data['place_of_birth']}\n"
-        if user_data.get("nationality"):
-            prompt += f"Nationality: {user_data['nationality']}\n"
-        if user_data.get("passport_number"):
-            prompt += f"Passport Number: {user_data['passport_number']}\n"
-        if user_data.get("passport_issue_date"):
-            prompt += f"Passport Issue Date: {user_data['passport_issue_date']}\n"
-        if user_data.get("passport_expiry_date"):
-            prompt += f"Passport Expiry Date: {user_data['passport_expiry_date']}\n"
-        if user_data.get("tc_kimlik_no"):
-            prompt += f"National ID Number: {user_data['tc_kimlik_no']}\n"
-        if user_data.get("email"):
-            prompt += f"Email: {user_data['email']}\n"
-        if user_data.get("phone"):
-            prompt += f"Phone: {user_data['phone']}\n"
-        if user_data.get("profile_type"):
-            prompt += f"Profile Type: {user_data['profile_type']}\n"
-        
-        prompt += "\nAPPLICATION DATA:\n"
-        
-        # Add application data
-        if application_data.get("destination_country"):
-            prompt += f"Destination Country: {application_data['destination_country']}\n"
-        if application_data.get("purpose"):
-            prompt += f"Purpose of Travel: {application_data['purpose']}\n"
-        if application_data.get("travel_dates"):
-            prompt += f"Travel Dates: {application_data['travel_dates']}\n"
-        if application_data.get("duration"):
-            prompt += f"Duration: {application_data['duration']}\n"
-        if application_data.get("entry_type"):
-            prompt += f"Entry Type: {application_data['entry_type']}\n"
-        
-        prompt += """
-SCHENGEN FORM FIELD MAPPINGS:
-- field1: Surname (Family name) from user surname
-- field2: Surname at birth (if different, otherwise same as field1)
-- field3: First name(s) from user name
-- field4: Date of birth in DD-MM-YYYY format
-- field5: Place of birth
-- field6: Country of birth
-- field7: Current nationality
-- field8: Nationality at birth (if different)
-- field9: Other nationalities (if applicable)
-- field11: National identity number (TC Kimlik No for Turkish citizens)
-- field13: Passport number
-- field14: Passport issue date (DD-MM-YYYY)
-- field15: Passport expiry date (DD-MM-YYYY)
-- field16: Country that issued passport
-- field22: Full home address with email
-- field23: Telephone number with country code
-- field27: Current occupation
-- field30: Additional information about purpose of stay
-- field31: Member State(s) of destination
-- field32: Member State of first entry
-- field33: Intended arrival date (DD-MM-YYYY)
-- field34: Intended departure date (DD-MM-YYYY)
+SCHENGEN FORM FIELDS:
+""" + json.dumps(FORM_FIELDS) + """
 
 CHECKBOXES (return as boolean):
 - sex_male: true if male, false if female
@@ -216,15 +186,122 @@ Format: {
 
 Return ONLY the JSON object, no explanations.
 """
-        return prompt
     
-    def fill_schengen_form(
+    # (data key, prompt label) pairs written in order to the per-request prompt when present
+    _USER_FIELD_MAP = (
+        ("surname", "Surname"),
+        ("name", "First Name(s)"),
+        ("date_of_birth", "Date of Birth"),
+        ("place_of_birth", "Place of Birth"),
+        ("nationality", "Nationality"),
+        ("passport_number", "Passport Number"),
+        ("passport_issue_date", "Passport Issue Date"),
+        ("passport_expiry_date", "Passport Expiry Date"),
+        ("tc_kimlik_no", "National ID Number"),
+        ("email", "Email"),
+        ("phone", "Phone"),
+        ("profile_type", "Profile Type"),
+    )
+    _APP_FIELD_MAP = (
+        ("destination_country", "Destination Country"),
+        ("purpose", "Purpose of Travel"),
+        ("travel_dates", "Travel Dates"),
+        ("duration", "Duration"),
+        ("entry_type", "Entry Type"),
+    )
+    
+    # Filled fields by request hash, shared by every instance in the worker: (stored at, fields)
+    _fill_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _fill_cache_lock = threading.Lock()
+    
+    def __init__(self):
+        """Initialize Groq client"""
+        try:
+            self.async_client = _async_groq_client()
+            # Every form filling request uses the same model and sampling settings
+            completion_settings = {
+                "model": _FORM_FILLING_MODEL,
+                "response_format": {"type": "json_object"},
+                "temperature": 0.1,  # Very low for accuracy
+                "max_tokens": 1024
+            }
+            self._create_completion_async = partial(
+                self.async_client.chat.completions.create, **completion_settings
+            )
+            logger.info("Schengen Form Filling service initialized successfully")
+        except Exception as e:
+            logger.error(f"Error initializing Groq client: {e}")
+            self.async_client = None
+            self._create_completion_async = None
+    
+    def is_available(self) -> bool:
+        """Check if form filling service is available"""
+        return True
+    
+    def _build_form_filling_prompt(
+        self,
+        user_data: Dict[str, Any],
+        application_data: Dict[str, Any]
+    ) -> str:
+        """
+        Build the per-request part of the form filling prompt
+        
+        Args:
+            user_data: User profile data
+            application_data: Visa application data
+            
+        Returns:
+            Formatted user and application data, sent after _FORM_FILLING_INSTRUCTIONS
+        """
+        parts = ["USER DATA:"]
+        parts.extend(
+            f"{label}: {user_data[key]}" for key, label in self._USER_FIELD_MAP if user_data.get(key)
+        )
+        parts.append("\nAPPLICATION DATA:")
+        parts.extend(
+            f"{label}: {application_data[key]}" for key, label in self._APP_FIELD_MAP if application_data.get(key)
+        )
+        parts.append("")
+        return "\n".join(parts)
+    
+    @staticmethod
+    def _canonical_data(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Collapse whitespace in string values so cosmetic differences build the same prompt"""
+        return {key: " ".join(value.split()) if isinstance(value, str) else value for key, value in data.items()}
+    
+    @staticmethod
+    def _fill_cache_key(prompt: str) -> str:
+        """Hash a form filling prompt into a stable cache key"""
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=32).hexdigest()
+    
+    def _get_cached_fields(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return unexpired filled fields cached under key"""
+        with self._fill_cache_lock:
+            entry = self._fill_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, filled_fields = entry
+            if time.monotonic() - stored_at > _FILL_CACHE_TTL_SECONDS:
+                del self._fill_cache[key]
+                return None
+            self._fill_cache.move_to_end(key)
+            return dict(filled_fields)
+    
+    def _cache_fields(self, key: str, filled_fields: Dict[str, Any]) -> None:
+        """Cache filled fields under key, evicting the least recently used entries"""
+        with self._fill_cache_lock:
+            self._fill_cache[key] = (time.monotonic(), dict(filled_fields))
+            self._fill_cache.move_to_end(key)
+            while len(self._fill_cache) > _FILL_CACHE_SIZE:
+                self._fill_cache.popitem(last=False)
+    
+    async def fill_schengen_form_async(
         self,
         user_data: Dict[str, Any],
         application_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Fill Schengen visa application form using AI
+        Fill Schengen visa application form using AI without blocking the event loop
         
         Args:
             user_data: User profile data
@@ -237,34 +314,23 @@ Return ONLY the JSON object, no explanations.
             logger.info(f"Filling Schengen form for user {user_data.get('email')}")
             
             # Build prompt
-            prompt = self._build_form_filling_prompt(user_data, application_data)
-            
-            # Call Groq API
-            logger.info("Sending request to Groq Llama 4 Scout for form filling...")
-            
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert assistant for filling official visa application forms. You provide accurate, structured data in JSON format based on user information. You never fabricate data and only fill fields where information is clearly available."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                model="meta-llama/llama-4-scout-17b-16e-instruct",
-                response_format={"type": "json_object"},
-                temperature=0.1,  # Very low for accuracy
-                max_tokens=4000
+            prompt = self._build_form_filling_prompt(
+                self._canonical_data(user_data),
+                self._canonical_data(application_data)
             )
             
-            # Parse response
-            response_text = chat_completion.choices[0].message.content
-            filled_fields = json.loads(response_text)
+            # Requests differing only in spacing, key order or empty fields build the same
+            # prompt, and so get the same answer
+            cache_key = self._fill_cache_key(prompt)
+            filled_fields = self._get_cached_fields(cache_key)
+            if filled_fields is not None:
+                logger.info("Reusing cached form fields for an equivalent request")
+            else:
+                filled_fields = await self._request_filled_fields_async(prompt)
+                self._cache_fields(cache_key, filled_fields)
             
             # Count filled fields
-            field_count = len([v for v in filled_fields.values() if v not in [None, "", False]])
+            field_count = sum(1 for v in filled_fields.values() if v not in (None, "", False))
             
             logger.info(f"Successfully filled {field_count} form fields")
             
@@ -275,8 +341,8 @@ Return ONLY the JSON object, no explanations.
                     "form_type": "schengen_visa_application",
                     "fields_filled": field_count,
                     "total_fields": len(self.FORM_FIELDS),
-                    "model": "meta-llama/llama-4-scout-17b-16e-instruct",
-                    "filled_at": datetime.utcnow().isoformat(),
+                    "model": _FORM_FILLING_MODEL,
+                    "filled_at": datetime.now(timezone.utc).isoformat(),
                     "user_email": user_data.get("email"),
                     "destination": application_data.get("destination_country")
                 }
@@ -297,9 +363,35 @@ Return ONLY the JSON object, no explanations.
                 "filled_fields": {}
             }
     
-    def get_form_field_descriptions(self) -> Dict[str, str]:
-        """Get descriptions of all form fields"""
-        return self.FORM_FIELDS.copy()
+    def _form_filling_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Chat messages asking Groq to fill the form for prompt"""
+        return [
+            {
+                "role": "system",
+                "content": self._FORM_FILLING_INSTRUCTIONS
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    
+    @staticmethod
+    def _parse_filled_fields(chat_completion: Any) -> Dict[str, Any]:
+        """Parse the JSON answer of a form filling completion"""
+        response_text = chat_completion.choices[0].message.content
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers handle both alike
+        return orjson.loads(response_text) if orjson is not None else json.loads(response_text)
+    
+    async def _request_filled_fields_async(self, prompt: str) -> Dict[str, Any]:
+        """Ask Groq to fill the form fields without blocking and parse its JSON answer"""
+        logger.info("Sending async request to Groq Llama 4 Scout for form filling...")
+        chat_completion = await self._create_completion_async(messages=self._form_filling_messages(prompt))
+        return self._parse_filled_fields(chat_completion)
+    
+    def get_form_field_descriptions(self) -> Mapping[str, str]:
+        """Get a read-only view of all form field descriptions"""
+        return self._FORM_FIELDS_VIEW
     
     def validate_filled_form(self, filled_fields: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -314,28 +406,12 @@ Return ONLY the JSON object, no explanations.
         errors = []
         warnings = []
         
-        # Required fields for Schengen visa
-        required_fields = [
-            "field1",   # Surname
-            "field3",   # First name
-            "field4",   # Date of birth
-            "field7",   # Nationality
-            "field13",  # Passport number
-            "field15",  # Passport expiry
-            "field22",  # Address
-            "field23",  # Phone
-            "field31",  # Destination
-            "field33",  # Arrival date
-            "field34"   # Departure date
-        ]
-        
-        for field in required_fields:
+        for field in self._REQUIRED_FIELDS:
             if not filled_fields.get(field):
                 errors.append(f"Required field {field} ({self.FORM_FIELDS.get(field)}) is missing")
         
         # Date format validation
-        date_fields = ["field4", "field14", "field15", "field33", "field34"]
-        for field in date_fields:
+        for field in self._DATE_FIELDS:
             if filled_fields.get(field):
                 value = filled_fields[field]
                 if not self._validate_date_format(value):
@@ -350,16 +426,16 @@ Return ONLY the JSON object, no explanations.
             "valid": len(errors) == 0,
             "errors": errors,
             "warnings": warnings,
-            "fields_checked": len(required_fields)
+            "fields_checked": len(self._REQUIRED_FIELDS)
         }
     
     def _validate_date_format(self, date_str: str) -> bool:
         """Validate if date string is in DD-MM-YYYY format"""
-        try:
-            datetime.strptime(date_str, "%d-%m-%Y")
-            return True
-        except:
+        match = _DATE_RE.fullmatch(date_str) if isinstance(date_str, str) else None
+        if not match:
             return False
+        day, month, year = (int(part) for part in match.groups())
+        return year >= 1 and day <= calendar.monthrange(year, month)[1]
     
     def generate_word_document(
         self,
@@ -377,25 +453,17 @@ Return ONLY the JSON object, no explanations.
             Path to the generated Word document
         """
         try:
-            from app.services.word_document_service import WordDocumentService
-            
-            # Initialize Word document service
-            word_service = WordDocumentService()
+            word_service = _word_document_service()
             
             # Convert filled fields to the format expected by WordDocumentService
             # Map our field names (field1, field3, etc.) to FIELD1, FIELD3, etc.
             user_data = {}
             
-            # Map all numeric fields
             for key, value in filled_fields.items():
-                if key.startswith("field"):
-                    # Extract number from field name (e.g., "field1" -> "1")
-                    field_num = key.replace("field", "")
-                    field_key = f"FIELD{field_num.upper()}"
-                    
-                    # Only add non-empty string values (skip None, empty strings, and booleans)
-                    if value and not isinstance(value, bool):
-                        user_data[field_key] = str(value)
+                word_key = self._FIELD_TO_WORD.get(key)
+                # Only add non-empty string values (skip None, empty strings, and booleans)
+                if word_key and value and not isinstance(value, bool):
+                    user_data[word_key] = str(value)
             
             logger.info(f"Converted {len(user_data)} fields for Word document")
             
@@ -411,3 +479,20 @@ Return ONLY the JSON object, no explanations.
         except Exception as e:
             logger.error(f"Error generating Word document: {e}")
             raise Exception(f"Failed to generate Word document: {str(e)}")
+    
+    async def generate_word_document_async(
+        self,
+        filled_fields: Dict[str, Any],
+        output_filename: Optional[str] = None
+    ) -> str:
+        """
+        Generate the Word document in a worker thread so the event loop keeps serving requests
+        
+        Args:
+            filled_fields: Dictionary of filled form fields
+            output_filename: Optional custom filename
+            
+        Returns:
+            Path to the generated Word document
+        """
+        return await asyncio.to_thread(self.generate_word_document, filled_fields, output_filename)
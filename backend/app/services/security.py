@@ -1,94 +1,190 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from firebase_admin import auth
-from app.core.firebase import db
+from firebase_admin import auth, get_app
+from app.core.firebase import async_db
 from app.models.schemas import UserInDB
-from typing import Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+import google.auth.exceptions
+import google.auth.transport.requests
+import google.oauth2.id_token
+import cachecontrol
+import hashlib
 import logging
+import requests
+import time
+import jwt
 
 logger = logging.getLogger(__name__)
 
+# Audience of the custom tokens auth.create_custom_token signs for our login endpoint
+_CUSTOM_TOKEN_AUDIENCE = 'https://identitytoolkit.googleapis.com/google.identity.identitytoolkit.v1.IdentityToolkit'
+# Public certificates of a service account's signing keys
+_SERVICE_ACCOUNT_CERTS_URL = 'https://www.googleapis.com/robot/v1/metadata/x509/{}'
+
+# Users read from Firestore are reused for a short while instead of being read on every request.
+# The cache is per worker process: invalidate_user only clears this worker's entry, so a change
+# made through another worker or straight in Firestore shows here after _USER_CACHE_TTL_SECONDS
+_USER_CACHE_SIZE = 10000
+_USER_CACHE_TTL_SECONDS = 60
+# Unknown uids are remembered briefly too, so repeated requests for them do not all reach Firestore
+_MISSING_USER_TTL_SECONDS = 5
+
+# Verified ID tokens are reused until shortly before they expire instead of verifying them again
+_TOKEN_CACHE_SIZE = 50000
+_TOKEN_EXPIRY_MARGIN_SECONDS = 30
+
+# token digest -> (decoded token, epoch after which it is verified again), least recently used first
+_token_cache: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+
+# uid -> (expires at, user or None when the uid has no document), least recently used first
+_user_cache: "OrderedDict[str, Tuple[float, Optional[UserInDB]]]" = OrderedDict()
+
+# uid -> [Firestore reads in flight, invalidations since the first of them began]. A read that
+# sees the count change while it awaits Firestore returns its result without caching it.
+# Both caches are only touched from the event loop and never across an await, so no lock is needed
+_user_reads: Dict[str, List[int]] = {}
+
 # Security scheme
 security = HTTPBearer()
 
 
+@lru_cache(maxsize=1)
+def _custom_token_issuer() -> Optional[str]:
+    """Return the service account that signs our custom tokens, or None when the app has none"""
+    return getattr(get_app().credential, 'service_account_email', None)
+
+
+@lru_cache(maxsize=1)
+def _certs_request() -> google.auth.transport.requests.Request:
+    """Return the transport fetching signing certificates, which honours their cache headers"""
+    return google.auth.transport.requests.Request(session=cachecontrol.CacheControl(requests.Session()))
+
+
 async def verify_firebase_token(token: str) -> Optional[dict]:
     """
     Verify Firebase token (both custom tokens and ID tokens) and return decoded token data
+    Custom tokens issued by our login endpoint must carry the signature of our service account,
+    every other token must pass Firebase ID token verification
     """
     try:
-        # First try to verify as ID token
-        try:
-            decoded_token = auth.verify_id_token(token)
-            return decoded_token
-        except (auth.InvalidIdTokenError, auth.ExpiredIdTokenError):
-            # If ID token verification fails, try as custom token
-            pass
+        # Only claims verified by auth.verify_id_token are cached
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        entry = _token_cache.get(key)
+        if entry is not None:
+            if entry[1] > time.time():
+                _token_cache.move_to_end(key)
+                return entry[0]
+            del _token_cache[key]
         
-        # Try to verify as custom token
+        # Read the claims once to pick the path; nothing is trusted before it is verified
         try:
-            # For custom tokens, we need to decode them manually
-            import jwt
-            
-            # Get the project ID from the Firebase app
-            from firebase_admin import get_app
-            project_id = get_app().project_id
-            
-            # Decode the custom token without verification (since we trust our own tokens)
-            decoded_token = jwt.decode(token, options={"verify_signature": False})
-            
-            # Check if it's a service account token (from our login endpoint)
-            if decoded_token.get('iss') == f'firebase-adminsdk-fbsvc@visa-a05d3.iam.gserviceaccount.com':
-                # This is a service account token from our login endpoint
-                # Extract the UID from the custom token
-                uid = decoded_token.get('uid')
-                if uid:
-                    # Return a token-like structure with the UID
-                    return {
-                        'uid': uid,
-                        'iss': decoded_token.get('iss'),
-                        'aud': decoded_token.get('aud'),
-                        'iat': decoded_token.get('iat'),
-                        'exp': decoded_token.get('exp')
-                    }
-            
-            # Verify it's a custom token from our project
-            if decoded_token.get('iss') == f'https://securetoken.google.com/{project_id}':
-                # Extract the UID from the custom token
-                uid = decoded_token.get('uid')
-                if uid:
-                    # Return a token-like structure with the UID
-                    return {
-                        'uid': uid,
-                        'iss': decoded_token.get('iss'),
-                        'aud': decoded_token.get('aud'),
-                        'iat': decoded_token.get('iat'),
-                        'exp': decoded_token.get('exp')
-                    }
-        except Exception as e:
-            logger.warning(f"Failed to decode custom token: {str(e)}")
+            claims = jwt.decode(token, options={"verify_signature": False, "verify_exp": True})
+        except jwt.PyJWTError as e:
+            logger.warning(f"Failed to decode Firebase token: {str(e)}")
+            return None
         
-        logger.warning("Invalid Firebase token")
-        return None
+        issuer = _custom_token_issuer()
+        if issuer and claims.get('iss') == issuer:
+            # This is a service account token from our login endpoint
+            return _verify_custom_token(token, issuer)
+        return _verify_id_token(token, key)
         
     except Exception as e:
         logger.error(f"Error verifying Firebase token: {str(e)}")
         return None
 
 
+def _verify_custom_token(token: str, issuer: str) -> Optional[dict]:
+    """Verify a custom token against the public certificates of the service account that issued it"""
+    try:
+        verified = google.oauth2.id_token.verify_token(
+            token,
+            _certs_request(),
+            audience=_CUSTOM_TOKEN_AUDIENCE,
+            certs_url=_SERVICE_ACCOUNT_CERTS_URL.format(issuer)
+        )
+    except (ValueError, google.auth.exceptions.GoogleAuthError) as e:
+        logger.warning(f"Invalid Firebase custom token: {str(e)}")
+        return None
+    uid = verified.get('uid')
+    if verified.get('iss') != issuer or not uid:
+        logger.warning("Invalid Firebase token: custom token without uid")
+        return None
+    # Return a token-like structure with the UID
+    return {
+        'uid': uid,
+        'iss': verified.get('iss'),
+        'aud': verified.get('aud'),
+        'iat': verified.get('iat'),
+        'exp': verified.get('exp')
+    }
+
+
+def _verify_id_token(token: str, key: bytes) -> Optional[dict]:
+    """Verify a Firebase ID token and cache its claims under key until shortly before they expire"""
+    try:
+        decoded_token = auth.verify_id_token(token)
+    except (auth.InvalidIdTokenError, auth.ExpiredIdTokenError) as e:
+        logger.warning(f"Invalid Firebase token: {str(e)}")
+        return None
+    
+    exp = decoded_token.get('exp')
+    if isinstance(exp, (int, float)):
+        _token_cache[key] = (decoded_token, exp - _TOKEN_EXPIRY_MARGIN_SECONDS)
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > _TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return decoded_token
+
+
 async def get_user_from_firestore(uid: str) -> Optional[UserInDB]:
     """
     Fetch user data from Firestore users collection
     """
+    entry = _user_cache.get(uid)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            _user_cache.move_to_end(uid)
+            return entry[1]
+        del _user_cache[uid]
+    
+    reads = _user_reads.setdefault(uid, [0, 0])
+    reads[0] += 1
+    generation = reads[1]
     try:
-        user_doc = db.collection('users').document(uid).get()
-        if user_doc.exists:
-            user_data = user_doc.to_dict()
-            return UserInDB(**user_data)
-        return None
+        user_doc = await async_db.collection('users').document(uid).get()
+        user = UserInDB(**user_doc.to_dict()) if user_doc.exists else None
     except Exception as e:
         logger.error(f"Error fetching user from Firestore: {str(e)}")
         return None
+    finally:
+        reads[0] -= 1
+        if not reads[0]:
+            del _user_reads[uid]
+    
+    if reads[1] != generation:
+        # The user changed while it was being read, so this copy may already be stale
+        return user
+    
+    ttl = _USER_CACHE_TTL_SECONDS if user is not None else _MISSING_USER_TTL_SECONDS
+    _user_cache[uid] = (time.monotonic() + ttl, user)
+    _user_cache.move_to_end(uid)
+    while len(_user_cache) > _USER_CACHE_SIZE:
+        _user_cache.popitem(last=False)
+    return user
+
+
+def invalidate_user(uid: str) -> None:
+    """
+    Drop the cached user so the next request reads it from Firestore again
+    Call after creating, updating or deleting a user document
+    """
+    _user_cache.pop(uid, None)
+    reads = _user_reads.get(uid)
+    if reads is not None:
+        reads[1] += 1
 
 
 async def get_current_user(
@@ -144,13 +240,16 @@ async def get_current_user_optional(
         return None
 
 
-def require_profile_type(required_types: list):
+def require_profile_type(required_types: Iterable[str]):
     """
     Decorator factory to require specific profile types
     Usage: @require_profile_type(["STUDENT", "WORKER"])
     """
+    required_types = list(required_types)
+    allowed_types = frozenset(required_types)
+    
     def decorator(current_user: UserInDB = Depends(get_current_user)):
-        if current_user.profile_type not in required_types:
+        if current_user.profile_type not in allowed_types:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Access denied. Required profile types: {required_types}"
@@ -159,13 +258,16 @@ def require_profile_type(required_types: list):
     return decorator
 
 
-def require_passport_type(required_types: list):
+def require_passport_type(required_types: Iterable[str]):
     """
     Decorator factory to require specific passport types
     Usage: @require_passport_type(["BORDO", "YESIL"])
     """
+    required_types = list(required_types)
+    allowed_types = frozenset(required_types)
+    
     def decorator(current_user: UserInDB = Depends(get_current_user)):
-        if current_user.passport_type not in required_types:
+        if current_user.passport_type not in allowed_types:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Access denied. Required passport types: {required_types}"
@@ -2,24 +2,125 @@
 Word Document Editing Service for Schengen Visa Application Forms
 """
 
+import copy
+import itertools
 import os
+import re
 import tempfile
-from typing import Dict, Any, Optional
+import threading
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Optional, Tuple
 from docx import Document
+from docx.oxml.ns import nsmap, qn
 from docx.shared import Inches
+from docx.text.paragraph import Paragraph
+from lxml import etree
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _field_matcher(field_keys: FrozenSet[str]) -> Tuple[str, "re.Pattern[str]"]:
+    """
+    Get the prefix shared by all field keys, which rules out runs without it by a plain substring test,
+    and one alternation matching any of the keys. A key never matches when a digit follows it, so
+    FIELD2 leaves FIELD20 alone even when FIELD20 has no value
+    """
+    alternation = "|".join(re.escape(key) for key in sorted(field_keys, key=len, reverse=True))
+    pattern = re.compile(f"(?:{alternation})(?!\\d)")
+    return os.path.commonprefix(sorted(field_keys)), pattern
+
+
+# Run children whose text survives a round trip through run.text; runs holding anything else are
+# never merged. Spelling markers between runs do not keep them apart
+_PLAIN_RUN_TAGS = frozenset((qn("w:rPr"), qn("w:t"), qn("w:tab")))
+_PROOF_ERROR_TAG = qn("w:proofErr")
+
+# Body paragraphs and paragraphs of top-level table cells whose text contains $key_prefix. These
+# are the paragraphs doc.paragraphs and the cells of doc.tables hold; paragraphs nested deeper,
+# such as those of content controls or tables within cells, are left alone
+_PARAGRAPHS_CONTAINING = etree.XPath(
+    "(./w:p | ./w:tbl/w:tr/w:tc/w:p)[contains(string(.), $key_prefix)]",
+    namespaces={"w": nsmap["w"]}
+)
+
+# Distinguishes documents generated by this process within the same second
+_filename_sequence = itertools.count()
+
+# Parsed template by path: (modification time, document). Requests edit deep copies, which is
+# cheaper than unzipping and parsing the .docx again
+_template_cache: Dict[str, Tuple[float, Any]] = {}
+_template_lock = threading.Lock()
+
+
+def _load_template(template_path: str) -> Document:
+    """Return a fresh copy of the template document, parsing the file only when it is new or has changed"""
+    modified_at = os.path.getmtime(template_path)
+    with _template_lock:
+        cached = _template_cache.get(template_path)
+        if cached is None or cached[0] != modified_at:
+            cached = (modified_at, Document(template_path))
+            _template_cache[template_path] = cached
+        return copy.deepcopy(cached[1])
+
+
 class WordDocumentService:
     """Service for editing Word documents with form data"""
     
+    # Placeholders of the Schengen template
+    _FIELD_KEYS = tuple(f"FIELD{field_num}" for field_num in range(1, 35))
+    
+    # Sample data for testing, shared read-only by every caller
+    _SAMPLE_DATA = MappingProxyType({
+        "FIELD1": "DOE",  # SURNAME
+        "FIELD2": "SMITH",  # Surname at birth
+        "FIELD3": "John",  # First Names
+        "FIELD4": "15/03/1990",  # Date of Birth
+        "FIELD5": "New York",  # Place of birth
+        "FIELD6": "United States",  # Country of birth
+        "FIELD7": "American",  # Current Nationality
+        "FIELD8": "Jane Doe, 123 Main St, New York, +1-555-123-4567, jane@example.com, American",  # Parental Authority
+        "FIELD9": "123456789",  # National identity number
+        "FIELD10": "DOE",  # Surname (family name) of family member
+        "FIELD11": "Jane",  # First name of family member
+        "FIELD12": "20/05/1995",  # Birth of family member
+        "FIELD13": "American",  # Nationality of family member
+        "FIELD14": "987654321",  # Number of ID of family member
+        "FIELD15": "123 Main Street, New York, NY 10001, john.doe@example.com",  # Address and email
+        "FIELD16": "+1-555-123-4567",  # Telephone number
+        "FIELD17": "Software Engineer",  # Current occupation
+        "FIELD18": "Tech Corp, 456 Business Ave, New York, NY 10002, +1-555-987-6543",  # Employer's address and phone
+        "FIELD19": "Tourism",  # Purpose of stay
+        "FIELD20": "Germany",  # Destination Country
+        "FIELD21": "Hotel Berlin, 123 Tourist Street, Berlin, Germany",  # Address of accommodation
+        "FIELD22": "+49-30-12345678",  # Tel no of accommodation
+        "FIELD23": "Business Solutions GmbH",  # Inviting company's name
+        "FIELD24": "Germany",  # Member State of main destination
+        "FIELD25": "Germany",  # Member State of first entry
+        "FIELD26": "US123456789",  # Number of travel document
+        "FIELD27": "01/01/2020",  # Date of issue
+        "FIELD28": "01/01/2030",  # Valid until
+        "FIELD29": "United States",  # Issued by Country
+        "FIELD30": "Hans Mueller",  # Surname and first name of inviting person
+        "FIELD31": "Maria Schmidt, 456 Business St, Berlin, +49-30-98765432, maria@business.de",  # Contact person details
+        "FIELD32": "+49-30-11111111",  # Telephone no. of company/organisation
+        "FIELD33": "Self-funded",  # COST
+        "FIELD34": "Germany, 15/06/2025",  # Country and Date
+    })
+    
     def __init__(self):
         # Get the directory where this service file is located
         current_dir = os.path.dirname(os.path.abspath(__file__))
         self.template_path = os.path.join(current_dir, "schengen-visa-application-form_ocred.docx")
         
+        # Check if template exists
+        if not os.path.exists(self.template_path):
+            raise FileNotFoundError(f"Template file not found: {self.template_path}")
+        
         # Set output directory to backend/generated_documents
         backend_dir = os.path.dirname(os.path.dirname(current_dir))
         self.output_dir = os.path.join(backend_dir, "generated_documents")
@@ -42,22 +143,20 @@ class WordDocumentService:
             Path to the generated document
         """
         try:
-            # Check if template exists
-            if not os.path.exists(self.template_path):
-                raise FileNotFoundError(f"Template file not found: {self.template_path}")
-            
             # Load the document
-            doc = Document(self.template_path)
+            doc = _load_template(self.template_path)
             
             logger.info(f"Document has {len(doc.paragraphs)} paragraphs and {len(doc.tables)} tables")
             logger.info(f"Received {len(user_data)} fields to replace")
             logger.info(f"Fields: {list(user_data.keys())}")
             
-            # Process paragraphs
-            self._process_paragraphs(doc, user_data)
+            # Convert the values to text once rather than for every run they replace
+            field_values = {
+                key: value if isinstance(value, str) else str(value) for key, value in user_data.items()
+            }
             
-            # Process tables
-            self._process_tables(doc, user_data)
+            # Process body paragraphs and table cells
+            self._process_body(doc, field_values)
             
             # Generate output filename
             if not filename:
@@ -65,8 +164,12 @@ class WordDocumentService:
             
             output_path = os.path.join(self.output_dir, filename)
             
-            # Save the modified document
-            doc.save(output_path)
+            # Save the modified document: build the .docx in memory, then write it in one go, so the
+            # zip's many small writes stay off the disk and a failed save leaves no partial file
+            buffer = BytesIO()
+            doc.save(buffer)
+            with open(output_path, "wb") as output_file:
+                output_file.write(buffer.getbuffer())
             logger.info(f"Document saved to: {output_path}")
             
             return output_path
@@ -75,93 +178,94 @@ class WordDocumentService:
             logger.error(f"Error editing Word document: {e}")
             raise
     
-    def _process_paragraphs(self, doc: Document, user_data: Dict[str, Any]) -> None:
-        """Process paragraphs in the document"""
+    def _process_body(self, doc: Document, user_data: Dict[str, str]) -> None:
+        """Process the paragraphs of the document body and its tables that contain a field key"""
+        matcher = self._field_matcher(user_data)
         replacements_made = 0
-        for paragraph in doc.paragraphs:
-            # Process each run to preserve formatting
-            for run in paragraph.runs:
-                for field_key, field_value in user_data.items():
-                    if field_key in run.text:
-                        run.text = run.text.replace(field_key, str(field_value))
-                        replacements_made += 1
-                        logger.info(f"Replaced {field_key} with '{field_value}' in paragraph")
+        if matcher is not None:
+            # One XPath query finds the few paragraphs holding placeholders, instead of wrapping
+            # every paragraph, row, cell and run of the document in Python objects
+            for element in _PARAGRAPHS_CONTAINING(doc.element.body, key_prefix=matcher[0]):
+                paragraph = Paragraph(element, doc._body)
+                replacements_made += self._process_paragraph(paragraph, matcher, user_data)
         
-        logger.info(f"Made {replacements_made} replacements in paragraphs")
+        logger.info(f"Made {replacements_made} replacements in document body")
     
-    def _process_tables(self, doc: Document, user_data: Dict[str, Any]) -> None:
-        """Process tables in the document"""
-        replacements_made = 0
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    # Process each paragraph in the cell
-                    for paragraph in cell.paragraphs:
-                        for run in paragraph.runs:
-                            for field_key, field_value in user_data.items():
-                                if field_key in run.text:
-                                    run.text = run.text.replace(field_key, str(field_value))
-                                    replacements_made += 1
-                                    logger.info(f"Replaced {field_key} with '{field_value}' in table")
+    def _process_paragraph(
+        self,
+        paragraph,
+        matcher: Tuple[str, "re.Pattern[str]"],
+        user_data: Dict[str, str]
+    ) -> int:
+        """Replace the field keys in a paragraph and return the number of replacements"""
+        # A placeholder typed across several runs is only found once those runs are merged
+        if matcher[0] in paragraph.text:
+            self._coalesce_runs(paragraph)
         
-        logger.info(f"Made {replacements_made} replacements in tables")
+        # Process each run to preserve formatting
+        return sum(self._replace_fields(run, matcher, user_data) for run in paragraph.runs)
+    
+    def _coalesce_runs(self, paragraph) -> None:
+        """Merge adjacent plain text runs that share the same formatting into the first of them"""
+        previous = None
+        previous_format = None
+        for run in paragraph.runs:
+            element = run._element
+            if any(child.tag not in _PLAIN_RUN_TAGS for child in element):
+                previous = None
+                continue
+            
+            run_format = etree.tostring(element.rPr) if element.rPr is not None else b""
+            sibling = element.getprevious()
+            while sibling is not None and sibling.tag == _PROOF_ERROR_TAG:
+                sibling = sibling.getprevious()
+            
+            if previous is not None and sibling is previous._element and run_format == previous_format:
+                previous.text += run.text
+                element.getparent().remove(element)
+            else:
+                previous, previous_format = run, run_format
+    
+    def _field_matcher(self, user_data: Dict[str, str]) -> Optional[Tuple[str, "re.Pattern[str]"]]:
+        """Get the matcher for the field keys of user_data, or None when there is nothing to replace"""
+        field_keys = frozenset(key for key in user_data if key)
+        return _field_matcher(field_keys) if field_keys else None
+    
+    def _replace_fields(
+        self,
+        run,
+        matcher: Tuple[str, "re.Pattern[str]"],
+        user_data: Dict[str, str]
+    ) -> int:
+        """Replace every field key in the run's text in one pass and return the number of replacements"""
+        key_prefix, pattern = matcher
+        text = run.text
+        # Most runs hold no placeholder at all
+        if key_prefix not in text:
+            return 0
+        
+        new_text, count = pattern.subn(lambda match: user_data[match.group(0)], text)
+        if count:
+            run.text = new_text
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Made {count} replacements in run: '{new_text}'")
+        return count
     
     def _generate_timestamp(self) -> str:
         """Generate timestamp for unique filenames"""
-        from datetime import datetime
-        return datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Process id and sequence number keep documents generated in the same second apart
+        return f"{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}_{next(_filename_sequence)}"
     
-    def get_sample_data(self) -> Dict[str, Any]:
+    def get_sample_data(self) -> Mapping[str, Any]:
         """Get sample data for testing"""
-        return {
-            "FIELD1": "DOE",  # SURNAME
-            "FIELD2": "SMITH",  # Surname at birth
-            "FIELD3": "John",  # First Names
-            "FIELD4": "15/03/1990",  # Date of Birth
-            "FIELD5": "New York",  # Place of birth
-            "FIELD6": "United States",  # Country of birth
-            "FIELD7": "American",  # Current Nationality
-            "FIELD8": "Jane Doe, 123 Main St, New York, +1-555-123-4567, jane@example.com, American",  # Parental Authority
-            "FIELD9": "123456789",  # National identity number
-            "FIELD10": "DOE",  # Surname (family name) of family member
-            "FIELD11": "Jane",  # First name of family member
-            "FIELD12": "20/05/1995",  # Birth of family member
-            "FIELD13": "American",  # Nationality of family member
-            "FIELD14": "987654321",  # Number of ID of family member
-            "FIELD15": "123 Main Street, New York, NY 10001, john.doe@example.com",  # Address and email
-            "FIELD16": "+1-555-123-4567",  # Telephone number
-            "FIELD17": "Software Engineer",  # Current occupation
-            "FIELD18": "Tech Corp, 456 Business Ave, New York, NY 10002, +1-555-987-6543",  # Employer's address and phone
-            "FIELD19": "Tourism",  # Purpose of stay
-            "FIELD20": "Germany",  # Destination Country
-            "FIELD21": "Hotel Berlin, 123 Tourist Street, Berlin, Germany",  # Address of accommodation
-            "FIELD22": "+49-30-12345678",  # Tel no of accommodation
-            "FIELD23": "Business Solutions GmbH",  # Inviting company's name
-            "FIELD24": "Germany",  # Member State of main destination
-            "FIELD25": "Germany",  # Member State of first entry
-            "FIELD26": "US123456789",  # Number of travel document
-            "FIELD27": "01/01/2020",  # Date of issue
-            "FIELD28": "01/01/2030",  # Valid until
-            "FIELD29": "United States",  # Issued by Country
-            "FIELD30": "Hans Mueller",  # Surname and first name of inviting person
-            "FIELD31": "Maria Schmidt, 456 Business St, Berlin, +49-30-98765432, maria@business.de",  # Contact person details
-            "FIELD32": "+49-30-11111111",  # Telephone no. of company/organisation
-            "FIELD33": "Self-funded",  # COST
-            "FIELD34": "Germany, 15/06/2025",  # Country and Date
-        }
+        return self._SAMPLE_DATA
     
     def validate_user_data(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and clean user data"""
-        validated_data = {}
-        
-        for field_num in range(1, 35):
-            field_key = f"FIELD{field_num}"
-            value = user_data.get(field_key, "")
-            
-            # Basic validation and cleaning
-            if isinstance(value, str):
-                validated_data[field_key] = value.strip()
-            else:
-                validated_data[field_key] = str(value) if value is not None else ""
-        
-        return validated_data
+        # Basic validation and cleaning
+        return {
+            field_key: value.strip()
+            if isinstance(value := user_data.get(field_key, ""), str)
+            else ("" if value is None else str(value))
+            for field_key in self._FIELD_KEYS
+        }
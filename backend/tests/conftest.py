@@ -0,0 +1,14 @@
+"""
+Shared test setup for the backend services
+"""
+
+import importlib.util
+import sys
+import types
+
+# app.services.ocr_service imports OCRDocumentProcessor from a module that is not in the
+# repository yet. The tests only feed it OCR text, never images, so an empty stand-in is enough
+if importlib.util.find_spec("app.services.ocr_document_processor") is None:
+    _processor_module = types.ModuleType("app.services.ocr_document_processor")
+    _processor_module.OCRDocumentProcessor = type("OCRDocumentProcessor", (), {})
+    sys.modules[_processor_module.__name__] = _processor_module
@@ -0,0 +1,296 @@
+"""
+Tests for the OCR document validation service
+"""
+
+import importlib.util
+import json
+import multiprocessing
+import re
+import sys
+from dataclasses import replace
+
+import pytest
+
+from app.services import ocr_service
+from app.services.ocr_service import OCRService, ValidationCheck
+
+BANK_STATEMENT_TEXT = (
+    "T.C. ZIRAAT BANKASI Hesap No: 1234567890123\n"
+    "Mevcut Bakiye: 53.989,75 TL\n"
+    "01.03.2025 - 15.06.2025 mühürlü kaşeli"
+)
+
+
+@pytest.fixture(scope="module")
+def service():
+    service = OCRService()
+    yield service
+    service.close()
+
+
+def test_result_dict_keeps_the_validator_dict_shape(service):
+    result = service.process_document("bank_statement", BANK_STATEMENT_TEXT)
+    assert all(isinstance(check, ValidationCheck) for check in result.validation_results.values())
+
+    data = result.to_dict()
+
+    check = data["validation_results"]["bank_stamp"]
+    assert check == {
+        "valid": True,
+        "issues": [],
+        "recommendations": ["Bank stamp detected successfully"],
+        "details": {"has_stamp": True, "stamp_text": "mühür"},
+    }
+    balance = data["validation_results"]["account_balance"]
+    assert isinstance(balance["issues"], list) and isinstance(balance["recommendations"], list)
+    assert data["document_type"] == "bank_statement"
+    assert data["metadata"]["config"]["ocrValidationRules"]["min_months"] == 3
+
+
+def test_result_dict_is_json_serialisable(service):
+    result = service.process_document("bank_statement", BANK_STATEMENT_TEXT)
+
+    decoded = json.loads(json.dumps(result.to_dict(), default=str))
+
+    assert decoded["validation_results"]["bank_stamp"]["valid"] is True
+    assert decoded["validation_results"]["account_balance"]["details"]["current_balance"] == {
+        "amount": 53989.75,
+        "currency": "TL",
+    }
+
+
+def test_result_dict_is_a_copy(service):
+    result = service.process_document("bank_statement", BANK_STATEMENT_TEXT)
+
+    data = result.to_dict()
+    data["validation_results"]["bank_stamp"]["details"]["has_stamp"] = False
+    data["metadata"]["bank_stamp_info"]["has_stamp"] = False
+
+    assert result.validation_results["bank_stamp"].details["has_stamp"] is True
+    assert result.metadata["bank_stamp_info"]["has_stamp"] is True
+
+
+def test_business_letter_is_reported_as_a_processing_error(service):
+    result = service.process_document("business_letter", "Letterhead company")
+
+    assert result.confidence_score == 0.0
+    assert result.validation_results == {}
+    assert result.issues == ["Processing error: Document type business_letter cannot be validated yet"]
+    assert "error" in result.metadata
+
+
+@pytest.mark.parametrize("stop_on_critical_failure", [False, True])
+def test_changing_a_result_leaves_cached_extractions_alone(stop_on_critical_failure):
+    service = OCRService()
+    config = service.document_type_configs[ocr_service.DocumentType.BANK_STATEMENT]
+    config["ocrValidationRules"] = replace(config["ocrValidationRules"], stop_on_critical_failure=stop_on_critical_failure)
+
+    first = service.process_document("bank_statement", BANK_STATEMENT_TEXT)
+    first.metadata["balance_info"]["current_balance"]["amount"] = 0
+    first.validation_results["bank_stamp"].details["has_stamp"] = False
+    first.metadata["bank_stamp_info"].clear()
+
+    second = service.process_document("bank_statement", BANK_STATEMENT_TEXT)
+
+    assert second.metadata["balance_info"]["current_balance"]["amount"] == 53989.75
+    assert second.validation_results["bank_stamp"].details["has_stamp"] is True
+    assert second.metadata["bank_stamp_info"] == {"has_stamp": True, "stamp_text": "mühür"}
+    service.close()
+
+
+def test_changing_a_blank_page_result_leaves_later_blank_pages_alone(service):
+    first = service.process_document("bank_statement", "")
+    first.metadata["balance_info"]["current_balance"] = {"amount": 1.0, "currency": "TL"}
+
+    second = service.process_document("bank_statement", " ")
+
+    assert "current_balance" not in second.metadata["balance_info"]
+
+
+BATCH_DOCUMENTS = [
+    ("bank_statement", BANK_STATEMENT_TEXT, None),
+    ("bank_statement", "Hesap No: 9876543210 Bakiye: 500,00 TL", None),
+    ("hotel_reservation", "Booking confirmed Hotel Berlin 12/06/2025 19.06.2025 total 500 EUR paid", None),
+    ("previous_visas", "SCHENGEN VISA valid from 01-02-23 until 2023-08-01 DEU FRA slovenia", None),
+    ("biometric_photo", "photo", {"file_name": "x.jpg", "image_dimensions": {"width": 413, "height": 531}}),
+    ("tax_return", "GELİR VERGİSİ BEYANNAMESİ Yıl: 2024 toplam 123.456,78 vergi dairesi onay", None),
+]
+
+
+def test_batch_results_equal_sequential_results(monkeypatch):
+    # Forked workers inherit the stand-in document processor module from conftest
+    monkeypatch.setattr(ocr_service, "_batch_mp_context", lambda: multiprocessing.get_context("fork"))
+    service = OCRService(batch_workers=2)
+    # Per-instance configs must reach the workers
+    config = service.document_type_configs[ocr_service.DocumentType.BANK_STATEMENT]
+    config["ocrValidationRules"] = replace(config["ocrValidationRules"], min_balance_threshold=100000.0)
+
+    try:
+        batch = service.process_batch(BATCH_DOCUMENTS)
+    finally:
+        service.close()
+
+    sequential = [service.process_document(*document) for document in BATCH_DOCUMENTS]
+    assert [result.to_dict() for result in batch] == [result.to_dict() for result in sequential]
+    assert not batch[0].validation_results["account_balance"].valid
+
+
+def test_batch_workers_are_spawned_without_forkserver(monkeypatch):
+    monkeypatch.setattr(ocr_service.multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+
+    assert ocr_service._batch_mp_context().get_start_method() == "spawn"
+
+
+# Texts of every document type, checked as written and in upper, lower and Turkish case
+OCR_TEXTS = [
+    ("bank_statement", BANK_STATEMENT_TEXT),
+    ("bank_statement", "Türkiye İş Bankası hesap numarası: 4455667788 Balance 1,250.00 try son bakiye 45,50 AB\n31/02/2025 2025/07/01 15 haziran 2025 resmi mühür"),
+    ("passport", "PASAPORT NO: U12345678 TÜRKİYE ÜLKE KODU: TUR TÜRÜ: P\nDoğum 12 MAR 1990 Veriliş 15 HAZ / JUN 2020 Geçerlilik 14 OCA / JAN 2030 sayfa 32"),
+    ("passport", "passport no ab12 country code: DEU type: X 01/02/2005 12.12.2034 page 2"),
+    ("birth_certificate", "DOĞUM TARİHİ: 12.03.1990 DOĞUM YERİ: ANKARA ÇANKAYA\nBaba Soyadı: YILMAZ Anne Soyadı: KAYA mühürlü"),
+    ("birth_certificate", "Yıl: 1990 place of birth: NEW YORK father surname: DOE mother surname: ROE"),
+    ("hotel_reservation", BATCH_DOCUMENTS[2][1] + " check-in 12/06/2025 check-out"),
+    ("invitation_letter", "I am inviting my friend. Host: John, phone +49 123, from 01/07/2025 to 2025.07.20 Sincerely, signature"),
+    ("previous_visas", BATCH_DOCUMENTS[3][1] + " Germany XYZ"),
+    ("property_deed", "TAPU SENEDİ malik: Ahmet işlem bedeli 1.500.000 TL siciline uygundur"),
+    ("social_security", "SGK sigorta sicil numarası 601123456789 çalışmaktadır 01/02/2015 tarihinden itibaren"),
+    ("student_certificate", "ANKARA ÜNİVERSİTESİ Öğrenci Belgesi 01.09.2026 ilgili makama imza mühür fakülte"),
+    ("tax_return", BATCH_DOCUMENTS[5][1] + " dönem 2023 year gelir 1,234.56"),
+    ("travel_insurance", "Travel insurance sum insured $30,000 up to 50,000 EUR Schengen worldwide valid 01/06/2025 - 30/06/2025"),
+]
+
+
+def _turkish_upper(text):
+    return text.replace("i", "İ").replace("ı", "I").upper()
+
+
+def _turkish_lower(text):
+    return text.replace("I", "ı").replace("İ", "i").lower()
+
+
+CASE_VARIANTS = [
+    (document_type, variant(text))
+    for document_type, text in OCR_TEXTS
+    for variant in (str, str.upper, str.lower, _turkish_upper, _turkish_lower)
+]
+
+# Fused alternations the service only scans once one of their anchors occurs
+FUSED_ANCHORS = {
+    ocr_service._PASSPORT_LABEL_RE: ocr_service._PASSPORT_LABEL_ANCHORS,
+    ocr_service._BIRTH_PLACE_RE: ocr_service._BIRTH_PLACE_ANCHORS,
+    ocr_service._FATHER_RE: ocr_service._FATHER_ANCHORS,
+    ocr_service._MOTHER_RE: ocr_service._MOTHER_ANCHORS,
+}
+
+FUSED_FIELDS = [
+    (ocr_service._PASSPORT_LABEL_RE, ocr_service._PASSPORT_LABEL_FIELDS),
+    (ocr_service._HOTEL_RESERVATION_RE, ocr_service._HOTEL_RESERVATION_FIELDS),
+    (ocr_service._INVITATION_LETTER_RE, ocr_service._INVITATION_LETTER_FIELDS),
+    (ocr_service._PROPERTY_DEED_RE, ocr_service._PROPERTY_DEED_FIELDS),
+    (ocr_service._SOCIAL_SECURITY_RE, ocr_service._SOCIAL_SECURITY_FIELDS),
+]
+
+
+def _first_branch_match(branches, text):
+    """Return the leftmost match of the first branch that matches, which a fused alternation must reproduce"""
+    for branch in branches:
+        match = re.search(branch, text, re.IGNORECASE)
+        if match:
+            return match
+    return None
+
+
+@pytest.fixture(scope="module")
+def plain_ocr_service():
+    """A second copy of the service module built with the standard library re only"""
+    name = "app.services._ocr_service_plain"
+    spec = importlib.util.spec_from_file_location(name, ocr_service.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setitem(sys.modules, "re2", None)
+        patch.setitem(sys.modules, name, module)
+        spec.loader.exec_module(module)
+    assert module.re2 is None
+    return module
+
+
+@pytest.mark.parametrize("document_type, text", CASE_VARIANTS)
+def test_fused_alternations_match_like_their_branches(document_type, text):
+    for fused, branches in ocr_service._FUSED_BRANCHES.items():
+        match = _first_branch_match(branches, text)
+        expected = match.group(1) if match else None
+
+        assert ocr_service._search_fused(fused, text) == expected, branches
+        if fused in FUSED_ANCHORS:
+            assert ocr_service._search_fused(fused, text, FUSED_ANCHORS[fused]) == expected, branches
+
+
+@pytest.mark.parametrize("document_type, text", CASE_VARIANTS)
+def test_fused_fields_match_like_their_branches(document_type, text):
+    for fused, fields in FUSED_FIELDS:
+        branches = ocr_service._FUSED_BRANCHES[fused]
+        expected = {}
+        for field in dict.fromkeys(fields):
+            match = _first_branch_match([branch for branch, owner in zip(branches, fields) if owner == field], text)
+            if match:
+                expected[field] = match.group(1)
+
+        assert ocr_service._search_fused_fields(fused, text, fields, FUSED_ANCHORS.get(fused, ())) == expected, fields
+
+
+@pytest.mark.skipif(ocr_service.re2 is None, reason="google-re2 is not installed")
+@pytest.mark.parametrize("document_type, text", CASE_VARIANTS)
+def test_re2_prefilter_keeps_every_matching_alternation(document_type, text):
+    matchable = ocr_service._matchable_alternations(text)
+
+    for fused in ocr_service._PREFILTERED_ALTERNATIONS:
+        if _first_branch_match(ocr_service._FUSED_BRANCHES[fused], text):
+            assert fused in matchable, ocr_service._FUSED_BRANCHES[fused]
+
+
+@pytest.mark.skipif(ocr_service.re2 is None, reason="google-re2 is not installed")
+@pytest.mark.parametrize("document_type, text", CASE_VARIANTS)
+def test_re2_patterns_match_like_re(plain_ocr_service, document_type, text):
+    names = [name for name in vars(ocr_service) if name.endswith("_PATTERNS")]
+    assert names
+
+    for name in names:
+        for linear, plain in zip(getattr(ocr_service, name), getattr(plain_ocr_service, name)):
+            found = [(match.span(), match.groups()) for match in linear.finditer(text)]
+            assert found == [(match.span(), match.groups()) for match in plain.finditer(text)], plain.pattern
+
+
+@pytest.mark.skipif(ocr_service.re2 is None, reason="google-re2 is not installed")
+@pytest.mark.parametrize("document_type, text", CASE_VARIANTS)
+def test_results_do_not_depend_on_re2(service, plain_ocr_service, document_type, text):
+    plain_service = plain_ocr_service.OCRService()
+
+    result = service.process_document(document_type, text).to_dict()
+    plain_result = plain_service.process_document(document_type, text).to_dict()
+
+    assert result == plain_result
+
+
+@pytest.mark.parametrize("code", ["DEU", "deu", "Deu"])
+def test_visa_country_codes_are_found_in_any_case(service, code):
+    assert service._extract_visa_country_info(f"Schengen visa {code} 2023") == {"has_country": True, "countries": [code]}
+
+
+def test_visa_countries_ignore_other_three_letter_words(service):
+    info = service._extract_visa_country_info("the XYZ visa was valid in USA and Estonia")
+
+    assert info == {"has_country": True, "countries": ["Estonia"]}
+    assert service._extract_visa_country_info("the XYZ visa") == {"has_country": False}
+
+
+def test_supported_document_types_are_copies(service):
+    listed = service.list_supported_document_types()
+    listed[0]["requiredFor"].append("everyone")
+    listed[0]["ocrValidationRules"]["min_months"] = 0
+    listed.clear()
+
+    fresh = service.list_supported_document_types()
+
+    assert "everyone" not in fresh[0]["requiredFor"]
+    assert fresh[0]["ocrValidationRules"]["min_months"] == 3
+    assert len(fresh) == len(service.document_type_configs)
@@ -0,0 +1,86 @@
+"""
+Tests for the Schengen form filling service
+"""
+
+import asyncio
+import json
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+# The form filling service needs the Groq client and settings from the backend requirements
+pytest.importorskip("groq")
+pytest.importorskip("pydantic_settings")
+
+from app.services import schengen_form_filling_service  # noqa: E402
+from app.services.schengen_form_filling_service import SchengenFormFillingService  # noqa: E402
+
+USER_DATA = {"email": "jane@example.com", "surname": "Doe", "name": "Jane", "nationality": "Turkish"}
+APPLICATION_DATA = {"destination_country": "Germany", "purpose": "Tourism"}
+
+
+class FakeCompletions:
+    """Async completion call answering every prompt with the same filled fields"""
+    
+    def __init__(self):
+        self.prompts = []
+    
+    async def __call__(self, messages):
+        self.prompts.append(messages[-1]["content"])
+        answer = json.dumps({"field1": "DOE", "field3": "JANE"})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=answer))])
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(schengen_form_filling_service, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def service(monkeypatch, clock):
+    monkeypatch.setattr(SchengenFormFillingService, "_fill_cache", OrderedDict())
+    service = SchengenFormFillingService()
+    service._create_completion_async = FakeCompletions()
+    return service
+
+
+def fill(service, user_data, application_data=APPLICATION_DATA):
+    return asyncio.run(service.fill_schengen_form_async(user_data, application_data))
+
+
+def test_equivalent_requests_share_one_completion(service):
+    first = fill(service, USER_DATA)
+    # Same data with other spacing, key order and empty fields
+    reordered = {"nationality": " Turkish ", "name": "Jane", "surname": "Doe", "email": "jane@example.com", "address": ""}
+    second = fill(service, reordered, {"purpose": "Tourism", "destination_country": "Germany  "})
+    
+    assert first["success"] and second["success"]
+    assert first["filled_fields"] == second["filled_fields"] == {"field1": "DOE", "field3": "JANE"}
+    assert len(service._create_completion_async.prompts) == 1
+
+
+def test_different_requests_are_not_shared(service):
+    fill(service, USER_DATA)
+    fill(service, {**USER_DATA, "name": "John"})
+    
+    assert len(service._create_completion_async.prompts) == 2
+
+
+def test_cached_fields_expire(service, clock):
+    fill(service, USER_DATA)
+    clock[0] += schengen_form_filling_service._FILL_CACHE_TTL_SECONDS
+    fill(service, USER_DATA)
+    assert len(service._create_completion_async.prompts) == 1
+    
+    clock[0] += 1
+    fill(service, USER_DATA)
+    assert len(service._create_completion_async.prompts) == 2
+
+
+def test_changing_a_result_leaves_the_cache_alone(service):
+    fill(service, USER_DATA)["filled_fields"]["field1"] = "ROE"
+    
+    assert fill(service, USER_DATA)["filled_fields"]["field1"] == "DOE"
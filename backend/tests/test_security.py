@@ -0,0 +1,265 @@
+"""
+Tests for the authentication helpers
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+# The authentication helpers need the backend requirements, unlike the text-only OCR tests
+firebase_admin = pytest.importorskip("firebase_admin")
+
+import google.oauth2.id_token  # noqa: E402
+import jwt  # noqa: E402
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import rsa  # noqa: E402
+from firebase_admin import auth, credentials  # noqa: E402
+
+SERVICE_ACCOUNT_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+OTHER_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+SERVICE_ACCOUNT_EMAIL = "firebase-adminsdk@test-project.iam.gserviceaccount.com"
+SERVICE_ACCOUNT = {
+    "type": "service_account",
+    "project_id": "test-project",
+    "private_key_id": "test-key",
+    "private_key": SERVICE_ACCOUNT_KEY.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode(),
+    "client_email": SERVICE_ACCOUNT_EMAIL,
+    "client_id": "1",
+    "token_uri": "https://oauth2.googleapis.com/token",
+}
+
+# app.core.firebase reuses an initialised app instead of reading the service account key file
+if not firebase_admin._apps:
+    firebase_admin.initialize_app(credentials.Certificate(SERVICE_ACCOUNT), {
+        "storageBucket": "test-project.appspot.com",
+        "projectId": "test-project",
+    })
+
+from app.services import security  # noqa: E402
+
+
+class FakeDocument:
+    """Firestore user document whose reads can be held open by the test"""
+    
+    def __init__(self, store, uid):
+        self.store = store
+        self.uid = uid
+        self.exists = uid in store.users
+    
+    def to_dict(self):
+        return self.store.users[self.uid]
+    
+    def document(self, uid):
+        return FakeDocument(self.store, uid)
+    
+    async def get(self):
+        self.store.reads.append(self.uid)
+        await self.store.release.wait()
+        return FakeDocument(self.store, self.uid)
+
+
+class FakeFirestore:
+    def __init__(self, users):
+        self.users = users
+        self.reads = []
+        self.release = asyncio.Event()
+        self.release.set()
+    
+    def collection(self, name):
+        assert name == "users"
+        return FakeDocument(self, None)
+
+
+def user_data(uid, name):
+    return {
+        "uid": uid,
+        "email": f"{uid}@example.com",
+        "name": name,
+        "surname": "Doe",
+        "profile_type": "STUDENT",
+        "passport_type": "BORDO",
+        "created_at": datetime(2025, 1, 1),
+        "updated_at": datetime(2025, 1, 1),
+    }
+
+
+@pytest.fixture
+def firestore(monkeypatch):
+    store = FakeFirestore({"alice": user_data("alice", "Alice")})
+    monkeypatch.setattr(security, "async_db", store)
+    monkeypatch.setattr(security, "_user_cache", type(security._user_cache)())
+    monkeypatch.setattr(security, "_user_reads", {})
+    return store
+
+
+def test_users_are_read_once_until_invalidated(firestore):
+    async def scenario():
+        first = await security.get_user_from_firestore("alice")
+        second = await security.get_user_from_firestore("alice")
+        security.invalidate_user("alice")
+        third = await security.get_user_from_firestore("alice")
+        return first, second, third
+    
+    first, second, third = asyncio.run(scenario())
+    
+    assert first is second and first.name == "Alice"
+    assert third is not first
+    assert firestore.reads == ["alice", "alice"]
+
+
+def test_a_read_overtaken_by_an_invalidation_is_not_cached(firestore):
+    async def scenario():
+        firestore.release.clear()
+        pending = asyncio.create_task(security.get_user_from_firestore("alice"))
+        await asyncio.sleep(0)
+        # The user is updated while the read above still waits for Firestore
+        firestore.users["alice"] = user_data("alice", "Alicia")
+        security.invalidate_user("alice")
+        firestore.release.set()
+        stale = await pending
+        fresh = await security.get_user_from_firestore("alice")
+        return stale, fresh
+    
+    stale, fresh = asyncio.run(scenario())
+    
+    assert fresh.name == "Alicia"
+    assert firestore.reads == ["alice", "alice"]
+    assert security._user_reads == {}
+
+
+class FakeCertsRequest:
+    """Transport serving the public key of the test service account as its signing certificate"""
+    
+    def __init__(self):
+        self.urls = []
+    
+    def __call__(self, url, method="GET", **kwargs):
+        self.urls.append(url)
+        public_key = SERVICE_ACCOUNT_KEY.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        return SimpleNamespace(status=200, data=json.dumps({"test-key": public_key.decode()}).encode())
+
+
+@pytest.fixture
+def certs(monkeypatch):
+    request = FakeCertsRequest()
+    monkeypatch.setattr(security, "_certs_request", lambda: request)
+    monkeypatch.setattr(security, "_token_cache", OrderedDict())
+    return request
+
+
+def forged_custom_token(uid, **claims):
+    now = int(time.time())
+    payload = {
+        "iss": SERVICE_ACCOUNT_EMAIL,
+        "sub": SERVICE_ACCOUNT_EMAIL,
+        "aud": security._CUSTOM_TOKEN_AUDIENCE,
+        "uid": uid,
+        "iat": now,
+        "exp": now + 3600,
+        **claims,
+    }
+    return jwt.encode(payload, OTHER_KEY, algorithm="RS256", headers={"kid": "test-key"})
+
+
+def test_custom_tokens_signed_by_the_service_account_are_accepted(certs):
+    token = auth.create_custom_token("alice").decode()
+    
+    decoded = asyncio.run(security.verify_firebase_token(token))
+    
+    assert decoded["uid"] == "alice"
+    assert decoded["iss"] == SERVICE_ACCOUNT_EMAIL
+    assert certs.urls == [f"https://www.googleapis.com/robot/v1/metadata/x509/{SERVICE_ACCOUNT_EMAIL}"]
+
+
+def test_custom_tokens_with_another_signature_are_rejected(certs):
+    assert asyncio.run(security.verify_firebase_token(forged_custom_token("mallory"))) is None
+
+
+def test_custom_tokens_for_another_audience_are_rejected(certs):
+    token = jwt.encode(
+        {**jwt.decode(auth.create_custom_token("alice"), options={"verify_signature": False}), "aud": "someone-else"},
+        SERVICE_ACCOUNT_KEY,
+        algorithm="RS256",
+        headers={"kid": "test-key"},
+    )
+    
+    assert asyncio.run(security.verify_firebase_token(token)) is None
+
+
+def test_custom_tokens_are_verified_on_every_request(certs):
+    token = auth.create_custom_token("alice").decode()
+    
+    asyncio.run(security.verify_firebase_token(token))
+    asyncio.run(security.verify_firebase_token(token))
+    
+    assert len(certs.urls) == 2
+    assert not security._token_cache
+
+
+@pytest.fixture
+def id_token_certs(monkeypatch):
+    """Stand in the test service account key for Google's ID token signing keys"""
+    urls = []
+    
+    def fetch_certs(request, url):
+        urls.append(url)
+        public_key = SERVICE_ACCOUNT_KEY.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        return {"test-key": public_key.decode()}
+    
+    monkeypatch.setattr(google.oauth2.id_token, "_fetch_certs", fetch_certs)
+    monkeypatch.setattr(security, "_token_cache", OrderedDict())
+    return urls
+
+
+def id_token(uid, key=SERVICE_ACCOUNT_KEY, lifetime=3600):
+    now = int(time.time())
+    payload = {
+        "iss": "https://securetoken.google.com/test-project",
+        "aud": "test-project",
+        "sub": uid,
+        "auth_time": now,
+        "iat": now,
+        "exp": now + lifetime,
+    }
+    return jwt.encode(payload, key, algorithm="RS256", headers={"kid": "test-key"})
+
+
+def test_id_tokens_with_an_invalid_signature_are_rejected_and_not_cached(id_token_certs):
+    token = id_token("mallory", key=OTHER_KEY)
+    
+    assert asyncio.run(security.verify_firebase_token(token)) is None
+    assert asyncio.run(security.verify_firebase_token(token)) is None
+    
+    assert len(id_token_certs) == 2
+    assert not security._token_cache
+
+
+def test_verified_id_tokens_are_cached_until_shortly_before_they_expire(id_token_certs, monkeypatch):
+    token = id_token("alice")
+    
+    first = asyncio.run(security.verify_firebase_token(token))
+    second = asyncio.run(security.verify_firebase_token(token))
+    assert first["uid"] == "alice" and second is first
+    assert len(id_token_certs) == 1
+    
+    expires_at = first["exp"] - security._TOKEN_EXPIRY_MARGIN_SECONDS
+    monkeypatch.setattr(security.time, "time", lambda: expires_at + 1)
+    third = asyncio.run(security.verify_firebase_token(token))
+    
+    assert third["uid"] == "alice" and third is not first
+    assert len(id_token_certs) == 2
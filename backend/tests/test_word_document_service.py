@@ -0,0 +1,99 @@
+"""
+Tests for the Word document editing service
+"""
+
+import pytest
+
+# The Word service needs python-docx from the backend requirements
+docx = pytest.importorskip("docx")
+
+from docx.oxml import OxmlElement  # noqa: E402
+
+from app.services.word_document_service import WordDocumentService  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def service():
+    return WordDocumentService()
+
+
+def add_content_control(document, text):
+    """Append a block content control holding one paragraph of text to the document body"""
+    paragraph = document.add_paragraph(text)
+    control = OxmlElement("w:sdt")
+    content = OxmlElement("w:sdtContent")
+    paragraph._element.addprevious(control)
+    control.append(content)
+    content.append(paragraph._element)
+    return paragraph
+
+
+def test_body_and_table_cell_paragraphs_are_filled(service):
+    document = docx.Document()
+    body = document.add_paragraph("Surname: FIELD1")
+    cell = document.add_table(rows=1, cols=1).cell(0, 0)
+    cell.text = "First names: FIELD3"
+    control = add_content_control(document, "Controlled: FIELD1")
+    nested = cell.add_table(rows=1, cols=1).cell(0, 0)
+    nested.text = "Nested: FIELD3"
+    
+    service._process_body(document, {"FIELD1": "DOE", "FIELD3": "John"})
+    
+    assert body.text == "Surname: DOE"
+    assert cell.paragraphs[0].text == "First names: John"
+    assert control.text == "Controlled: FIELD1"
+    assert nested.paragraphs[0].text == "Nested: FIELD3"
+
+
+def paragraph_with_runs(document, *texts, bold=()):
+    paragraph = document.add_paragraph()
+    for index, text in enumerate(texts):
+        paragraph.add_run(text).bold = index in bold or None
+    return paragraph
+
+
+def test_a_placeholder_split_across_runs_is_filled(service):
+    document = docx.Document()
+    paragraph = paragraph_with_runs(document, "Surname: FIE", "LD", "1.")
+    
+    service._process_body(document, {"FIELD1": "DOE"})
+    
+    assert [run.text for run in paragraph.runs] == ["Surname: DOE."]
+
+
+def test_runs_with_other_formatting_are_kept_apart(service):
+    document = docx.Document()
+    paragraph = paragraph_with_runs(document, "Name: ", "FIELD3", " end", bold=(1,))
+    
+    service._process_body(document, {"FIELD3": "John"})
+    
+    assert [(run.text, run.bold) for run in paragraph.runs] == [("Name: ", None), ("John", True), (" end", None)]
+
+
+def test_spelling_markers_do_not_split_a_placeholder(service):
+    document = docx.Document()
+    paragraph = paragraph_with_runs(document, "FIEL", "D1")
+    paragraph.runs[1]._element.addprevious(OxmlElement("w:proofErr"))
+    
+    service._process_body(document, {"FIELD1": "DOE"})
+    
+    assert paragraph.text == "DOE"
+
+
+def test_a_field_leaves_longer_field_keys_alone(service):
+    document = docx.Document()
+    paragraph = document.add_paragraph("FIELD2 / FIELD20 / FIELD2")
+    
+    service._process_body(document, {"FIELD2": "SMITH"})
+    
+    assert paragraph.text == "SMITH / FIELD20 / SMITH"
+
+
+def test_every_field_is_filled_in_one_pass(service):
+    document = docx.Document()
+    paragraph = document.add_paragraph("FIELD1 FIELD10 FIELD11")
+    
+    service._process_body(document, {"FIELD1": "FIELD11", "FIELD10": "B", "FIELD11": "C"})
+    
+    # A value that looks like a key is not replaced again
+    assert paragraph.text == "FIELD11 B C"